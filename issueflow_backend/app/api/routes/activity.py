@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import List
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.deps import get_current_user
+from app.db.session import get_async_db
+from app.models.activity import ActivityEvent, ActivityType
+from app.models.user import User
+from app.schemas.activity import ActivityEventResponse
+from app.services.activity_service import list_activity_page
+
+router = APIRouter(tags=["Activity"])
+
+
+def _opt(value):
+    return str(value) if value is not None else None
+
+
+def to_activity_event(e: ActivityEvent) -> ActivityEventResponse:
+    return ActivityEventResponse(
+        id=str(e.id),
+        type=e.type.value,
+        project_id=str(e.project_id),
+        actor_id=_opt(e.actor_id),
+        actor_username=e.actor_username,
+        issue_id=_opt(e.issue_id),
+        issue_key=e.issue_key,
+        issue_title=e.issue_title,
+        comment_id=_opt(e.comment_id),
+        body=e.body,
+        data=e.data,
+        created_at=e.created_at,
+    )
+
+
+@router.get("/activity", response_model=list[ActivityEventResponse])
+async def get_activity(
+    response: Response,
+    limit: int = Query(default=settings.activity_page_size, ge=1, le=settings.activity_page_max),
+    cursor: str | None = Query(default=None),
+    type: List[ActivityType] | None = Query(default=None),
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    The current user's activity feed across all their projects, newest first.
+    ?type= (repeatable) keeps only those event types.
+    The cursor for the next older page is returned in the X-Next-Cursor header.
+    """
+    try:
+        rows, next_cursor = await list_activity_page(db, user, limit=limit, cursor=cursor, types=type)
+        if next_cursor:
+            response.headers["X-Next-Cursor"] = next_cursor
+        return [to_activity_event(e) for e in rows]
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+from datetime import date
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.deps import get_current_user
+from app.db.session import get_async_db, get_db
+from app.models.user import User
+from app.schemas.analytics import (
+    BurndownPoint,
+    BurndownResponse,
+    CumulativeFlowPoint,
+    CumulativeFlowResponse,
+    CycleTimeResponse,
+)
+from app.services.daily_stats_service import daily_series
+from app.services.issue_analytics_service import cycle_time_report
+
+router = APIRouter(prefix="/projects/{project_id}/analytics", tags=["Analytics"])
+
+
+@router.get("/cycle-time", response_model=CycleTimeResponse)
+def get_cycle_time(
+    project_id: UUID,
+    since: date | None = None,
+    until: date | None = None,
+    bucket: str = Query(default="week", pattern="^(day|week)$"),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Cycle time (in progress -> done), lead time (created -> done) percentiles
+    in hours, and throughput per day/week, for issues completed between
+    since and until (inclusive days; default: the last 90 days).
+    """
+    try:
+        report = cycle_time_report(db, project_id, user, since=since, until=until, bucket=bucket)
+        return CycleTimeResponse(**{**report, "project_id": str(report["project_id"])})
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+# Burndown / cumulative flow: served from the daily rollup (project_daily_stats),
+# never from the issue table; today's point lags by up to one rollup pass.
+@router.get("/burndown", response_model=BurndownResponse)
+async def get_burndown(
+    project_id: UUID,
+    since: date | None = None,
+    until: date | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user),
+):
+    try:
+        data = await daily_series(db, project_id, user, since=since, until=until)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return BurndownResponse(
+        project_id=str(data["project_id"]),
+        since=data["since"],
+        until=data["until"],
+        series=[
+            BurndownPoint(
+                day=p["day"],
+                remaining=p["todo"] + p["in_progress"],
+                completed=p["done"],
+                scope=p["todo"] + p["in_progress"] + p["done"],
+                created=p["created"],
+                resolved=p["resolved"],
+            )
+            for p in data["points"]
+        ],
+    )
+
+
+@router.get("/cumulative-flow", response_model=CumulativeFlowResponse)
+async def get_cumulative_flow(
+    project_id: UUID,
+    since: date | None = None,
+    until: date | None = None,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user),
+):
+    try:
+        data = await daily_series(db, project_id, user, since=since, until=until)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return CumulativeFlowResponse(
+        project_id=str(data["project_id"]),
+        since=data["since"],
+        until=data["until"],
+        series=[
+            CumulativeFlowPoint(day=p["day"], todo=p["todo"], in_progress=p["in_progress"], done=p["done"])
+            for p in data["points"]
+        ],
+    )
@@ -1,7 +1,10 @@
 from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
-from app.db.session import get_db
+from app.core.config import settings
+from app.core.security import PasswordHashBusy
+from app.db.session import get_async_db, get_db
 from app.schemas.auth import (
     RegisterRequest,
     LoginRequest,
@@ -14,9 +17,11 @@ from app.services.auth_service import (
     register_user,
     login_user,
     issue_tokens,
+    issue_tokens_async,
     refresh_access_token,
     revoke_refresh_token,
 )
+from app.core import auth_cache
 from app.core.deps import get_current_user
 from app.models.user import User
 from app.services.firebase_service import verify_firebase_id_token
@@ -43,22 +48,35 @@ def _unique_username(db: Session, base: str) -> str:
     return candidate
 
 
+def _hash_busy() -> HTTPException:
+    # bcrypt pool saturated: shed load instead of queueing
+    return HTTPException(
+        status_code=429,
+        detail="Too many sign-in attempts right now, please retry",
+        headers={"Retry-After": str(settings.password_hash_retry_after_seconds)},
+    )
+
+
 @router.post("/register", response_model=TokenResponse)
-def register(payload: RegisterRequest, db: Session = Depends(get_db)):
+async def register(payload: RegisterRequest, db: AsyncSession = Depends(get_async_db)):
     try:
-        user = register_user(db, payload.email, payload.password, payload.username)
-        tokens = issue_tokens(db, user)
+        user = await register_user(db, payload.email, payload.password, payload.username)
+        tokens = await issue_tokens_async(db, user)
         return TokenResponse(**tokens)
+    except PasswordHashBusy:
+        raise _hash_busy()
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(payload: LoginRequest, db: Session = Depends(get_db)):
+async def login(payload: LoginRequest, db: AsyncSession = Depends(get_async_db)):
     try:
-        user = login_user(db, payload.email, payload.password)
-        tokens = issue_tokens(db, user)
+        user = await login_user(db, payload.email, payload.password)
+        tokens = await issue_tokens_async(db, user)
         return TokenResponse(**tokens)
+    except PasswordHashBusy:
+        raise _hash_busy()
     except ValueError:
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
@@ -114,6 +132,7 @@ def firebase_login(payload: FirebaseLoginRequest, db: Session = Depends(get_db))
                 db.add(user)
                 db.commit()
                 db.refresh(user)
+                auth_cache.invalidate_user(user.id)
 
         tokens = issue_tokens(db, user)
         return TokenResponse(**tokens)
@@ -1,15 +1,17 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from sqlmodel.ext.asyncio.session import AsyncSession
 from uuid import UUID
 
+from app.core.config import settings
 from app.core.deps import get_current_user
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.models.user import User
 from app.schemas.comment import CommentCreateRequest, CommentUpdateRequest, CommentResponse
 from app.services.comment_service import (
     list_comments,
+    list_comments_page,
     create_comment,
     edit_comment,
     delete_comment,
@@ -45,11 +47,32 @@ def _comment_event_dict(c) -> dict:
 async def get_issue_comments(
     project_id: UUID,
     issue_id: UUID,
-    db: Session = Depends(get_db),
+    response: Response,
+    limit: int | None = Query(default=None, ge=1, le=settings.comments_page_max),
+    cursor: str | None = Query(default=None),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user),
 ):
+    """
+    - no limit/cursor -> every comment (old behaviour, kept for existing clients)
+    - ?limit=N        -> latest N comments
+    - ?cursor=...     -> the page older than that cursor
+    The cursor for the next older page is returned in the X-Next-Cursor header.
+    """
     try:
-        rows = list_comments(db=db, project_id=project_id, issue_id=issue_id, user=user)
+        if limit is None and cursor is None:
+            rows = await list_comments(db=db, project_id=project_id, issue_id=issue_id, user=user)
+        else:
+            rows, next_cursor = await list_comments_page(
+                db=db,
+                project_id=project_id,
+                issue_id=issue_id,
+                user=user,
+                limit=limit or settings.comments_page_size,
+                cursor=cursor,
+            )
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
         return [
             CommentResponse(
                 id=str(c.id),
@@ -76,11 +99,11 @@ async def post_issue_comment(
     project_id: UUID,
     issue_id: UUID,
     payload: CommentCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user),
 ):
     try:
-        c = create_comment(db=db, project_id=project_id, issue_id=issue_id, user=user, body=payload.body)
+        c = await create_comment(db=db, project_id=project_id, issue_id=issue_id, user=user, body=payload.body)
 
         # ✅ Publish to Redis (so ALL instances rebroadcast to their WS clients)
         # ✅ Never fail HTTP if Redis publish fails
@@ -120,11 +143,11 @@ async def patch_issue_comment(
     issue_id: UUID,
     comment_id: UUID,
     payload: CommentUpdateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user),
 ):
     try:
-        c = edit_comment(
+        c = await edit_comment(
             db=db,
             project_id=project_id,
             issue_id=issue_id,
@@ -166,11 +189,11 @@ async def delete_issue_comment(
     project_id: UUID,
     issue_id: UUID,
     comment_id: UUID,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
     user: User = Depends(get_current_user),
 ):
     try:
-        delete_comment(
+        await delete_comment(
             db=db,
             project_id=project_id,
             issue_id=issue_id,
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from uuid import UUID
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from sqlmodel import Session
 
-from app.db.session import engine
+from app.core.config import settings
+
+from app.db.session import AsyncSessionLocal
 from app.core.ws_auth import get_current_user_ws
-from app.services.comment_service import list_comments
+from app.core.redis_streams import latest_event_id, read_comment_events_since
+from app.core.redis_pubsub import PROJECT_ROOM
+from app.services.comment_service import ensure_issue_access, ensure_project_access, list_comments_page
 from app.websockets.comments_hub import manager
 
 router = APIRouter(tags=["Comments WS"])
@@ -28,86 +31,320 @@ def _comment_to_dict(c) -> dict:
     }
 
 
+def _resumed_cursor(missed: list[dict], since: str) -> str:
+    # newest event the replay covers
+    return (missed[-1].get("event_id") or since) if missed else since
+
+
+async def _initial_frames(
+    db, project_id: UUID, issue_id: UUID, user, since: str | None
+) -> tuple[list[dict], str | None]:
+    """
+    Frames a (re)connecting client needs before live events:
+    - ?since=<event_id> still in the Redis Stream -> only the missed events
+    - otherwise (first connect, cursor trimmed, Redis down) -> snapshot of the
+      latest page; older comments come from GET ...?cursor=<next_cursor>
+    Also returns the event_id those frames cover up to (None: unknown),
+    for manager.release(). Raises ValueError if the user can't see this issue.
+    """
+    p, i = str(project_id), str(issue_id)
+
+    if since:
+        await ensure_issue_access(db, project_id, issue_id, user)
+        try:
+            missed = await read_comment_events_since(p, i, since)
+        except Exception:
+            missed = None
+
+        if missed is not None:
+            return [
+                {"type": "resumed", "project_id": p, "issue_id": i, "since": since, "count": len(missed)},
+                *missed,
+            ], _resumed_cursor(missed, since)
+
+    # Read the cursor BEFORE loading rows: events after it may be repeated
+    # (clients ignore event_id <= last seen) but never missed.
+    try:
+        cursor = await latest_event_id(p, i)
+    except Exception:
+        cursor = None
+
+    # Validates permissions + issue exists (reuses the existing checks)
+    existing, next_cursor = await list_comments_page(
+        db=db,
+        project_id=project_id,
+        issue_id=issue_id,
+        user=user,
+        limit=settings.ws_snapshot_limit,
+    )
+    return [
+        {
+            "type": "snapshot",
+            "project_id": p,
+            "issue_id": i,
+            "comments": [_comment_to_dict(c) for c in existing],
+            "last_event_id": cursor,
+            "has_more": next_cursor is not None,
+            "next_cursor": next_cursor,
+        }
+    ], cursor
+
+
+async def _project_initial_frames(db, project_id: UUID, user, since: str | None) -> tuple[list[dict], str | None]:
+    """
+    Project room (project-wide events like bulk issue updates): no snapshot,
+    the client reloads issues over HTTP; ?since= replays missed events.
+    """
+    await ensure_project_access(db, project_id, user)
+    p = str(project_id)
+
+    if since:
+        try:
+            missed = await read_comment_events_since(p, PROJECT_ROOM, since)
+        except Exception:
+            missed = None
+
+        if missed is not None:
+            return [
+                {"type": "resumed", "project_id": p, "issue_id": None, "since": since, "count": len(missed)},
+                *missed,
+            ], _resumed_cursor(missed, since)
+
+    try:
+        cursor = await latest_event_id(p, PROJECT_ROOM)
+    except Exception:
+        cursor = None
+
+    return [{"type": "subscribed", "project_id": p, "issue_id": None, "last_event_id": cursor}], cursor
+
+
 @router.websocket("/ws/projects/{project_id}/issues/{issue_id}/comments")
 async def ws_issue_comments(websocket: WebSocket, project_id: UUID, issue_id: UUID):
     # A room is the group of all clients watching this same issue
     room = (str(project_id), str(issue_id))
 
-    # WebSocket endpoints don't use Depends(get_db) the same way,
-    # so we manually create a DB session.
-    with Session(engine) as db:
-        try:
+    try:
+        # WebSocket endpoints don't use Depends(get_async_db) the same way,
+        # so we manually create a DB session.
+        # Keep it ONLY for auth + snapshot: leaving the block returns the
+        # pooled connection, so open sockets never pin DB connections.
+        async with AsyncSessionLocal() as db:
             # 1) Authenticate user from ?token=ACCESS_JWT
-            user = get_current_user_ws(websocket, db)
+            user = await get_current_user_ws(websocket, db)
+
+        # 2) Accept and register socket into the room BEFORE reading the
+        #    initial state, holding its live events: one published while the
+        #    snapshot/replay is read is buffered instead of missed.
+        await manager.connect(room, websocket, hold=True)
+
+        # 3) Validate permissions, then build the initial state:
+        #    replay after ?since=<event_id> if possible, else a snapshot
+        async with AsyncSessionLocal() as db:
+            frames, cursor = await _initial_frames(
+                db, project_id, issue_id, user, websocket.query_params.get("since")
+            )
 
-            # 2) Validate permissions + issue exists by calling list_comments()
-            #    (this reuses your existing permission checks)
-            existing = list_comments(db=db, project_id=project_id, issue_id=issue_id, user=user)
+        # 4) Send initial snapshot / missed events, then the held events
+        #    newer than what they cover. All writes go through the manager's
+        #    per-socket queue, so the snapshot, pongs and broadcasts never
+        #    interleave on the wire.
+        await manager.release(room, websocket, frames, cursor)
 
-            # 3) Accept and register socket into the room
-            await manager.connect(room, websocket)
+        # 5) Keep the connection alive.
+        #    IMPORTANT: WS is "read-only" in this architecture.
+        #    All create/edit/delete happens via HTTP and HTTP broadcasts updates.
+        while True:
+            data = await websocket.receive_json()
+            msg_type = (data.get("type") or "").strip()
 
-            # 4) Send initial snapshot (optional but very useful for UI)
-            #    If you prefer "events-only", you can remove this snapshot block.
-            await websocket.send_json(
+            # keep-alive
+            if msg_type == "ping":
+                await manager.send(websocket, {"type": "pong"})
+                continue
+
+            # reject any attempts to write via WS (enforces your scalable pattern)
+            await manager.send(
+                websocket,
                 {
-                    "type": "snapshot",
-                    "project_id": str(project_id),
-                    "issue_id": str(issue_id),
-                    "comments": [_comment_to_dict(c) for c in existing],
-                }
+                    "type": "error",
+                    "message": "WebSocket is read-only. Use HTTP for create/edit/delete.",
+                },
             )
 
-            # 5) Keep the connection alive.
-            #    IMPORTANT: WS is "read-only" in this architecture.
-            #    All create/edit/delete happens via HTTP and HTTP broadcasts updates.
-            while True:
-                data = await websocket.receive_json()
-                msg_type = (data.get("type") or "").strip()
+    except WebSocketDisconnect:
+        # Client closed connection
+        await manager.disconnect(room, websocket)
+        return
 
-                # keep-alive
-                if msg_type == "ping":
-                    await websocket.send_json({"type": "pong"})
-                    continue
+    except ValueError as e:
+        # Auth/access/validation error
+        # We may not have accepted yet (auth), so accept safely to send the error.
+        await manager.disconnect(room, websocket)
+        try:
+            await websocket.accept()
+        except Exception:
+            pass  # already accepted (access check)
+        try:
+            await websocket.send_json({"type": "error", "message": str(e)})
+        except Exception:
+            pass
+
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+        return
+
+    except Exception:
+        # Unexpected server error (don't leak details)
+        try:
+            await websocket.send_json({"type": "error", "message": "Server error"})
+        except Exception:
+            pass
 
-                # reject any attempts to write via WS (enforces your scalable pattern)
-                await websocket.send_json(
+        await manager.disconnect(room, websocket)
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+        return
+
+
+def _room_from_frame(data: dict) -> tuple[UUID, UUID | None]:
+    # no issue_id -> the project room
+    issue_id = data.get("issue_id")
+    try:
+        return (
+            UUID(str(data.get("project_id"))),
+            UUID(str(issue_id)) if issue_id else None,
+        )
+    except ValueError:
+        raise ValueError("Invalid project_id / issue_id")
+
+
+@router.websocket("/ws/comments")
+async def ws_comments_multiplexed(websocket: WebSocket):
+    """
+    ONE authenticated socket per client, carrying many issue rooms.
+
+    Client -> server:
+      {"type": "subscribe",   "project_id": "...", "issue_id": "...", "since": "<event_id>"?}
+      {"type": "unsubscribe", "project_id": "...", "issue_id": "..."}
+      {"type": "ping"}
+    Leaving out issue_id (un)subscribes the project room instead
+    (project-wide events such as "issues_bulk_updated").
+
+    Server -> client: the same frames as the per-issue endpoint
+    (snapshot / resumed / comment_* events, all carrying project_id + issue_id),
+    plus {"type": "unsubscribed", ...} and room-scoped {"type": "error", ...}.
+    """
+    try:
+        # Authenticate ONCE for the whole connection (brief DB session)
+        async with AsyncSessionLocal() as db:
+            user = await get_current_user_ws(websocket, db)
+
+        await manager.accept(websocket)
+
+    except ValueError as e:
+        try:
+            await websocket.accept()
+            await websocket.send_json({"type": "error", "message": str(e)})
+        except Exception:
+            pass
+
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+        return
+
+    try:
+        while True:
+            data = await websocket.receive_json()
+            msg_type = (data.get("type") or "").strip()
+
+            # keep-alive
+            if msg_type == "ping":
+                await manager.send(websocket, {"type": "pong"})
+                continue
+
+            if msg_type not in ("subscribe", "unsubscribe"):
+                await manager.send(
+                    websocket,
                     {
                         "type": "error",
-                        "message": "WebSocket is read-only. Use HTTP for create/edit/delete.",
-                    }
+                        "message": "Unknown message type. Use subscribe / unsubscribe / ping.",
+                    },
                 )
+                continue
 
-        except WebSocketDisconnect:
-            # Client closed connection
-            await manager.disconnect(room, websocket)
-            return
-
-        except ValueError as e:
-            # Auth/access/validation error
-            # We may not have accepted yet, so accept safely to send the error.
+            joined = None
             try:
-                await websocket.accept()
-                await websocket.send_json({"type": "error", "message": str(e)})
-            except Exception:
-                pass
+                project_id, issue_id = _room_from_frame(data)
+                room = (str(project_id), str(issue_id) if issue_id else PROJECT_ROOM)
 
-            try:
-                await websocket.close()
-            except Exception:
-                pass
-            return
+                if msg_type == "unsubscribe":
+                    await manager.leave(room, websocket)
+                    await manager.send(
+                        websocket,
+                        {
+                            "type": "unsubscribed",
+                            "project_id": room[0],
+                            "issue_id": str(issue_id) if issue_id else None,
+                        },
+                    )
+                    continue
+
+                # the cap is on rooms: re-subscribing (e.g. ?since= resync) is always fine
+                if (
+                    not manager.in_room(room, websocket)
+                    and manager.room_count(websocket) >= settings.ws_max_rooms_per_connection
+                ):
+                    raise ValueError("Too many subscriptions on this connection")
+
+                # Join (holding live events) BEFORE the snapshot / replay is
+                # read, so nothing published in between is missed
+                await manager.join(room, websocket, hold=True)
+                joined = room
 
+                # Access check + snapshot / replay: brief DB session per subscribe
+                async with AsyncSessionLocal() as db:
+                    if issue_id is None:
+                        frames, cursor = await _project_initial_frames(db, project_id, user, data.get("since"))
+                    else:
+                        frames, cursor = await _initial_frames(db, project_id, issue_id, user, data.get("since"))
+
+                await manager.release(room, websocket, frames, cursor)
+
+            except ValueError as e:
+                if joined is not None:
+                    await manager.leave(joined, websocket)  # no access: drop the held events too
+                # Room-level error: the connection (and other rooms) stay open
+                await manager.send(
+                    websocket,
+                    {
+                        "type": "error",
+                        "message": str(e),
+                        "project_id": data.get("project_id"),
+                        "issue_id": data.get("issue_id"),
+                    },
+                )
+
+    except WebSocketDisconnect:
+        # Client closed connection
+        await manager.disconnect_all(websocket)
+        return
+
+    except Exception:
+        # Unexpected server error (don't leak details)
+        try:
+            await websocket.send_json({"type": "error", "message": "Server error"})
         except Exception:
-            # Unexpected server error (don't leak details)
-            try:
-                await websocket.send_json({"type": "error", "message": "Server error"})
-            except Exception:
-                pass
+            pass
 
-            await manager.disconnect(room, websocket)
-            try:
-                await websocket.close()
-            except Exception:
-                pass
-            return
+        await manager.disconnect_all(websocket)
+        try:
+            await websocket.close()
+        except Exception:
+            pass
+        return
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlmodel import Session
+from fastapi.responses import Response
 from uuid import UUID
 
+from app.core import dashboard_cache
 from app.core.deps import get_current_user
-from app.db.session import get_db
 from app.models.user import User
 from app.schemas.dashboard import (
     DashboardHomeResponse,
@@ -14,74 +14,95 @@ from app.schemas.dashboard import (
     IssueCard,
     ActivityItem,
 )
-from app.services.dashboard_service import dashboard_home, dashboard_project
+from app.services.dashboard_service import (
+    accessible_project_ids,
+    dashboard_home,
+    dashboard_project,
+    ensure_dashboard_access,
+)
 
 router = APIRouter(prefix="/dashboard", tags=["Dashboard"])
 
 
-@router.get("/home", response_model=DashboardHomeResponse)
-def home(db: Session = Depends(get_db), user: User = Depends(get_current_user)):
-    data = dashboard_home(db, user)
-
-    def to_issue_card(i) -> IssueCard:
-        return IssueCard(
-            id=str(i.id),
-            key=i.key,
-            title=i.title,
-            status=i.status,
-            priority=i.priority,
-            due_date=i.due_date,
-            project_id=str(i.project_id),
-        )
-
-    def to_activity(row) -> ActivityItem:
-        c, i = row 
-        return ActivityItem(
-            project_id=str(c.project_id),
-            issue_id=str(c.issue_id),
-            issue_key=i.key,
-            issue_title=i.title,
-            author_username=c.author_username,
-            body=c.body,
-            created_at=c.created_at,
-        )
-
-
-    return DashboardHomeResponse(
-        summary=DashboardSummary(
-            projects_count=data["projects_count"],
-            issues_count=data["issues_count"],
-            by_status=data["by_status"],
-            by_priority=data["by_priority"],
-        ),
-        my_assigned=[to_issue_card(i) for i in data["my_assigned"]],
-        due_soon=[to_issue_card(i) for i in data["due_soon"]],
-        overdue=[to_issue_card(i) for i in data["overdue"]],
-        recent_activity=[to_activity(c) for c in data["recent_activity"]],
+def to_issue_card(i) -> IssueCard:
+    return IssueCard(
+        id=str(i.id),
+        key=i.key,
+        title=i.title,
+        status=i.status,
+        priority=i.priority,
+        due_date=i.due_date,
+        project_id=str(i.project_id),
+    )
+
+
+def feed_to_activity(e) -> ActivityItem:
+    # comment_created feed row (home dashboard)
+    return ActivityItem(
+        project_id=str(e.project_id),
+        issue_id=str(e.issue_id),
+        issue_key=e.issue_key,
+        issue_title=e.issue_title,
+        author_username=e.actor_username,
+        body=e.body,
+        created_at=e.created_at,
+    )
+
+
+def to_activity(row) -> ActivityItem:
+    c, i = row
+    return ActivityItem(
+        project_id=str(c.project_id),
+        issue_id=str(c.issue_id),
+        issue_key=i.key,
+        issue_title=i.title,
+        author_username=c.author_username,
+        body=c.body,
+        created_at=c.created_at,
     )
 
 
+# Bodies are served from the Redis cache (app/core/dashboard_cache.py) as
+# already-serialized JSON; they are only computed when a write bumped a version.
+@router.get("/home", response_model=DashboardHomeResponse)
+async def home(user: User = Depends(get_current_user)):
+    async def key() -> str:
+        return await dashboard_cache.home_key(user.id, await accessible_project_ids(user.id))
+
+    async def compute() -> str:
+        data = await dashboard_home(user)
+        return DashboardHomeResponse(
+            summary=DashboardSummary(
+                projects_count=data["projects_count"],
+                issues_count=data["issues_count"],
+                by_status=data["by_status"],
+                by_priority=data["by_priority"],
+            ),
+            my_assigned=[to_issue_card(i) for i in data["my_assigned"]],
+            due_soon=[to_issue_card(i) for i in data["due_soon"]],
+            overdue=[to_issue_card(i) for i in data["overdue"]],
+            recent_activity=[feed_to_activity(e) for e in data["recent_activity"]],
+        ).model_dump_json()
+
+    body = await dashboard_cache.get_or_compute(key, compute)
+    return Response(content=body, media_type="application/json")
+
+
 @router.get("/projects/{project_id}", response_model=DashboardProjectResponse)
-def project_view(
+async def project_view(
     project_id: UUID,
-    db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
     try:
-        data = dashboard_project(db, user, project_id)
-
-        def to_activity(row) -> ActivityItem:
-            c, i = row
-            return ActivityItem(
-                project_id=str(c.project_id),
-                issue_id=str(c.issue_id),
-                issue_key=i.key,
-                issue_title=i.title,
-                author_username=c.author_username,
-                body=c.body,
-                created_at=c.created_at,
-            )
+        await ensure_dashboard_access(user, project_id)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def key() -> str:
+        return await dashboard_cache.project_key(project_id)
 
+    async def compute() -> str:
+        data = await dashboard_project(project_id)
         return DashboardProjectResponse(
             project_id=str(data["project_id"]),
             summary=DashboardSummary(
@@ -91,6 +112,7 @@ def project_view(
                 by_priority=data["by_priority"],
             ),
             recent_activity=[to_activity(c) for c in data["recent_activity"]],
-        )
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
+        ).model_dump_json()
+
+    body = await dashboard_cache.get_or_compute(key, compute)
+    return Response(content=body, media_type="application/json")
@@ -1,21 +1,38 @@
 from __future__ import annotations
 # from select import select
 from sqlmodel import select
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import date
+from uuid import UUID
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core.config import settings
 from app.core.deps import get_current_user
-from app.db.session import get_db
+from app.db.session import get_async_db, get_db
 from app.models.user import User
-from app.schemas.issue import IssueCreateRequest, IssueEditResponse, IssueResponse, IssueUpdateRequest, UserMini
-from app.services.issue_service import create_issue, delete_issue_service, delete_issue_service, list_issues, update_issue
+from app.schemas.issue import (
+    IssueBulkUpdateRequest,
+    IssueBulkUpdateResponse,
+    IssueCreateRequest,
+    IssueEditResponse,
+    IssueImportResponse,
+    IssueResponse,
+    IssueUpdateRequest,
+    UserMini,
+)
+from app.services.issue_bulk_service import bulk_update_issues
+from app.services.issue_import_service import import_issues, iter_csv_rows, iter_ndjson_rows
+from app.models.issue import IssuePriority, IssueStatus, IssueType
+from app.services.issue_service import create_issue, delete_issue_service, list_issues, list_issues_page, update_issue
+from app.websockets.comments_hub import publish_and_broadcast
 
 router = APIRouter(prefix="/projects/{project_id}/issues", tags=["Issues"])
 
 
 @router.post("", response_model=IssueResponse)
 def create_in_project(
-    project_id: str,
+    project_id: UUID,
     payload: IssueCreateRequest,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
@@ -46,14 +63,130 @@ def create_in_project(
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@router.post("/import", response_model=IssueImportResponse)
+async def import_in_project(
+    project_id: UUID,
+    request: Request,
+    format: str | None = Query(default=None, description="csv | ndjson (default: from Content-Type)"),
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Bulk import issues from a streamed body:
+    - CSV with a header row: title,description,type,priority,due_date
+    - NDJSON: one IssueCreateRequest JSON object per line
+    Invalid rows are skipped and reported; valid ones are created.
+    """
+    fmt = (format or "").strip().lower()
+    if not fmt:
+        content_type = request.headers.get("content-type", "")
+        fmt = "csv" if "csv" in content_type else "ndjson"
+
+    if fmt == "csv":
+        rows = iter_csv_rows(request.stream())
+    elif fmt in ("ndjson", "jsonl"):
+        rows = iter_ndjson_rows(request.stream())
+    else:
+        raise HTTPException(status_code=400, detail="format must be csv or ndjson")
+
+    try:
+        return await import_issues(db=db, project_id=project_id, reporter=user, rows=rows)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@router.patch("/bulk", response_model=IssueBulkUpdateResponse)
+async def bulk_edit_issues(
+    project_id: UUID,
+    payload: IssueBulkUpdateRequest,
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Same partial update for many issues (e.g. move a sprint to done, reassign).
+    Target: {"issue_ids": [...]} or {"filter": {...}}.
+    """
+    try:
+        updates = payload.updates.model_dump(exclude_unset=True)
+        ids = await bulk_update_issues(
+            db=db,
+            project_id=project_id,
+            current_user=user,
+            updates=updates,
+            issue_ids=payload.issue_ids,
+            filters=payload.filter.model_dump(exclude_unset=True) if payload.filter else None,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    issue_ids = [str(i) for i in ids]
+
+    # ONE coalesced event on the project room (not one per issue)
+    if issue_ids:
+        try:
+            await publish_and_broadcast(
+                {
+                    "type": "issues_bulk_updated",
+                    "project_id": str(project_id),
+                    "issue_ids": issue_ids,
+                    "changes": payload.updates.model_dump(mode="json", exclude_unset=True),
+                }
+            )
+        except Exception:
+            pass
+
+    return IssueBulkUpdateResponse(updated=len(issue_ids), issue_ids=issue_ids)
+
+
 @router.get("", response_model=list[IssueResponse])
 def list_in_project(
-    project_id: str,
+    project_id: UUID,
+    response: Response,
+    status: list[IssueStatus] | None = Query(default=None),
+    priority: list[IssuePriority] | None = Query(default=None),
+    type: list[IssueType] | None = Query(default=None),
+    assignee_id: UUID | None = None,
+    unassigned: bool = False,
+    reporter_id: UUID | None = None,
+    due_from: date | None = None,
+    due_to: date | None = None,
+    sort: str | None = Query(default=None, description="created_at | updated_at, prefix - for descending (default -updated_at)"),
+    limit: int | None = Query(default=None, ge=1, le=settings.issues_page_max),
+    cursor: str | None = None,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
+    """
+    Filters: status/priority/type (repeatable), assignee_id or unassigned,
+    reporter_id, due_from/due_to.
+    - no limit/cursor -> every matching issue (what the board loads today)
+    - ?limit=N / ?cursor=... -> one page, next page cursor in X-Next-Cursor
+    """
+    filters = {
+        "status": status,
+        "priority": priority,
+        "type": type,
+        "assignee_id": assignee_id,
+        "unassigned": unassigned,
+        "reporter_id": reporter_id,
+        "due_from": due_from,
+        "due_to": due_to,
+    }
     try:
-        items = list_issues(db=db, project_id=project_id, current_user=user)
+        if limit is None and cursor is None:
+            items = list_issues(db=db, project_id=project_id, current_user=user, filters=filters, sort=sort)
+        else:
+            items, next_cursor = list_issues_page(
+                db=db,
+                project_id=project_id,
+                current_user=user,
+                limit=limit or settings.issues_page_size,
+                cursor=cursor,
+                filters=filters,
+                sort=sort,
+            )
+            if next_cursor:
+                response.headers["X-Next-Cursor"] = next_cursor
         return [
             IssueResponse(
                 id=str(i.id),
@@ -64,6 +197,7 @@ def list_in_project(
                 priority=i.priority,
                 status=i.status,
                 due_date=i.due_date,
+                comments_count=i.comments_count,
             )
             for i in items
         ]
@@ -72,8 +206,8 @@ def list_in_project(
 
 @router.patch("/{issue_id}", response_model=IssueEditResponse)
 def edit_issue(
-    project_id: str,
-    issue_id: str,
+    project_id: UUID,
+    issue_id: UUID,
     payload: IssueUpdateRequest,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
@@ -115,8 +249,8 @@ def edit_issue(
 
 @router.delete("/{issue_id}")
 def delete_issue(
-    project_id: str,
-    issue_id: str,
+    project_id: UUID,
+    issue_id: UUID,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
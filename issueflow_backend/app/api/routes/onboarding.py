@@ -3,6 +3,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from sqlmodel import Session
 from datetime import datetime
 from app.services.invite_service import invite_members
+from app.core import auth_cache
 from app.core.deps import get_current_user
 from app.db.session import get_db
 from app.models.user import User
@@ -58,6 +59,7 @@ def setup(
         db.add(user)
         db.commit()
         db.refresh(user)
+        auth_cache.invalidate_user(user.id)
 
         return OnboardingSetupResponse(
             project_id=str(project.id),
@@ -83,4 +85,5 @@ def complete(db: Session = Depends(get_db), user: User = Depends(get_current_use
     user.updated_at = datetime.utcnow()
     db.add(user)
     db.commit()
+    auth_cache.invalidate_user(user.id)
     return {"has_completed_onboarding": True}
@@ -21,7 +21,7 @@ def create_invites(
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    project = db.exec(select(Project).where(Project.id == project_id)).first()
+    project = db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None))).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
@@ -40,7 +40,7 @@ def delete_invite(
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
 ):
-    project = db.exec(select(Project).where(Project.id == project_id)).first()
+    project = db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None))).first()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
 
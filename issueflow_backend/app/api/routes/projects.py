@@ -1,7 +1,13 @@
-from fastapi import APIRouter, Depends, HTTPException
+import json
+from typing import Optional
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session, select
+from app.core.config import settings
 from app.schemas.project_issues import ProjectWithIssuesResponse, IssueMiniResponse, UserMini
-from app.services.project_issue_service import list_projects_with_issues_and_users
+from app.services.project_issue_service import list_projects_with_issues_and_users, stream_projects_with_issues
 from app.core.deps import get_current_user
 from app.db.session import get_db
 from app.models.user import User
@@ -78,7 +84,7 @@ def list_all(db: Session = Depends(get_db), user: User = Depends(get_current_use
 
 @router.patch("/{project_id}/preference", response_model=ProjectResponse)
 def update_preference(
-    project_id: str,
+    project_id: UUID,
     payload: ProjectPreferenceUpdateRequest,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
@@ -93,7 +99,7 @@ def update_preference(
         )
 
         from app.models.project import Project
-        project = db.exec(select(Project).where(Project.id == project_id)).first()
+        project = db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None))).first()
 
         role = ProjectRole.owner if project.owner_id == user.id else ProjectRole.member
 
@@ -121,7 +127,7 @@ def list_projects_with_all_issues(
 
         out: list[ProjectWithIssuesResponse] = []
 
-        for (p, role, issue_rows, comment_count_map) in rows:
+        for (p, role, issue_rows) in rows:
             out.append(
                 ProjectWithIssuesResponse(
                     id=str(p.id),
@@ -148,7 +154,7 @@ def list_projects_with_all_issues(
                                 UserMini(id=str(assignee.id), username=assignee.username)
                                 if assignee else None
                             ),
-                            comments_count=comment_count_map.get(str(i.id), 0),  # ✅ FIX
+                            comments_count=i.comments_count,
                         )
                         for (i, reporter, assignee) in issue_rows
                     ],
@@ -162,11 +168,50 @@ def list_projects_with_all_issues(
 
 
 
+def _json_default(value):
+    # datetimes / dates in the frames
+    return value.isoformat()
+
+
+@router.get("/with-issues/stream")
+def stream_projects_with_issues_ndjson(
+    issues_limit: int = Query(
+        default=settings.projects_stream_issues_default, ge=0, le=settings.projects_stream_issues_max
+    ),
+    fields: Optional[str] = Query(default=None, description="Comma-separated issue fields (default: all)"),
+    cursor: Optional[str] = Query(default=None, description="Next page of projects (from the end frame)"),
+    project_id: Optional[str] = Query(default=None, description="Only this project (with issues_cursor: its next issues)"),
+    issues_cursor: Optional[str] = Query(default=None),
+    db: Session = Depends(get_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Streamed, paginated /with-issues: one JSON object per line (NDJSON),
+    see stream_projects_with_issues for the frame types.
+    """
+    try:
+        frames = stream_projects_with_issues(
+            db=db,
+            user=user,
+            issues_limit=issues_limit,
+            fields=fields,
+            cursor=cursor,
+            project_id=project_id,
+            issues_cursor=issues_cursor,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    lines = (json.dumps(f, default=_json_default, separators=(",", ":")) + "\n" for f in frames)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
 @router.delete("/{project_id}")
-def remove(project_id: str, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
+def remove(project_id: UUID, db: Session = Depends(get_db), user: User = Depends(get_current_user)):
     try:
-        delete_project(db=db, project_id=project_id, owner=user)
-        return {"status": "ok"}
+        purge_scheduled = delete_project(db=db, project_id=project_id, owner=user)
+        # purge_scheduled: big project, its issues/comments are removed in the background
+        return {"status": "ok", "purge_scheduled": purge_scheduled}
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
 
@@ -174,7 +219,7 @@ def remove(project_id: str, db: Session = Depends(get_db), user: User = Depends(
 
 @router.patch("/{project_id}", response_model=ProjectResponse)
 def edit_project(
-    project_id: str,
+    project_id: UUID,
     payload: ProjectUpdateRequest,
     db: Session = Depends(get_db),
     user: User = Depends(get_current_user),
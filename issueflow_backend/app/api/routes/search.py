@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.deps import get_current_user
+from app.db.session import get_async_db
+from app.models.user import User
+from app.schemas.search import SearchHit, SearchResponse
+from app.services.search_service import search
+
+router = APIRouter(tags=["Search"])
+
+
+@router.get("/search", response_model=SearchResponse)
+async def search_issues_and_comments(
+    q: str = Query(min_length=1, max_length=200),
+    project_id: UUID | None = None,
+    limit: int = Query(default=20, ge=1, le=settings.search_max_limit),
+    db: AsyncSession = Depends(get_async_db),
+    user: User = Depends(get_current_user),
+):
+    """
+    Ranked search over issue titles/descriptions and comment bodies
+    in every project the user can access (or just ?project_id=).
+    """
+    try:
+        hits = await search(db, user, q, project_id=project_id, limit=limit)
+        return SearchResponse(query=q, results=[SearchHit(**h) for h in hits])
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,84 @@
+"""
+Seed the activity feed with recent comments.
+
+    python -m app.commands.backfill_activity [--per-project N]
+
+The feed is filled on write, so comments from before it existed are not
+in anyone's feed (and the home dashboard's recent activity reads the feed).
+This copies the last N comments of every live project into its members'
+feeds as comment_created events. Comments already in the feed are skipped,
+so running it twice is harmless.
+"""
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from app.db.init_db import init_db
+from app.db.session import engine
+from app.models.activity import ActivityEvent, ActivityType
+from app.models.issue import Issue
+from app.models.issue_comment import IssueComment
+from app.models.project import Project
+from app.services.activity_service import _event_rows, _recipients_stmt
+
+
+def backfill(per_project: int = 20) -> int:
+    """
+    Returns how many comments were added to feeds.
+    """
+    added = 0
+    with Session(engine) as db:
+        project_ids = list(db.exec(select(Project.id).where(Project.deleted_at.is_(None))).all())
+        already = select(ActivityEvent.comment_id).where(ActivityEvent.comment_id.is_not(None))
+
+        for project_id in project_ids:
+            rows = db.exec(
+                select(IssueComment, Issue.key, Issue.title)
+                .join(Issue, Issue.id == IssueComment.issue_id)
+                .where(IssueComment.project_id == project_id, IssueComment.id.not_in(already))
+                .order_by(IssueComment.created_at.desc())
+                .limit(per_project)
+            ).all()
+            if not rows:
+                continue
+
+            recipients = [uid for (uid,) in db.exec(_recipients_stmt(project_id)).all()]
+            values = []
+            for c, key, title in rows:
+                values += _event_rows(
+                    recipients,
+                    project_id,
+                    ActivityType.comment_created,
+                    None,
+                    actor_id=c.author_id,
+                    actor_username=c.author_username,
+                    issue_id=c.issue_id,
+                    issue_key=key,
+                    issue_title=title,
+                    comment_id=c.id,
+                    body=c.body,
+                    created_at=c.created_at,  # keep the feed in comment order
+                )
+            if values:
+                db.execute(insert(ActivityEvent), values)
+            db.commit()
+            added += len(rows)
+    return added
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seed the activity feed with recent comments")
+    parser.add_argument("--per-project", type=int, default=20)
+    args = parser.parse_args()
+
+    # creates the activity_feed table on older databases
+    init_db()
+    added = backfill(args.per_project)
+    print(f"{added} comment(s) added to activity feeds")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Recompute Issue.comments_count from issue_comments.
+
+    python -m app.commands.backfill_comments_count [--batch-size N]
+
+Run once after deploying the column (existing rows start at 0), and any
+time later as a repair if the counters drifted. Works through issues in
+id order, one short UPDATE + commit per batch, and only writes rows whose
+count is actually wrong.
+"""
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import func, update
+from sqlmodel import Session, select
+
+from app.db.init_db import init_db
+from app.db.session import engine
+from app.models.issue import Issue
+from app.models.issue_comment import IssueComment
+
+
+def backfill(batch_size: int = 1000) -> int:
+    """
+    Returns how many issues were corrected.
+    """
+    fixed = 0
+    last_id = None
+
+    with Session(engine) as db:
+        while True:
+            ids_stmt = select(Issue.id).order_by(Issue.id).limit(batch_size)
+            if last_id is not None:
+                ids_stmt = ids_stmt.where(Issue.id > last_id)
+            ids = list(db.exec(ids_stmt).all())
+            if not ids:
+                return fixed
+            last_id = ids[-1]
+
+            actual = (
+                select(func.count(IssueComment.id))
+                .where(IssueComment.issue_id == Issue.id)
+                .scalar_subquery()
+            )
+            result = db.exec(
+                update(Issue)
+                .where(Issue.id.in_(ids), Issue.comments_count != actual)
+                .values(comments_count=actual)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            fixed += result.rowcount or 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recompute Issue.comments_count")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    # adds the column on databases created before it existed
+    init_db()
+    fixed = backfill(args.batch_size)
+    print(f"comments_count corrected on {fixed} issue(s)")
+
+
+if __name__ == "__main__":
+    main()
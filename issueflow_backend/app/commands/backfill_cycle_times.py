@@ -0,0 +1,81 @@
+"""
+Recompute Issue.started_at / completed_at from issue_transitions.
+
+    python -m app.commands.backfill_cycle_times [--batch-size N]
+
+Run once after deploying the columns (existing rows start NULL, so the
+cycle-time report doesn't see them), and any time later as a repair.
+started_at = first move to in_progress, completed_at = last move to done.
+Works through issues in id order, one short UPDATE + commit per batch, and
+only writes rows whose stamps are actually wrong.
+"""
+from __future__ import annotations
+
+import argparse
+
+from sqlalchemy import func, or_, update
+from sqlmodel import Session, select
+
+from app.db.init_db import init_db
+from app.db.session import engine
+from app.models.issue import Issue, IssueStatus
+from app.models.issue_transition import IssueTransition, TransitionField
+
+
+def _move_at(to: IssueStatus, agg):
+    return (
+        select(agg(IssueTransition.created_at))
+        .where(
+            IssueTransition.issue_id == Issue.id,
+            IssueTransition.field == TransitionField.status,
+            IssueTransition.to_value == to.value,
+        )
+        .scalar_subquery()
+    )
+
+
+def backfill(batch_size: int = 1000) -> int:
+    """
+    Returns how many issues were corrected.
+    """
+    fixed = 0
+    last_id = None
+
+    with Session(engine) as db:
+        while True:
+            ids_stmt = select(Issue.id).order_by(Issue.id).limit(batch_size)
+            if last_id is not None:
+                ids_stmt = ids_stmt.where(Issue.id > last_id)
+            ids = list(db.exec(ids_stmt).all())
+            if not ids:
+                return fixed
+            last_id = ids[-1]
+
+            started = _move_at(IssueStatus.in_progress, func.min)
+            completed = _move_at(IssueStatus.done, func.max)
+            result = db.exec(
+                update(Issue)
+                .where(
+                    Issue.id.in_(ids),
+                    or_(Issue.started_at.is_distinct_from(started), Issue.completed_at.is_distinct_from(completed)),
+                )
+                .values(started_at=started, completed_at=completed)
+                .execution_options(synchronize_session=False)
+            )
+            db.commit()
+            fixed += result.rowcount or 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Recompute Issue.started_at / completed_at")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    # adds the columns on databases created before they existed
+    init_db()
+    fixed = backfill(args.batch_size)
+    print(f"started_at / completed_at corrected on {fixed} issue(s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Fill project_daily_stats (burndown / cumulative flow) for existing data.
+
+    python -m app.commands.backfill_daily_stats [--project-id ID] [--since YYYY-MM-DD]
+
+Recomputes every live project (or one) from --since, or from the day its
+first issue was created, up to today: one short transaction per project.
+A full run also moves the rollup job's watermark to its start time, so the
+job doesn't redo the same history; after that the job keeps the table
+current by itself.
+
+Status history only exists since issue_transitions was added: older issues
+count in their current status for every day since they were created.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import date, datetime, timedelta
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlmodel import select
+
+from app.core.config import settings
+from app.db.init_db import init_db
+from app.db.session import AsyncSessionLocal, async_engine
+from app.models.issue import Issue
+from app.models.project import Project
+from app.services.daily_stats_service import advance_watermark, recompute_project
+
+
+async def backfill(project_id: Optional[UUID] = None, since: Optional[date] = None) -> int:
+    """
+    Returns how many projects were recomputed.
+    """
+    started = datetime.utcnow() - timedelta(seconds=settings.daily_stats_lag_seconds)
+    done = 0
+    async with AsyncSessionLocal() as db:
+        stmt = (
+            select(Project.id, func.min(Issue.created_at))
+            .join(Issue, Issue.project_id == Project.id)
+            .where(Project.deleted_at.is_(None))
+            .group_by(Project.id)
+        )
+        if project_id is not None:
+            stmt = stmt.where(Project.id == project_id)
+
+        for pid, first_created in (await db.exec(stmt)).all():
+            await recompute_project(db, pid, since or first_created.date())
+            await db.commit()
+            done += 1
+
+        if project_id is None:
+            await advance_watermark(db, started)
+            await db.commit()
+    return done
+
+
+async def _main(project_id: Optional[UUID], since: Optional[date]) -> None:
+    try:
+        n = await backfill(project_id, since)
+    finally:
+        await async_engine.dispose()
+    print(f"daily stats rebuilt for {n} project(s)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Fill project_daily_stats for existing data")
+    parser.add_argument("--project-id", type=UUID, default=None)
+    parser.add_argument("--since", type=date.fromisoformat, default=None)
+    args = parser.parse_args()
+
+    # creates the rollup tables on older databases
+    init_db()
+    asyncio.run(_main(args.project_id, args.since))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Verify (and fix) the per-project issue stats used by the dashboards.
+
+    python -m app.commands.rebuild_issue_stats [--verify-only] [--project-id ID]
+
+Recounts every project's issues by (status, priority) and compares with
+project_issue_stats. Drifted projects are corrected one at a time (one
+short transaction each). Run once after deploying the table to fill it,
+then whenever you want to check the counters (e.g. a nightly cron).
+Exits 1 when drift was found.
+"""
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlmodel import Session, select
+
+from app.db.init_db import init_db
+from app.db.session import engine
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.project_issue_stats import ProjectIssueStats
+from app.services.issue_stats_service import rebuild_project_stats
+
+
+def _is_drifted(db: Session, project_id: UUID) -> bool:
+    stored = {
+        (s, p): n
+        for s, p, n in db.exec(
+            select(ProjectIssueStats.status, ProjectIssueStats.priority, ProjectIssueStats.count)
+            .where(ProjectIssueStats.project_id == project_id)
+        ).all()
+        if n
+    }
+    actual = {
+        (s, p): int(n)
+        for s, p, n in db.exec(
+            select(Issue.status, Issue.priority, func.count(Issue.id))
+            .where(Issue.project_id == project_id)
+            .group_by(Issue.status, Issue.priority)
+        ).all()
+    }
+    return stored != actual
+
+
+def run(verify_only: bool = False, project_id: Optional[UUID] = None, batch_size: int = 500) -> int:
+    """
+    Returns how many projects had drifted stats.
+    """
+    drifted = 0
+    last_id = None
+
+    with Session(engine) as db:
+        while True:
+            stmt = select(Project.id).where(Project.deleted_at.is_(None)).order_by(Project.id).limit(batch_size)
+            if project_id is not None:
+                stmt = stmt.where(Project.id == project_id)
+            if last_id is not None:
+                stmt = stmt.where(Project.id > last_id)
+            ids = list(db.exec(stmt).all())
+            if not ids:
+                return drifted
+            last_id = ids[-1]
+
+            for pid in ids:
+                if verify_only:
+                    changed = _is_drifted(db, pid)
+                else:
+                    changed = rebuild_project_stats(db, pid)
+                if changed:
+                    drifted += 1
+                    print(f"{'drifted' if verify_only else 'fixed'}: project {pid}")
+
+            if project_id is not None:
+                return drifted
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Verify / rebuild project issue stats")
+    parser.add_argument("--verify-only", action="store_true", help="report drift, change nothing")
+    parser.add_argument("--project-id", type=UUID, default=None)
+    args = parser.parse_args()
+
+    # creates the stats table on databases that predate it
+    init_db()
+    drifted = run(verify_only=args.verify_only, project_id=args.project_id)
+    print(f"{drifted} project(s) with drifted stats")
+    sys.exit(1 if drifted else 0)
+
+
+if __name__ == "__main__":
+    main()
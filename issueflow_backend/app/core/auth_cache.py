@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+import anyio.from_thread
+from sqlalchemy.orm import make_transient_to_detached
+
+import app.core.redis_client as redis_mod
+from app.core import metrics
+from app.core.config import settings
+from app.core.redis_pubsub import INSTANCE_ID
+from app.models.user import User
+
+# Process-local cache for the auth dependencies:
+#   access token -> (user_id, exp)     (skip the JWT decode)
+#   user_id      -> user row values    (skip SELECT user WHERE id = sub)
+# Entries never outlive the token's exp. When a user row changes we drop it
+# here and tell the other instances via AUTH_INVALIDATE_CHANNEL.
+AUTH_INVALIDATE_CHANNEL = "issueflow:auth:invalidate"
+
+
+class TTLCache:
+    """
+    Small LRU with a per-entry deadline (epoch seconds).
+    Thread-safe: sync dependencies run in the threadpool.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        # key -> (expires_at, value), least recently used first
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key) -> Any:
+        now = time.time()
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at <= now:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, expires_at: float) -> None:
+        if expires_at <= time.time():
+            return
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+_tokens = TTLCache(settings.auth_cache_max_tokens)
+_users = TTLCache(settings.auth_cache_max_users)
+
+# Bumped on every invalidation. A request that read the user row BEFORE an
+# invalidation must not put that (maybe stale) row back into the cache.
+_generation = 0
+_generation_lock = threading.Lock()
+
+
+def generation() -> int:
+    return _generation
+
+
+def get_token(token: str) -> Optional[Tuple[str, float]]:
+    return _tokens.get(token)
+
+
+def put_token(token: str, user_id: str, exp: Any) -> None:
+    try:
+        exp = float(exp)
+    except (TypeError, ValueError):
+        return
+    _tokens.set(token, (user_id, exp), exp)
+
+
+def get_user(user_id: str) -> Optional[User]:
+    """
+    Cached user as a detached User instance (a fresh copy per call,
+    so a route changing it never touches the cache). None on miss.
+    """
+    data = _users.get(user_id)
+    if data is None:
+        metrics.incr("auth_cache.miss")
+        return None
+
+    metrics.incr("auth_cache.hit")
+    user = User(**data)
+    # Same identity as the DB row: session.add() attaches it without an INSERT
+    make_transient_to_detached(user)
+    return user
+
+
+def put_user(user: User, exp: float, seen_generation: int) -> None:
+    if seen_generation != _generation:
+        return  # invalidated while we were reading it
+    expires_at = min(time.time() + settings.auth_cache_ttl_seconds, float(exp))
+    _users.set(str(user.id), user.model_dump(), expires_at)
+
+
+def _drop_local(user_id: str) -> None:
+    global _generation
+    with _generation_lock:
+        _generation += 1
+    _users.pop(user_id)
+
+
+async def _publish_invalidation(user_id: str) -> None:
+    if redis_mod.redis_client is None:
+        return
+    message = json.dumps({"user_id": user_id, "origin": INSTANCE_ID})
+    await redis_mod.redis_client.publish(AUTH_INVALIDATE_CHANNEL, message)
+
+
+def invalidate_user(user_id: Any) -> None:
+    """
+    Call AFTER committing a change to a user row (onboarding, username...).
+    Drops it here right away and asks the other instances to do the same.
+    Works from async code and from sync routes (threadpool).
+    """
+    user_id = str(user_id)
+    _drop_local(user_id)
+
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+
+    try:
+        if loop is not None:
+            loop.create_task(_publish_invalidation(user_id))
+        else:
+            # sync route running in a worker thread -> hop onto the event loop
+            anyio.from_thread.run(_publish_invalidation, user_id)
+    except Exception:
+        # No loop / Redis down: other instances expire it within the TTL
+        pass
+
+
+def on_invalidate_message(payload: dict) -> None:
+    """
+    Redis handler for AUTH_INVALIDATE_CHANNEL (other instances' changes).
+    """
+    if payload.get("origin") == INSTANCE_ID:
+        return  # already dropped locally
+    user_id = payload.get("user_id")
+    if user_id:
+        _drop_local(str(user_id))
+        metrics.incr("auth_cache.remote_invalidations")
@@ -19,9 +19,88 @@ class Settings(BaseSettings):
     access_token_expire_minutes: int = 15
     refresh_token_expire_days: int = 14
 
+    # Async engine connection pool (see app/db/session.py)
+    async_db_pool_size: int = 20
+    async_db_max_overflow: int = 20
+
     firebase_service_account_file: str | None = None
     redis_url: str | None = None
 
+    # bcrypt worker processes for register/login (niceness added to their
+    # CPU priority), and how many hash jobs may be in flight before new ones
+    # get 429 (Retry-After seconds)
+    password_hash_workers: int = 2
+    password_hash_worker_nice: int = 10
+    password_hash_max_pending: int = 32
+    password_hash_retry_after_seconds: int = 1
+
+    # Auth dependency cache (token -> user id, user id -> user row).
+    # Entries also never outlive the access token's exp.
+    auth_cache_ttl_seconds: int = 60
+    auth_cache_max_tokens: int = 10000
+    auth_cache_max_users: int = 10000
+
+    # WebSocket fan-out: per-socket outbound queue size, and what to do
+    # when a slow client fills it: "drop" (skip frames) or "evict" (close it)
+    ws_send_queue_size: int = 256
+    ws_slow_consumer_policy: str = "evict"
+    # Multiplexed socket (/ws/comments): max issue rooms per connection
+    ws_max_rooms_per_connection: int = 100
+
+    # Comment pages (GET ?limit=&cursor=) and the WS snapshot (latest page only)
+    comments_page_size: int = 50
+    comments_page_max: int = 200
+    ws_snapshot_limit: int = 50
+
+    # Issue listing pages (GET /projects/{id}/issues?limit=&cursor=)
+    issues_page_size: int = 50
+    issues_page_max: int = 200
+
+    # Streamed projects-with-issues: projects per response page,
+    # issues per project (default / max)
+    projects_stream_page_size: int = 100
+    projects_stream_issues_default: int = 50
+    projects_stream_issues_max: int = 500
+
+    # Activity feed (GET /activity) page size default / max
+    activity_page_size: int = 50
+    activity_page_max: int = 200
+
+    # Cycle-time analytics: default / max window (days)
+    analytics_default_days: int = 90
+    analytics_max_days: int = 730
+
+    # Daily rollup (burndown / cumulative flow): seconds between passes,
+    # and how recent a change must be to be left to the next pass
+    # (its transaction may not have committed yet)
+    daily_stats_interval_seconds: int = 300
+    daily_stats_lag_seconds: int = 60
+
+    # Dashboard response cache (Redis): TTL only garbage-collects stale
+    # versions; lock = how long others wait for the instance computing it
+    dashboard_cache_ttl_seconds: int = 3600
+    dashboard_cache_lock_ms: int = 5000
+
+    # Bulk issue import: rows per INSERT/commit, per-row errors kept in the response
+    issue_import_batch_size: int = 1000
+    issue_import_max_errors: int = 100
+
+    # Bulk update: max explicit issue_ids per call (filters are not capped)
+    issue_bulk_max_ids: int = 5000
+
+    # Project delete: up to this many issues are deleted inline; bigger
+    # projects are soft-deleted and purged in the background in batches
+    project_purge_inline_max_issues: int = 5000
+    project_purge_batch_size: int = 1000
+    project_purge_interval_seconds: int = 60
+
+    # Search: Postgres text search config (tsvector columns), max hits per call
+    search_language: str = "english"
+    search_max_limit: int = 50
+
+    # Per-issue Redis Stream of recent comment events (reconnect replay)
+    comment_stream_maxlen: int = 500
+    comment_stream_ttl_seconds: int = 86400
 
     class Config:
         env_file = ".env"
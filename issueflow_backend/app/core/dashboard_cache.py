@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import time
+from datetime import date
+from typing import Awaitable, Callable, Dict, Iterable, List
+from uuid import UUID
+
+import anyio.from_thread
+from redis.exceptions import RedisError
+
+import app.core.redis_client as redis_mod
+from app.core import metrics
+from app.core.config import settings
+from app.core.redis_pubsub import INSTANCE_ID
+
+# Redis cache of serialized dashboard responses.
+#
+# Every project has a version counter (issueflow:dash:ver:<project_id>),
+# bumped AFTER each committed issue/comment write in that project.
+# A cached body's key contains the versions it was computed from:
+#   home:     user id + hash of {project_id: version} for the user's projects
+#             (+ today's date: due soon / overdue move at midnight)
+#   project:  project id + its version (same body for every member)
+# so a write simply makes the old key unreachable: no TTL guessing, no deletes.
+# The TTL only garbage-collects unreachable entries.
+DASH_PREFIX = "issueflow:dash"
+
+# Local single-flight: key -> the task computing it on this instance
+_inflight: Dict[str, asyncio.Task] = {}
+
+# How often we poll for a body another instance is computing
+_LOCK_POLL_SECONDS = 0.05
+
+
+def _version_key(project_id) -> str:
+    return f"{DASH_PREFIX}:ver:{project_id}"
+
+
+async def _versions(project_ids: List[str]) -> List[str]:
+    if not project_ids:
+        return []
+    values = await redis_mod.redis_client.mget([_version_key(pid) for pid in project_ids])
+    return [v or "0" for v in values]
+
+
+async def home_key(user_id: UUID, project_ids: Iterable[UUID]) -> str:
+    pids = sorted(str(pid) for pid in project_ids)
+    versions = await _versions(pids)
+    vector = ",".join(f"{pid}:{v}" for pid, v in zip(pids, versions))
+    digest = hashlib.sha1(f"{date.today().isoformat()}|{vector}".encode()).hexdigest()
+    return f"{DASH_PREFIX}:home:{user_id}:{digest}"
+
+
+async def project_key(project_id: UUID) -> str:
+    (version,) = await _versions([str(project_id)])
+    return f"{DASH_PREFIX}:project:{project_id}:{version}"
+
+
+async def bump_project_versions_async(*project_ids) -> None:
+    if redis_mod.redis_client is None or not project_ids:
+        return
+    pipe = redis_mod.redis_client.pipeline(transaction=False)
+    for pid in project_ids:
+        pipe.incr(_version_key(pid))
+    try:
+        await pipe.execute()
+    except RedisError:
+        # never fail the (already committed) write; entries expire with the TTL
+        pass
+
+
+def bump_project_versions(*project_ids) -> None:
+    """
+    Sync flavour for sync services (threadpool): waits for the INCR, so the
+    next dashboard read from this client already sees the new version.
+    """
+    try:
+        anyio.from_thread.run(bump_project_versions_async, *project_ids)
+    except Exception:
+        # no event loop (scripts) / Redis down: entries expire with the TTL
+        pass
+
+
+async def _compute_and_store(key: str, compute: Callable[[], Awaitable[str]]) -> str:
+    r = redis_mod.redis_client
+    lock_key = f"{key}:lock"
+    lock_seconds = settings.dashboard_cache_lock_ms / 1000
+
+    # Cross-instance single-flight: whoever gets the lock computes,
+    # the others wait for its result (up to the lock timeout)
+    try:
+        locked = await r.set(lock_key, INSTANCE_ID, nx=True, px=settings.dashboard_cache_lock_ms)
+    except RedisError:
+        return await compute()
+
+    if not locked:
+        metrics.incr("dashboard_cache.lock_wait")
+        deadline = time.monotonic() + lock_seconds
+        try:
+            while time.monotonic() < deadline:
+                await asyncio.sleep(_LOCK_POLL_SECONDS)
+                body = await r.get(key)
+                if body is not None:
+                    return body
+        except RedisError:
+            pass
+        # holder died or is too slow: compute it ourselves
+
+    try:
+        t0 = time.perf_counter()
+        body = await compute()
+        metrics.observe_ms("dashboard_cache.compute", (time.perf_counter() - t0) * 1000)
+        try:
+            await r.set(key, body, ex=settings.dashboard_cache_ttl_seconds)
+        except RedisError:
+            pass
+        return body
+    finally:
+        if locked:
+            try:
+                await r.delete(lock_key)
+            except RedisError:
+                pass  # expires by itself
+
+
+async def get_or_compute(key_fn: Callable[[], Awaitable[str]], compute: Callable[[], Awaitable[str]]) -> str:
+    """
+    Cached body for the key key_fn() builds, or compute() it (once per key
+    at a time, across requests and instances) and cache it.
+    Without Redis (or when it fails) this just computes.
+    """
+    r = redis_mod.redis_client
+    if r is None:
+        metrics.incr("dashboard_cache.bypass")
+        return await compute()
+
+    try:
+        key = await key_fn()
+        body = await r.get(key)
+    except RedisError:
+        metrics.incr("dashboard_cache.bypass")
+        return await compute()
+
+    if body is not None:
+        metrics.incr("dashboard_cache.hit")
+        return body
+
+    task = _inflight.get(key)
+    if task is None:
+        metrics.incr("dashboard_cache.miss")
+        task = asyncio.create_task(_compute_and_store(key, compute))
+        _inflight[key] = task
+        task.add_done_callback(lambda _t: _inflight.pop(key, None))
+    else:
+        metrics.incr("dashboard_cache.coalesced")
+
+    # shield: one cancelled request must not cancel the others' result
+    return await asyncio.shield(task)
+
+
+def stats() -> dict:
+    c = metrics.counters()
+    hits = c.get("dashboard_cache.hit", 0)
+    lookups = hits + c.get("dashboard_cache.miss", 0) + c.get("dashboard_cache.coalesced", 0)
+    return {
+        "hits": hits,
+        "lookups": lookups,
+        "hit_rate": (hits / lookups) if lookups else None,
+    }
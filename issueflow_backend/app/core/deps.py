@@ -1,8 +1,11 @@
+from uuid import UUID
+
 from fastapi import Depends, HTTPException
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError
 from sqlmodel import Session, select
 
+from app.core import auth_cache
 from app.core.security import decode_token
 from app.db.session import get_db
 from app.models.user import User
@@ -17,20 +20,44 @@ def get_current_user(
         raise HTTPException(status_code=401, detail="Not authenticated")
 
     token = creds.credentials
-    try:
-        payload = decode_token(token)
-    except JWTError:
-        raise HTTPException(status_code=401, detail="Invalid token")
 
-    if payload.get("type") != "access":
-        raise HTTPException(status_code=401, detail="Invalid token type")
+    # Seen this access token before? -> no JWT decode
+    cached = auth_cache.get_token(token)
+    if cached is not None:
+        user_id, exp = cached
+    else:
+        try:
+            payload = decode_token(token)
+        except JWTError:
+            raise HTTPException(status_code=401, detail="Invalid token")
+
+        if payload.get("type") != "access":
+            raise HTTPException(status_code=401, detail="Invalid token type")
+
+        user_id = payload.get("sub")
+        if not user_id:
+            raise HTTPException(status_code=401, detail="Invalid token payload")
+
+        exp = payload.get("exp")
+        auth_cache.put_token(token, str(user_id), exp)
+
+    # Common case: cached user row -> zero queries
+    user = auth_cache.get_user(str(user_id))
+    if user is not None:
+        # attach to this request's session (routes may db.add()/refresh it)
+        db.add(user)
+        return user
 
-    user_id = payload.get("sub")
-    if not user_id:
+    try:
+        uid = UUID(str(user_id))  # a str only works on drivers that cast it (psycopg2, not SQLite)
+    except ValueError:
         raise HTTPException(status_code=401, detail="Invalid token payload")
 
-    user = db.exec(select(User).where(User.id == user_id)).first()
+    seen = auth_cache.generation()
+    user = db.exec(select(User).where(User.id == uid)).first()
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
 
-    return user
\ No newline at end of file
+    if exp is not None:
+        auth_cache.put_user(user, exp, seen)
+    return user
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from typing import Dict, List
+
+# Simple in-process counters + histograms (per backend instance).
+# Exposed on /debug/metrics so we can compare instances.
+_counters: Dict[str, int] = defaultdict(int)
+
+
+def incr(name: str, amount: int = 1) -> None:
+    _counters[name] += amount
+
+
+def counters() -> Dict[str, int]:
+    return dict(_counters)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram in milliseconds.
+    Percentiles are reported as the upper bound of the matching bucket
+    (or the max seen, past the last bucket).
+    """
+
+    BUCKETS_MS = (1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+    def __init__(self) -> None:
+        # one extra slot for "+Inf"
+        self.counts: List[int] = [0] * (len(self.BUCKETS_MS) + 1)
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        ms = max(ms, 0.0)
+        for i, bound in enumerate(self.BUCKETS_MS):
+            if ms <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q: float) -> float | None:
+        if self.count == 0:
+            return None
+        target = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts[:-1]):
+            seen += n
+            if seen >= target:
+                return float(self.BUCKETS_MS[i])
+        return self.max_ms
+
+    def snapshot(self) -> dict:
+        buckets = {f"le_{b}": n for b, n in zip(self.BUCKETS_MS, self.counts)}
+        buckets["le_inf"] = self.counts[-1]
+        return {
+            "count": self.count,
+            "avg_ms": (self.total_ms / self.count) if self.count else None,
+            "p50_ms": self.percentile(0.50),
+            "p95_ms": self.percentile(0.95),
+            "p99_ms": self.percentile(0.99),
+            "max_ms": self.max_ms,
+            "buckets": buckets,
+        }
+
+
+_histograms: Dict[str, LatencyHistogram] = {}
+
+
+def observe_ms(name: str, ms: float) -> None:
+    h = _histograms.get(name)
+    if h is None:
+        h = _histograms[name] = LatencyHistogram()
+    h.observe(ms)
+
+
+def histograms() -> Dict[str, dict]:
+    return {name: h.snapshot() for name, h in _histograms.items()}
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Tuple
+from uuid import UUID
+
+# Opaque keyset cursors.
+# Clients get a base64 string and send it back as-is; inside it is just the
+# sort key of the last row they saw, e.g. (created_at, id). The next page is
+# "rows strictly after this key", which stays an index range scan no matter
+# how deep the client pages (unlike OFFSET).
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+def encode_cursor(*values: Any) -> str:
+    raw = json.dumps([_to_json(v) for v in values], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    """
+    Raw JSON values of a cursor (callers parse them back to their types).
+    Raises ValueError for anything we didn't issue.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+    if not isinstance(values, list) or len(values) != size:
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def encode_created_cursor(created_at: datetime, row_id: UUID) -> str:
+    return encode_cursor(created_at, row_id)
+
+
+def decode_created_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """
+    (created_at, id) keyset cursor -> typed values.
+    """
+    created_at, row_id = decode_cursor(cursor, 2)
+    try:
+        return datetime.fromisoformat(created_at), UUID(str(row_id))
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
@@ -2,26 +2,84 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Awaitable, Callable, Optional
+import time
+from typing import Awaitable, Callable, Dict, Optional, Set, Tuple
+from uuid import uuid4
 
 import app.core.redis_client as redis_mod
+from app.core import metrics
 
-# One Redis channel for publishing comment events
-COMMENTS_CHANNEL = "issueflow:comments"
+# One Redis channel PER ROOM (project + issue):
+#   issueflow:comments:<project_id>:<issue_id>
+# Each instance only subscribes to rooms it has local sockets for,
+# so it never receives (or decodes) events nobody here is watching.
+COMMENTS_CHANNEL_PREFIX = "issueflow:comments"
+
+RoomKey = Tuple[str, str]  # (project_id, issue_id)
+
+# Project-wide events (e.g. bulk issue updates) have no issue_id:
+# they go to the project's own room (project_id, "*").
+PROJECT_ROOM = "*"
+
+# Unique per backend process: tags the events we publish ("origin")
+# so we can recognise our own echo when Redis sends it back.
+INSTANCE_ID = uuid4().hex
 
 _sub_task: Optional[asyncio.Task] = None
+_pubsub = None
+
+# Channels this instance WANTS (one per local room) vs. channels actually
+# subscribed on Redis. _sync_subscriptions() moves the second towards the first.
+_wanted: Set[str] = set()
+_subscribed: Set[str] = set()
+
+# Fixed (non-room) channels handled on the same connection,
+# e.g. auth cache invalidation: channel -> handler(payload)
+_channel_handlers: Dict[str, Callable[[dict], None]] = {}
+
+# Created per subscriber run (asyncio primitives belong to the running loop)
+_sync_lock: Optional[asyncio.Lock] = None
+# Set while at least one channel is subscribed: the listener sleeps on it
+# instead of polling when this instance has no rooms.
+_has_channels: Optional[asyncio.Event] = None
+
+# Back-off before reading again after a Redis connection error
+_RECONNECT_DELAY = 1.0
+
+
+def room_channel(project_id: str, issue_id: str) -> str:
+    return f"{COMMENTS_CHANNEL_PREFIX}:{project_id}:{issue_id}"
+
+
+def room_of(payload: dict) -> Optional[RoomKey]:
+    """
+    Room an event belongs to: (project_id, issue_id), or the project room
+    when the event has no issue_id. None if it has no project_id.
+    """
+    project_id = payload.get("project_id")
+    if not project_id:
+        return None
+    return (str(project_id), str(payload.get("issue_id") or PROJECT_ROOM))
 
 
 async def publish_comment_event(payload: dict) -> None:
     """
     Called by HTTP routes:
-    - publish an event to Redis
-    - all backend instances will receive it
+    - publish an event to the room's Redis channel
+    - every instance with sockets in that room will receive it
     """
     if redis_mod.redis_client is None:
         # Redis not connected -> can't sync instances
         return
 
+    room = room_of(payload)
+    if room is None:
+        return
+
+    # Publish time (epoch seconds) lets receivers measure delivery latency
+    if "published_at" not in payload:
+        payload = {**payload, "published_at": time.time()}
+
     # Redis Pub/Sub payload must be string/bytes -> use JSON string
     try:
         message = json.dumps(payload)
@@ -29,33 +87,116 @@ async def publish_comment_event(payload: dict) -> None:
         # If payload is not JSON-serializable, just skip publishing
         return
 
-    await redis_mod.redis_client.publish(COMMENTS_CHANNEL, message)
+    await redis_mod.redis_client.publish(room_channel(*room), message)
+
+
+def subscribe_room(room: RoomKey) -> None:
+    """
+    ConnectionManager hook: first local socket joined this room.
+    """
+    _wanted.add(room_channel(*room))
+    _schedule_sync()
+
+
+def unsubscribe_room(room: RoomKey) -> None:
+    """
+    ConnectionManager hook: last local socket left this room.
+    """
+    _wanted.discard(room_channel(*room))
+    _schedule_sync()
+
+
+def register_channel_handler(channel: str, handler: Callable[[dict], None]) -> None:
+    """
+    Listen on a fixed channel for the whole process lifetime
+    (register before start_comments_pubsub).
+    """
+    _channel_handlers[channel] = handler
+    _wanted.add(channel)
+    _schedule_sync()
+
+
+def _schedule_sync() -> None:
+    if _pubsub is None:
+        return  # subscriber not running; it subscribes to _wanted on start
+    asyncio.create_task(_sync_subscriptions())
+
+
+async def _sync_subscriptions() -> None:
+    # The wanted set is updated synchronously (in order) by the hooks above,
+    # so whichever sync runs last always converges to the latest state.
+    if _sync_lock is None or _has_channels is None:
+        return
+
+    async with _sync_lock:
+        pubsub = _pubsub
+        if pubsub is None:
+            return
+
+        to_add = _wanted - _subscribed
+        to_remove = _subscribed - _wanted
+
+        try:
+            if to_add:
+                await pubsub.subscribe(*to_add)
+                _subscribed.update(to_add)
+            if to_remove:
+                await pubsub.unsubscribe(*to_remove)
+                _subscribed.difference_update(to_remove)
+        except Exception:
+            # Redis hiccup: next room change retries the diff
+            pass
+
+        if _subscribed:
+            _has_channels.set()
+        else:
+            _has_channels.clear()
 
 
-async def _subscriber_loop(on_event: Callable[[dict], Awaitable[None]]) -> None:
+async def _subscriber_loop(on_event: Callable[[dict], Awaitable[int]]) -> None:
     """
     Runs forever:
-    - subscribes to Redis channel
+    - subscribes to the channels of local rooms (kept in sync by the hooks)
     - receives messages
-    - calls on_event(payload)
+    - calls on_event(payload) -> number of local sockets it reached
     """
+    global _pubsub, _sync_lock, _has_channels
+
     if redis_mod.redis_client is None:
         return
 
+    _sync_lock = asyncio.Lock()
+    _has_channels = asyncio.Event()
+
     pubsub = redis_mod.redis_client.pubsub()
-    await pubsub.subscribe(COMMENTS_CHANNEL)
+    # Open the connection now: we may have zero rooms (= zero subscriptions) for a while
+    await pubsub.connect()
+    _pubsub = pubsub
+    _subscribed.clear()
+    await _sync_subscriptions()
 
     try:
         while True:
-            # Wait for a message (timeout keeps loop responsive)
-            msg = await pubsub.get_message(
-                ignore_subscribe_messages=True,
-                timeout=1.0,
-            )
+            if not _subscribed:
+                # No local rooms -> nothing to read; sleep until one opens
+                await _has_channels.wait()
+                continue
+
+            # Block until Redis pushes something (no polling, no timeout)
+            try:
+                msg = await pubsub.get_message(
+                    ignore_subscribe_messages=True,
+                    timeout=None,
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                # Connection dropped: redis-py reconnects + resubscribes on next read
+                await asyncio.sleep(_RECONNECT_DELAY)
+                continue
 
             if msg is None:
-                # No message received -> yield CPU a bit
-                await asyncio.sleep(0.05)
+                # (un)subscribe confirmation
                 continue
 
             raw = msg.get("data")
@@ -75,21 +216,42 @@ async def _subscriber_loop(on_event: Callable[[dict], Awaitable[None]]) -> None:
                 # bad message should not crash the whole subscriber
                 continue
 
+            # Control channels (not comment rooms)
+            handler = _channel_handlers.get(msg.get("channel"))
+            if handler is not None:
+                try:
+                    handler(payload)
+                except Exception:
+                    pass
+                continue
+
+            metrics.incr("pubsub.received")
+
             # Pass the message to our callback (broadcast to WS clients)
             try:
-                await on_event(payload)
+                sockets = await on_event(payload)
             except Exception:
                 # Never crash subscriber because of one bad broadcast
                 continue
 
+            # received vs. delivered shows how much decode work was useful
+            if sockets:
+                metrics.incr("pubsub.delivered")
+                metrics.incr("pubsub.socket_frames", sockets)
+            else:
+                metrics.incr("pubsub.undelivered")
+
     except asyncio.CancelledError:
         # Shutdown cancels the task -> exit gracefully
         pass
 
     finally:
+        _pubsub = None
+        _subscribed.clear()
+
         # Cleanup pubsub subscription
         try:
-            await pubsub.unsubscribe(COMMENTS_CHANNEL)
+            await pubsub.unsubscribe()
         except Exception:
             pass
 
@@ -99,7 +261,7 @@ async def _subscriber_loop(on_event: Callable[[dict], Awaitable[None]]) -> None:
             pass
 
 
-async def start_comments_pubsub(on_event: Callable[[dict], Awaitable[None]]) -> None:
+async def start_comments_pubsub(on_event: Callable[[dict], Awaitable[int]]) -> None:
     """
     Start the background subscriber task once per backend process.
     """
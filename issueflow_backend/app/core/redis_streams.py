@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import json
+import re
+import time
+from typing import List, Optional, Tuple
+
+from redis.exceptions import ResponseError
+
+import app.core.redis_client as redis_mod
+from app.core.config import settings
+from app.core.redis_pubsub import room_of
+
+# One capped Redis Stream PER ROOM keeps recent comment events, so a client
+# that reconnects with ?since=<event_id> only gets what it missed:
+#   issueflow:comments:stream:<project_id>:<issue_id>
+COMMENTS_STREAM_PREFIX = "issueflow:comments:stream"
+
+# Redis stream ids look like "1700000000000-0"
+_EVENT_ID_RE = re.compile(r"^\d+-\d+$")
+
+# last id handed out by new_event_id() in this process: (ms, seq)
+_last_id: Tuple[int, int] = (0, 0)
+
+
+def room_stream(project_id: str, issue_id: str) -> str:
+    return f"{COMMENTS_STREAM_PREFIX}:{project_id}:{issue_id}"
+
+
+def _parse_id(event_id: str) -> Tuple[int, int]:
+    ms, seq = event_id.split("-", 1)
+    return (int(ms), int(seq))
+
+
+def event_id_after(event_id: str, cursor: str) -> bool:
+    # stream ids compare as (ms, seq), not as strings; unparseable -> True (keep it)
+    if not (_EVENT_ID_RE.match(event_id) and _EVENT_ID_RE.match(cursor)):
+        return True
+    return _parse_id(event_id) > _parse_id(cursor)
+
+
+def observe_event_id(event_id) -> None:
+    # keep new_event_id() above every stream id seen here
+    # (another instance's clock may run ahead of ours)
+    global _last_id
+    if isinstance(event_id, str) and _EVENT_ID_RE.match(event_id):
+        _last_id = max(_last_id, _parse_id(event_id))
+
+
+def new_event_id() -> Optional[str]:
+    """
+    A stream id made locally ("<ms>-<seq>", increasing within this process
+    and above every id observed), so an event can go to local sockets
+    before it is written to Redis.
+    None if Redis isn't configured (no stream to replay from).
+    """
+    global _last_id
+    if redis_mod.redis_client is None:
+        return None
+
+    ms = int(time.time() * 1000)
+    last_ms, last_seq = _last_id
+    _last_id = (ms, 0) if ms > last_ms else (last_ms, last_seq + 1)
+    return f"{_last_id[0]}-{_last_id[1]}"
+
+
+async def append_comment_event(payload: dict, event_id: Optional[str] = None) -> Optional[str]:
+    """
+    Append the event to its room's stream (trimmed to ~maxlen, with a TTL),
+    under `event_id` if given. Returns the stream id it got, or None if Redis
+    is unavailable. If the stream is already past `event_id` (another
+    instance wrote a later id) Redis picks the id instead.
+    """
+    if redis_mod.redis_client is None:
+        return None
+
+    room = room_of(payload)
+    if room is None:
+        return None
+
+    try:
+        data = json.dumps(payload)
+    except Exception:
+        return None
+
+    key = room_stream(*room)
+
+    # one round trip: XADD + EXPIRE
+    for stream_id in (event_id, "*") if event_id else ("*",):
+        pipe = redis_mod.redis_client.pipeline(transaction=False)
+        pipe.xadd(key, {"data": data}, id=stream_id, maxlen=settings.comment_stream_maxlen, approximate=True)
+        pipe.expire(key, settings.comment_stream_ttl_seconds)
+        try:
+            stored, _ = await pipe.execute()
+        except ResponseError:
+            if stream_id == "*":
+                raise
+            continue  # "ID ... equal or smaller than the target stream top item"
+        return stored
+    return None
+
+
+async def latest_event_id(project_id: str, issue_id: str) -> Optional[str]:
+    """
+    Id of the newest event in the room's stream (the cursor a fresh
+    snapshot corresponds to), or None if there is none.
+    """
+    if redis_mod.redis_client is None:
+        return None
+
+    rows = await redis_mod.redis_client.xrevrange(room_stream(project_id, issue_id), count=1)
+    return rows[0][0] if rows else None
+
+
+async def read_comment_events_since(project_id: str, issue_id: str, since: str) -> Optional[List[dict]]:
+    """
+    Events strictly after `since`, oldest first, each with "event_id".
+
+    Returns None when the cursor can't be honoured (invalid, Redis down,
+    stream expired, or already trimmed past it) -> caller sends a snapshot.
+    """
+    if redis_mod.redis_client is None:
+        return None
+
+    since = (since or "").strip()
+    if not _EVENT_ID_RE.match(since):
+        return None
+
+    key = room_stream(project_id, issue_id)
+
+    pipe = redis_mod.redis_client.pipeline(transaction=False)
+    pipe.xrange(key, count=1)
+    pipe.xrange(key, min=f"({since}", max="+")
+    oldest, rows = await pipe.execute()
+
+    if not oldest:
+        # stream expired / never written: we can't prove nothing was missed
+        return None
+
+    # Anything older than the oldest retained entry may have been trimmed
+    if _parse_id(since) < _parse_id(oldest[0][0]):
+        return None
+
+    events: List[dict] = []
+    for event_id, fields in rows:
+        try:
+            payload = json.loads(fields.get("data") or "")
+        except Exception:
+            continue
+        payload["event_id"] = event_id
+        events.append(payload)
+    return events
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import asyncio
 import hashlib
 import hmac
+import multiprocessing
+import os
 import secrets
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict
+from typing import Any, Callable, Dict
 from jose import jwt , JWTError
 from passlib.context import CryptContext
 
 
+from app.core import metrics
 from app.core.config import settings
 
 # Password hashing context (bcrypt).
@@ -26,6 +31,76 @@ def verify_password(password: str, hashed_password: str) -> bool:
     return pwd_context.verify(password, hashed_password)
 
 
+class PasswordHashBusy(Exception):
+    """Too many bcrypt jobs already waiting -> caller should answer 429."""
+
+
+# bcrypt is pure CPU (~hundreds of ms per call). Run it in a small dedicated
+# PROCESS pool so a login burst neither blocks the event loop nor eats the
+# threadpool that sync routes run on. Created lazily, once per process.
+_hash_pool: ProcessPoolExecutor | None = None
+# Jobs submitted and not finished yet (only touched from the event loop)
+_hash_in_flight = 0
+
+
+def _lower_priority() -> None:
+    # hash workers sharing a core with the API process lose to it:
+    # a login burst slows logins down, not every other request
+    os.nice(settings.password_hash_worker_nice)
+
+
+def _get_hash_pool() -> ProcessPoolExecutor:
+    global _hash_pool
+    if _hash_pool is None:
+        _hash_pool = ProcessPoolExecutor(
+            max_workers=settings.password_hash_workers,
+            # spawn: never fork a process that already runs an event loop + DB pools
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_lower_priority,
+        )
+    return _hash_pool
+
+
+def ensure_hash_capacity() -> None:
+    """
+    Admission limit: refuse instead of queueing without bound.
+    Also called up front by register/login, so a request that would get 429
+    anyway doesn't spend DB queries first.
+    """
+    if _hash_in_flight >= settings.password_hash_max_pending:
+        metrics.incr("auth.hash_rejected")
+        raise PasswordHashBusy()
+
+
+async def _run_hash_job(fn: Callable[..., Any], *args: Any) -> Any:
+    global _hash_in_flight
+
+    ensure_hash_capacity()
+    _hash_in_flight += 1
+    try:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_hash_pool(), fn, *args)
+    finally:
+        _hash_in_flight -= 1
+
+
+async def hash_password_async(password: str) -> str:
+    """hash_password() in the bcrypt worker pool (raises PasswordHashBusy)."""
+    return await _run_hash_job(hash_password, password)
+
+
+async def verify_password_async(password: str, hashed_password: str) -> bool:
+    """verify_password() in the bcrypt worker pool (raises PasswordHashBusy)."""
+    return await _run_hash_job(verify_password, password, hashed_password)
+
+
+def shutdown_hash_pool() -> None:
+    global _hash_pool
+    if _hash_pool is not None:
+        _hash_pool.shutdown(wait=False, cancel_futures=True)
+        _hash_pool = None
+
+
 def create_access_token(user_id: str) -> str:
     """
     Create short-lived JWT access token.
@@ -1,14 +1,18 @@
 from __future__ import annotations
 
+from uuid import UUID
+
 from fastapi import WebSocket
 from jose import JWTError
-from sqlmodel import Session, select
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
+from app.core import auth_cache
 from app.core.security import decode_token
 from app.models.user import User
 
 
-def get_current_user_ws(websocket: WebSocket, db: Session) -> User:
+async def get_current_user_ws(websocket: WebSocket, db: AsyncSession) -> User:
     # For WebSockets, FastAPI's HTTPBearer doesn't work.
     # So we pass token like: ws://.../comments?token=JWT
     token = websocket.query_params.get("token")
@@ -17,25 +21,47 @@ def get_current_user_ws(websocket: WebSocket, db: Session) -> User:
     if not token:
         raise ValueError("Missing token")
 
-    # Decode JWT using your existing decode_token() helper
-    try:
-        payload = decode_token(token)
-    except JWTError:
-        raise ValueError("Invalid token")
+    # Same process-local cache as get_current_user (token + user row)
+    cached = auth_cache.get_token(token)
+    if cached is not None:
+        user_id, exp = cached
+    else:
+        # Decode JWT using your existing decode_token() helper
+        try:
+            payload = decode_token(token)
+        except JWTError:
+            raise ValueError("Invalid token")
+
+        # Ensure this JWT is an ACCESS token (not refresh)
+        if payload.get("type") != "access":
+            raise ValueError("Invalid token type")
+
+        # "sub" holds the user id in your JWT
+        user_id = payload.get("sub")
+        if not user_id:
+            raise ValueError("Invalid token payload")
 
-    # Ensure this JWT is an ACCESS token (not refresh)
-    if payload.get("type") != "access":
-        raise ValueError("Invalid token type")
+        exp = payload.get("exp")
+        auth_cache.put_token(token, str(user_id), exp)
 
-    # "sub" holds the user id in your JWT
-    user_id = payload.get("sub")
-    if not user_id:
+    user = auth_cache.get_user(str(user_id))
+    if user is not None:
+        return user
+
+    # asyncpg binds uuid columns from UUID objects, not strings
+    try:
+        user_uuid = UUID(str(user_id))
+    except ValueError:
         raise ValueError("Invalid token payload")
 
     # Fetch the user from DB
-    user = db.exec(select(User).where(User.id == user_id)).first()
+    seen = auth_cache.generation()
+    user = (await db.exec(select(User).where(User.id == user_uuid))).first()
     if not user:
         raise ValueError("User not found")
 
+    if exp is not None:
+        auth_cache.put_user(user, exp, seen)
+
     # Return the authenticated user
     return user
@@ -1,3 +1,6 @@
+from sqlalchemy import inspect, text
+
+from app.core.config import settings
 from app.db.base import Base
 from app.db.session import engine
 
@@ -9,7 +12,70 @@ import app.models.issue
 import app.models.project_member  
 import app.models.project_invite
 import app.models.issue_comment  
+import app.models.project_issue_stats
+import app.models.activity
+import app.models.issue_transition
+import app.models.project_daily_stats
+import app.models.daily_stats_change
+import app.models.rollup_watermark
 
 def init_db():
     # Creates tables if they do not exist
     Base.metadata.create_all(bind=engine)
+    _ensure_columns()
+    _ensure_indexes()
+    if engine.dialect.name == "postgresql":
+        _ensure_search_columns()
+
+
+def _ensure_columns():
+    # Same problem for columns added to an existing model: ALTER TABLE ADD COLUMN.
+    # Only safe for nullable columns or ones with a server_default.
+    inspector = inspect(engine)
+    quote = engine.dialect.identifier_preparer
+    with engine.begin() as conn:
+        for table in Base.metadata.sorted_tables:
+            existing = {c["name"] for c in inspector.get_columns(table.name)}
+            for column in table.columns:
+                if column.name in existing:
+                    continue
+                ddl = (
+                    f"ALTER TABLE {quote.format_table(table)} "
+                    f"ADD COLUMN {quote.format_column(column)} {column.type.compile(dialect=engine.dialect)}"
+                )
+                if column.server_default is not None:
+                    ddl += f" DEFAULT {column.server_default.arg} NOT NULL"
+                conn.execute(text(ddl))
+
+
+def _ensure_indexes():
+    # create_all() skips tables that already exist, so indexes added to a
+    # model later would never reach an existing DB. Create the missing ones.
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(bind=engine, checkfirst=True)
+
+
+def _ensure_search_columns():
+    # Full-text search (Postgres only): generated tsvector columns, kept up to
+    # date by Postgres on every insert/update, + GIN indexes for @@ queries.
+    # Not on the SQLModel models on purpose: the ORM never reads/writes them.
+    lang = settings.search_language.replace("'", "")
+    statements = [
+        f"""
+        ALTER TABLE issue ADD COLUMN IF NOT EXISTS search_tsv tsvector
+        GENERATED ALWAYS AS (
+            setweight(to_tsvector('{lang}'::regconfig, coalesce(title, '')), 'A') ||
+            setweight(to_tsvector('{lang}'::regconfig, coalesce(description, '')), 'B')
+        ) STORED
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_issue_search_tsv ON issue USING GIN (search_tsv)",
+        f"""
+        ALTER TABLE issue_comments ADD COLUMN IF NOT EXISTS search_tsv tsvector
+        GENERATED ALWAYS AS (to_tsvector('{lang}'::regconfig, coalesce(body, ''))) STORED
+        """,
+        "CREATE INDEX IF NOT EXISTS ix_issue_comments_search_tsv ON issue_comments USING GIN (search_tsv)",
+    ]
+    with engine.begin() as conn:
+        for sql in statements:
+            conn.execute(text(sql))
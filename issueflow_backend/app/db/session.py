@@ -1,13 +1,66 @@
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
 from app.core.config import settings
 
 # Engine is the DB connection factory
 engine = create_engine(settings.database_url, echo=False, pool_pre_ping=True)
 
 
+def _async_database_url(url: str) -> str:
+    """
+    Same database as DATABASE_URL, but with an asyncio driver:
+      postgresql://...          -> postgresql+asyncpg://...
+      postgresql+psycopg2://... -> postgresql+asyncpg://...
+      sqlite:///...             -> sqlite+aiosqlite:///...
+    """
+    if url.startswith("postgres://"):
+        url = "postgresql://" + url[len("postgres://"):]
+
+    scheme, sep, rest = url.partition("://")
+    dialect = scheme.split("+", 1)[0]
+
+    if dialect == "postgresql":
+        return f"postgresql+asyncpg{sep}{rest}"
+    if dialect == "sqlite":
+        return f"sqlite+aiosqlite{sep}{rest}"
+    return url
+
+
+# Async engine: used by async routes so DB I/O never blocks the event loop
+# pool_size: a dashboard request runs its queries in parallel, one connection
+# each; connections beyond pool_size are opened and closed per use (slow).
+# (aiosqlite uses a NullPool, which takes no pool sizes)
+_async_url = _async_database_url(settings.database_url)
+_async_pool = (
+    {}
+    if _async_url.startswith("sqlite")
+    else {"pool_size": settings.async_db_pool_size, "max_overflow": settings.async_db_max_overflow}
+)
+async_engine = create_async_engine(_async_url, echo=False, pool_pre_ping=True, **_async_pool)
+
+# expire_on_commit=False: after commit we still read attributes
+# (lazy refresh is not allowed on an async session)
+AsyncSessionLocal = async_sessionmaker(
+    async_engine,
+    class_=AsyncSession,
+    expire_on_commit=False,
+)
+
+
 def get_db():
     """
     FastAPI dependency: provides one DB session per request.
     """
     with Session(engine) as session:
         yield session
+
+
+async def get_async_db():
+    """
+    FastAPI dependency: provides one async DB session per request.
+    Use it from `async def` routes.
+    """
+    async with AsyncSessionLocal() as session:
+        yield session
@@ -2,6 +2,7 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.db.init_db import init_db
+from app.db.session import async_engine
 
 from app.api.routes.auth import router as auth_router
 from app.api.routes.onboarding import router as onboarding_router
@@ -13,9 +14,16 @@ from app.api.routes.users import router as users_router
 from app.api.routes.comments import router as comments_router
 from app.api.routes.dashboard import router as dashboard_router
 from app.api.routes.comments_ws import router as comments_ws_router
+from app.api.routes.search import router as search_router
+from app.api.routes.activity import router as activity_router
+from app.api.routes.analytics import router as analytics_router
 
 import app.core.redis_client as redis_mod
-from app.core.redis_pubsub import start_comments_pubsub, stop_comments_pubsub
+from app.core import auth_cache, dashboard_cache, metrics
+from app.core.security import shutdown_hash_pool
+from app.core.redis_pubsub import register_channel_handler, start_comments_pubsub, stop_comments_pubsub
+from app.services.daily_stats_service import start_daily_stats_job, stop_daily_stats_job
+from app.services.project_purge import start_project_purger, stop_project_purger
 from app.websockets.comments_hub import rebroadcast_from_redis
 
 app = FastAPI(title="IssueFlow API")
@@ -39,14 +47,28 @@ async def on_startup():
 
     # 2) Start Redis subscriber loop for this instance
     #    Every event Redis receives -> rebroadcast to local WS clients
+    #    (+ auth cache invalidations from other instances)
+    register_channel_handler(auth_cache.AUTH_INVALIDATE_CHANNEL, auth_cache.on_invalidate_message)
     await start_comments_pubsub(rebroadcast_from_redis)
 
+    # 3) Background purge of soft-deleted (large) projects
+    await start_project_purger()
+
+    # 4) Daily per-project rollup for burndown / cumulative-flow charts
+    await start_daily_stats_job()
+
 @app.on_event("shutdown")
 async def on_shutdown():
+    await stop_daily_stats_job()
+    await stop_project_purger()
     # stop subscriber first
     await stop_comments_pubsub()
     # then close redis connection
     await redis_mod.close_redis()
+    # release pooled async DB connections
+    await async_engine.dispose()
+    # stop bcrypt worker processes
+    shutdown_hash_pool()
 
 # Routers
 app.include_router(auth_router)
@@ -59,6 +81,9 @@ app.include_router(users_router)
 app.include_router(comments_router)
 app.include_router(dashboard_router)
 app.include_router(comments_ws_router)
+app.include_router(search_router)
+app.include_router(activity_router)
+app.include_router(analytics_router)
 
 @app.get("/health")
 def health():
@@ -71,3 +96,13 @@ async def debug_redis():
         return {"ok": False, "message": "Redis not connected"}
     pong = await redis_mod.redis_client.ping()
     return {"ok": True, "ping": pong}
+
+# Debug endpoint: per-instance counters (e.g. pubsub received vs. delivered)
+# and latency histograms (publish -> redis receive -> socket write)
+@app.get("/debug/metrics")
+async def debug_metrics():
+    return {
+        "counters": metrics.counters(),
+        "histograms": metrics.histograms(),
+        "dashboard_cache": dashboard_cache.stats(),
+    }
@@ -0,0 +1,62 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import JSON, Column
+from sqlmodel import SQLModel, Field, Index
+
+
+class ActivityType(str, Enum):
+    comment_created = "comment_created"
+    issue_created = "issue_created"
+    status_changed = "status_changed"
+    assigned = "assigned"
+    issues_bulk_updated = "issues_bulk_updated"
+    issues_imported = "issues_imported"
+    invited = "invited"
+
+
+class ActivityEvent(SQLModel, table=True):
+    """
+    Fan-out-on-write feed: one row PER RECIPIENT, written in the same
+    transaction as the change. Everything a feed item shows is copied in
+    (issue key/title, actor name, comment body), so reads never join.
+
+    Rows are NOT append-only: the copies follow their source, so a comment
+    edit rewrites `body` on its rows and a comment / issue delete removes
+    them (no "edited" / "deleted" items are added). Issue key/title are not
+    followed: a renamed issue keeps its old title in older items.
+    """
+
+    __tablename__ = "activity_feed"
+
+    __table_args__ = (
+        # GET /activity pages: keyset on (created_at, id) per user
+        Index("ix_activity_user_created", "user_id", "created_at", "id"),
+        Index("ix_activity_user_type_created", "user_id", "type", "created_at", "id"),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    user_id: UUID = Field(nullable=False)  # recipient
+    project_id: UUID = Field(index=True, nullable=False)
+
+    type: ActivityType = Field(nullable=False)
+
+    actor_id: Optional[UUID] = Field(default=None)
+    actor_username: Optional[str] = Field(default=None)
+
+    # indexed: deleting an issue deletes its feed rows
+    issue_id: Optional[UUID] = Field(default=None, index=True)
+    issue_key: Optional[str] = Field(default=None)
+    issue_title: Optional[str] = Field(default=None)
+    # set for comment events: edits/deletes of the comment follow it here
+    comment_id: Optional[UUID] = Field(default=None, index=True)
+
+    body: Optional[str] = Field(default=None)
+    # per-type details, e.g. {"from": "todo", "to": "done"} or {"count": 120}
+    data: Optional[dict] = Field(default=None, sa_column=Column(JSON(none_as_null=True)))
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
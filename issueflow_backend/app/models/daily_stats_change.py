@@ -0,0 +1,22 @@
+from __future__ import annotations
+
+from datetime import datetime
+from uuid import UUID, uuid4
+
+from sqlmodel import SQLModel, Field
+
+
+class DailyStatsChange(SQLModel, table=True):
+    """
+    "This project's daily rollup changed" marker for changes that leave no
+    other trace the rollup job can find: an issue delete removes the issue
+    and its transitions. Written in the same transaction as the change;
+    the job recomputes the project from that day on, then prunes the
+    markers it has processed.
+    """
+
+    __tablename__ = "daily_stats_changes"
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    project_id: UUID = Field(nullable=False)
+    changed_at: datetime = Field(default_factory=datetime.utcnow, index=True)
@@ -5,7 +5,7 @@ from enum import Enum
 from typing import Optional
 from uuid import UUID, uuid4
 
-from sqlmodel import SQLModel, Field
+from sqlmodel import SQLModel, Field, Index
 
 
 class IssueType(str, Enum):
@@ -32,6 +32,22 @@ class Issue(SQLModel, table=True):
     - project_id: belongs to a project
     """
 
+    __table_args__ = (
+        # listing pages: filter by project (+ status / assignee), keyset on (sort col, id)
+        Index("ix_issue_project_updated", "project_id", "updated_at", "id"),
+        Index("ix_issue_project_created", "project_id", "created_at", "id"),
+        Index("ix_issue_project_status_updated", "project_id", "status", "updated_at"),
+        Index("ix_issue_project_assignee_updated", "project_id", "assignee_id", "updated_at"),
+        # daily rollup: "issues created since the watermark" across projects
+        Index("ix_issue_created", "created_at"),
+        # cycle-time report: "done issues completed in this window"
+        Index("ix_issue_project_status_completed", "project_id", "status", "completed_at"),
+        # home dashboard: "my issues" by recency / due date across every project
+        # (read in index order until the LIMIT, project filter applied on the way)
+        Index("ix_issue_assignee_updated", "assignee_id", "updated_at"),
+        Index("ix_issue_assignee_due", "assignee_id", "due_date"),
+    )
+
     id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     project_id: UUID = Field(index=True, nullable=False)
 
@@ -51,3 +67,13 @@ class Issue(SQLModel, table=True):
 
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
+
+    # denormalized: kept in step by create/delete comment (same transaction),
+    # repaired by `python -m app.commands.backfill_comments_count`
+    comments_count: int = Field(default=0, nullable=False, sa_column_kwargs={"server_default": "0"})
+
+    # denormalized from the status history (cycle-time analytics): first move
+    # to in_progress / last move to done, stamped in the same transaction as
+    # the transition row, repaired by `python -m app.commands.backfill_cycle_times`
+    started_at: Optional[datetime] = Field(default=None)
+    completed_at: Optional[datetime] = Field(default=None)
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 from uuid import UUID, uuid4
-from sqlmodel import SQLModel, Field
+from sqlmodel import SQLModel, Field, Index
 
 
 def utc_now() -> datetime:
@@ -11,6 +11,10 @@ def utc_now() -> datetime:
 
 class IssueComment(SQLModel, table=True):
     __tablename__ = "issue_comments"
+    __table_args__ = (
+        # keyset pagination: one issue's comments ordered by (created_at, id)
+        Index("ix_issue_comments_room_created", "project_id", "issue_id", "created_at", "id"),
+    )
 
     id: UUID = Field(default_factory=uuid4, primary_key=True, index=True)
     project_id: UUID = Field(index=True, nullable=False)
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID, uuid4
+
+from sqlmodel import SQLModel, Field, Index
+
+
+class TransitionField(str, Enum):
+    status = "status"
+    priority = "priority"
+    assignee = "assignee"
+
+
+class IssueTransition(SQLModel, table=True):
+    """
+    Append-only history of issue changes: one row per changed field,
+    written in the same transaction as the update (single PATCH and bulk).
+    Values are stored as text (enum value / user id, NULL = unset).
+    Cycle/lead time analytics read the status rows.
+    """
+
+    __tablename__ = "issue_transitions"
+
+    __table_args__ = (
+        # analytics: "status -> done in this window" for one project
+        Index("ix_transition_project_field_to_created", "project_id", "field", "to_value", "created_at"),
+        # daily rollup: "changes since the watermark" across projects
+        Index("ix_transition_created", "created_at"),
+    )
+
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    project_id: UUID = Field(nullable=False)
+    issue_id: UUID = Field(index=True, nullable=False)
+
+    field: TransitionField = Field(nullable=False)
+    from_value: Optional[str] = Field(default=None)
+    to_value: Optional[str] = Field(default=None)
+
+    actor_id: Optional[UUID] = Field(default=None)
+    created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -22,3 +22,7 @@ class Project(SQLModel,table = True):
     created_at: datetime = Field(default_factory=datetime.utcnow)
     updated_at: datetime = Field(default_factory=datetime.utcnow)
 
+    # set when a (large) project is deleted: hidden right away,
+    # rows purged in the background (app/services/project_purge.py)
+    deleted_at: Optional[datetime] = Field(default=None, index=True)
+
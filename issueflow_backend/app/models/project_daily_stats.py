@@ -0,0 +1,30 @@
+from __future__ import annotations
+
+from datetime import date
+from uuid import UUID
+
+from sqlmodel import SQLModel, Field
+
+
+class ProjectDailyStats(SQLModel, table=True):
+    """
+    End-of-day (UTC) snapshot per project for burndown / cumulative-flow
+    charts: how many issues were in each status, plus how many were created
+    and resolved (moved to done) that day.
+
+    Maintained by the daily rollup job (app/services/daily_stats_service.py),
+    which recomputes only projects/days that changed since its watermark.
+    Days without a row are unchanged: readers carry the previous row forward.
+    """
+
+    __tablename__ = "project_daily_stats"
+
+    project_id: UUID = Field(primary_key=True)
+    day: date = Field(primary_key=True)
+
+    todo: int = Field(default=0, nullable=False)
+    in_progress: int = Field(default=0, nullable=False)
+    done: int = Field(default=0, nullable=False)
+
+    created: int = Field(default=0, nullable=False)
+    resolved: int = Field(default=0, nullable=False)
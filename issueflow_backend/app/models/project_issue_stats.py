@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+from uuid import UUID
+
+from sqlmodel import SQLModel, Field
+
+from app.models.issue import IssuePriority, IssueStatus
+
+
+class ProjectIssueStats(SQLModel, table=True):
+    """
+    Issue counts per project, one row per (status, priority) bucket
+    (at most 9 rows per project). Dashboards sum these instead of scanning
+    `issue`; every write path that changes issues applies a +/- delta in the
+    same transaction (app/services/issue_stats_service.py).
+    """
+
+    __tablename__ = "project_issue_stats"
+
+    project_id: UUID = Field(primary_key=True)
+    status: IssueStatus = Field(primary_key=True)
+    priority: IssuePriority = Field(primary_key=True)
+    count: int = Field(default=0, nullable=False)
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlmodel import SQLModel, Field
+
+
+class RollupWatermark(SQLModel, table=True):
+    """
+    How far a rollup job has processed: changes stamped at or before
+    `processed_until` are already in its table. One row per job name.
+    """
+
+    __tablename__ = "rollup_watermarks"
+
+    name: str = Field(primary_key=True, max_length=64)
+    processed_until: datetime = Field(nullable=False)
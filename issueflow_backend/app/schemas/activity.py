@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Optional
+from pydantic import BaseModel
+
+
+class ActivityEventResponse(BaseModel):
+    id: str
+    type: str
+    project_id: str
+    actor_id: Optional[str] = None
+    actor_username: Optional[str] = None
+    issue_id: Optional[str] = None
+    issue_key: Optional[str] = None
+    issue_title: Optional[str] = None
+    comment_id: Optional[str] = None
+    body: Optional[str] = None
+    data: Optional[Dict[str, Any]] = None
+    created_at: datetime
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from datetime import date
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class DurationSummary(BaseModel):
+    # hours
+    p50: float
+    p75: float
+    p85: float
+    p95: float
+    mean: float
+    count: int
+
+
+class ThroughputPoint(BaseModel):
+    start: date
+    count: int
+
+
+class CycleTimeResponse(BaseModel):
+    project_id: str
+    since: date
+    until: date
+    bucket: str  # "day" | "week"
+    completed: int
+    lead_time_hours: Optional[DurationSummary] = None
+    cycle_time_hours: Optional[DurationSummary] = None
+    throughput: List[ThroughputPoint]
+
+
+class BurndownPoint(BaseModel):
+    day: date
+    remaining: int  # todo + in_progress at the end of the day
+    completed: int  # done
+    scope: int  # all issues
+    created: int
+    resolved: int
+
+
+class BurndownResponse(BaseModel):
+    project_id: str
+    since: date
+    until: date
+    series: List[BurndownPoint]
+
+
+class CumulativeFlowPoint(BaseModel):
+    day: date
+    todo: int
+    in_progress: int
+    done: int
+
+
+class CumulativeFlowResponse(BaseModel):
+    project_id: str
+    since: date
+    until: date
+    series: List[CumulativeFlowPoint]
@@ -27,6 +27,7 @@ class IssueResponse(BaseModel):
     priority: IssuePriority
     status: IssueStatus
     due_date: date | None
+    comments_count: int = 0
 
 
 class IssueUpdateRequest(BaseModel):
@@ -39,10 +40,52 @@ class IssueUpdateRequest(BaseModel):
     reporter_id: Optional[UUID] = None
     assignee_id: Optional[UUID] = None
 
+class IssueBulkChanges(BaseModel):
+    type: Optional[IssueType] = None
+    priority: Optional[IssuePriority] = None
+    status: Optional[IssueStatus] = None
+    due_date: Optional[date] = None
+    reporter_id: Optional[UUID] = None
+    assignee_id: Optional[UUID] = None
+
+
+class IssueBulkFilter(BaseModel):
+    status: Optional[IssueStatus] = None
+    priority: Optional[IssuePriority] = None
+    type: Optional[IssueType] = None
+    reporter_id: Optional[UUID] = None
+    assignee_id: Optional[UUID] = None
+    unassigned: bool = False
+
+
+class IssueBulkUpdateRequest(BaseModel):
+    # exactly one of issue_ids / filter
+    issue_ids: Optional[list[UUID]] = None
+    filter: Optional[IssueBulkFilter] = None
+    updates: IssueBulkChanges
+
+
+class IssueBulkUpdateResponse(BaseModel):
+    updated: int
+    issue_ids: list[str]
+
+
 class UserMini(BaseModel):
     id: str
     username: str
 
 class IssueEditResponse(IssueResponse):
     reporter: UserMini
-    assignee: Optional[UserMini] = None
\ No newline at end of file
+    assignee: Optional[UserMini] = None
+
+
+class IssueImportError(BaseModel):
+    row: int
+    error: str
+
+
+class IssueImportResponse(BaseModel):
+    imported: int
+    failed: int
+    errors: list[IssueImportError]
+    errors_truncated: bool = False
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import List, Optional
+from pydantic import BaseModel
+
+
+class SearchHit(BaseModel):
+    type: str  # "issue" | "comment"
+    project_id: str
+    issue_id: str
+    issue_key: str
+    title: str
+    comment_id: Optional[str] = None
+    snippet: Optional[str] = None
+    rank: float
+
+
+class SearchResponse(BaseModel):
+    query: str
+    results: List[SearchHit]
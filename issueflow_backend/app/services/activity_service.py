@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import delete, insert, tuple_, update
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.pagination import decode_created_cursor, encode_created_cursor
+from app.models.activity import ActivityEvent, ActivityType
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.user import User
+
+# Fan-out on write: record_* add one feed row per recipient to the caller's
+# session; they become visible with the caller's commit (no commit here).
+# The rows are mutable: *_comment_events rewrite / remove them in place
+# when the comment changes (see ActivityEvent).
+
+
+def _recipients_stmt(project_id):
+    # every member (+ the owner, in case an old project has no owner member row)
+    return select(ProjectMember.user_id).where(ProjectMember.project_id == project_id).union(
+        select(Project.owner_id).where(Project.id == project_id)
+    )
+
+
+def _event_rows(recipients, project_id, type_: ActivityType, actor: Optional[User], **fields: Any) -> List[dict]:
+    now = datetime.utcnow()
+    base = {
+        "project_id": project_id,
+        "type": type_,
+        "actor_id": actor.id if actor else None,
+        "actor_username": actor.username if actor else None,
+        "issue_id": None,
+        "issue_key": None,
+        "issue_title": None,
+        "comment_id": None,
+        "body": None,
+        "data": None,
+        "created_at": now,
+        **fields,
+    }
+    return [{**base, "id": uuid4(), "user_id": uid} for uid in recipients]
+
+
+def record_project_event(db: Session, project_id, type_: ActivityType, actor: Optional[User], **fields: Any) -> None:
+    recipients = [uid for (uid,) in db.exec(_recipients_stmt(project_id)).all()]
+    rows = _event_rows(recipients, project_id, type_, actor, **fields)
+    if rows:
+        db.execute(insert(ActivityEvent), rows)
+
+
+async def record_project_event_async(
+    db: AsyncSession, project_id, type_: ActivityType, actor: Optional[User], **fields: Any
+) -> None:
+    recipients = [uid for (uid,) in (await db.exec(_recipients_stmt(project_id))).all()]
+    rows = _event_rows(recipients, project_id, type_, actor, **fields)
+    if rows:
+        await db.execute(insert(ActivityEvent), rows)
+
+
+def record_user_event(db: Session, user_id, project_id, type_: ActivityType, actor: Optional[User], **fields: Any) -> None:
+    # a single recipient (e.g. the invited user)
+    db.execute(insert(ActivityEvent), _event_rows([user_id], project_id, type_, actor, **fields))
+
+
+async def update_comment_events(db: AsyncSession, comment_id: UUID, body: str) -> None:
+    # every recipient's copy of the comment, in place (no new feed item)
+    await db.exec(update(ActivityEvent).where(ActivityEvent.comment_id == comment_id).values(body=body))
+
+
+async def delete_comment_events(db: AsyncSession, comment_id: UUID) -> None:
+    await db.exec(delete(ActivityEvent).where(ActivityEvent.comment_id == comment_id))
+
+
+def _feed_stmt(user_id, types: Optional[List[ActivityType]] = None):
+    # rows of soft-deleted projects stay until the purger reaches them
+    purging = select(Project.id).where(Project.deleted_at.is_not(None))
+    stmt = select(ActivityEvent).where(ActivityEvent.user_id == user_id, ActivityEvent.project_id.not_in(purging))
+    if types:
+        stmt = stmt.where(ActivityEvent.type.in_(types))
+    return stmt.order_by(ActivityEvent.created_at.desc(), ActivityEvent.id.desc())
+
+
+def latest_events_stmt(user_id, types: Optional[List[ActivityType]], limit: int):
+    return _feed_stmt(user_id, types).limit(limit)
+
+
+async def list_activity_page(
+    db: AsyncSession,
+    user: User,
+    limit: int,
+    cursor: Optional[str] = None,
+    types: Optional[List[ActivityType]] = None,
+) -> tuple[list[ActivityEvent], Optional[str]]:
+    """
+    The user's feed, newest first, keyset-paginated on (created_at, id):
+    one index range scan on ix_activity_user_created, no joins.
+    """
+    stmt = _feed_stmt(user.id, types)
+    if cursor:
+        stmt = stmt.where(tuple_(ActivityEvent.created_at, ActivityEvent.id) < decode_created_cursor(cursor))
+
+    rows = list((await db.exec(stmt.limit(limit + 1))).all())
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_created_cursor(rows[-1].created_at, rows[-1].id)
+    return rows, next_cursor
@@ -2,11 +2,13 @@ from datetime import datetime
 from uuid import UUID
 
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.core.config import settings
 from app.core.security import (
-    hash_password,
-    verify_password,
+    ensure_hash_capacity,
+    hash_password_async,
+    verify_password_async,
     create_access_token,
     generate_refresh_token,
     hash_refresh_token,
@@ -15,57 +17,74 @@ from app.models.user import User
 from app.models.refresh_token import RefreshToken
 
 
-def register_user(db: Session, email: str, password: str, username: str) -> User:
+# register/login are async: bcrypt runs in the worker pool
+# (may raise PasswordHashBusy when it is saturated)
+async def register_user(db: AsyncSession, email: str, password: str, username: str) -> User:
+    ensure_hash_capacity()
     email_norm = email.strip().lower()
     username_norm = username.strip()
 
-    existing_email = db.exec(select(User).where(User.email == email_norm)).first()
+    existing_email = (await db.exec(select(User).where(User.email == email_norm))).first()
     if existing_email:
         raise ValueError("Email already registered")
 
-    existing_username = db.exec(select(User).where(User.username == username_norm)).first()
+    existing_username = (await db.exec(select(User).where(User.username == username_norm))).first()
     if existing_username:
         raise ValueError("Username already taken")
 
     user = User(
         email=email_norm,
         username=username_norm,
-        password_hash=hash_password(password),
+        password_hash=await hash_password_async(password),
     )
     db.add(user)
-    db.commit()
-    db.refresh(user)
+    await db.commit()
+    await db.refresh(user)
     return user
 
 
-def login_user(db: Session, email: str, password: str) -> User:
-    user = db.exec(select(User).where(User.email == email)).first()
+async def login_user(db: AsyncSession, email: str, password: str) -> User:
+    ensure_hash_capacity()
+    user = (await db.exec(select(User).where(User.email == email))).first()
     if not user or not user.password_hash:
         raise ValueError("Invalid email or password")
 
-    if not verify_password(password, user.password_hash):
+    if not await verify_password_async(password, user.password_hash):
         raise ValueError("Invalid email or password")
 
     return user
 
 
-def issue_tokens(db: Session, user: User) -> dict:
-    access = create_access_token(str(user.id))
-
+def _new_refresh_token(user: User) -> tuple[str, RefreshToken]:
     raw_refresh = generate_refresh_token()
-    refresh_hash = hash_refresh_token(raw_refresh)
-
     rt = RefreshToken(
         user_id=user.id,
-        token_hash=refresh_hash,
+        token_hash=hash_refresh_token(raw_refresh),
         expires_at=RefreshToken.build_expiry(settings.refresh_token_expire_days),
     )
+    return raw_refresh, rt
+
+
+def issue_tokens(db: Session, user: User) -> dict:
+    access = create_access_token(str(user.id))
+
+    raw_refresh, rt = _new_refresh_token(user)
     db.add(rt)
     db.commit()
 
     return {"access_token": access, "refresh_token": raw_refresh}
 
 
+async def issue_tokens_async(db: AsyncSession, user: User) -> dict:
+    access = create_access_token(str(user.id))
+
+    raw_refresh, rt = _new_refresh_token(user)
+    db.add(rt)
+    await db.commit()
+
+    return {"access_token": access, "refresh_token": raw_refresh}
+
+
 def refresh_access_token(db: Session, raw_refresh_token: str) -> str:
     token_hash = hash_refresh_token(raw_refresh_token)
 
@@ -1,51 +1,71 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from typing import Optional
 from uuid import UUID
 
-from sqlmodel import Session, select
+from sqlalchemy import tuple_, update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
 
 from app.models.project import Project
 from app.models.project_member import ProjectMember
 from app.models.issue import Issue
 from app.models.user import User
 from app.models.issue_comment import IssueComment
+from app.models.activity import ActivityType
+from app.core.dashboard_cache import bump_project_versions_async
+from app.core.pagination import decode_created_cursor, encode_created_cursor
+from app.services.activity_service import delete_comment_events, record_project_event_async, update_comment_events
 
 
-def _ensure_project_access(db: Session, project_id: UUID, user: User) -> None:
-    project = db.exec(select(Project).where(Project.id == project_id)).first()
+def _utc_now() -> datetime:
+    # Columns are "timestamp without time zone": store naive UTC.
+    # (asyncpg rejects tz-aware values for these columns; psycopg2 used to drop the offset)
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+async def _ensure_project_access(db: AsyncSession, project_id: UUID, user: User) -> None:
+    project = (await db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None)))).first()
     if not project:
         raise ValueError("Project not found")
 
     if project.owner_id == user.id:
         return
 
-    m = db.exec(
-        select(ProjectMember).where(
-            ProjectMember.project_id == project.id,
-            ProjectMember.user_id == user.id,
+    m = (
+        await db.exec(
+            select(ProjectMember).where(
+                ProjectMember.project_id == project.id,
+                ProjectMember.user_id == user.id,
+            )
         )
     ).first()
     if not m:
         raise ValueError("You do not have access to this project")
 
 
-def _ensure_issue_in_project(db: Session, project_id: UUID, issue_id: UUID) -> None:
-    issue = db.exec(
-        select(Issue).where(Issue.id == issue_id, Issue.project_id == project_id)
+async def _ensure_issue_in_project(db: AsyncSession, project_id: UUID, issue_id: UUID) -> Issue:
+    issue = (
+        await db.exec(
+            select(Issue).where(Issue.id == issue_id, Issue.project_id == project_id)
+        )
     ).first()
     if not issue:
         raise ValueError("Issue not found")
+    return issue
 
 
-def _ensure_comment_in_issue(
-    db: Session, project_id: UUID, issue_id: UUID, comment_id: UUID
+async def _ensure_comment_in_issue(
+    db: AsyncSession, project_id: UUID, issue_id: UUID, comment_id: UUID
 ) -> IssueComment:
-    c = db.exec(
-        select(IssueComment).where(
-            IssueComment.id == comment_id,
-            IssueComment.project_id == project_id,
-            IssueComment.issue_id == issue_id,
+    c = (
+        await db.exec(
+            select(IssueComment).where(
+                IssueComment.id == comment_id,
+                IssueComment.project_id == project_id,
+                IssueComment.issue_id == issue_id,
+            )
         )
     ).first()
     if not c:
@@ -53,29 +73,97 @@ def _ensure_comment_in_issue(
     return c
 
 
+# access check only: user can see this project's realtime events
+async def ensure_project_access(db: AsyncSession, project_id: UUID, user: User) -> None:
+    await _ensure_project_access(db, project_id, user)
+
+
+# access check only (no rows loaded): user can see this issue's comments
+async def ensure_issue_access(db: AsyncSession, project_id: UUID, issue_id: UUID, user: User) -> None:
+    await _ensure_project_access(db, project_id, user)
+    await _ensure_issue_in_project(db, project_id, issue_id)
+
+
 # get all comments for an issue
-def list_comments(db: Session, project_id: UUID, issue_id: UUID, user: User) -> list[IssueComment]:
-    _ensure_project_access(db, project_id, user)
-    _ensure_issue_in_project(db, project_id, issue_id)
-
-    rows = db.exec(
-        select(IssueComment)
-        .where(IssueComment.project_id == project_id, IssueComment.issue_id == issue_id)
-        .order_by(IssueComment.created_at.asc())
+async def list_comments(
+    db: AsyncSession, project_id: UUID, issue_id: UUID, user: User
+) -> list[IssueComment]:
+    await ensure_issue_access(db, project_id, issue_id, user)
+
+    rows = (
+        await db.exec(
+            select(IssueComment)
+            .where(IssueComment.project_id == project_id, IssueComment.issue_id == issue_id)
+            .order_by(IssueComment.created_at.asc(), IssueComment.id.asc())
+        )
     ).all()
     return list(rows)
 
 
+# one page of comments (newest page first, rows oldest -> newest inside it)
+async def list_comments_page(
+    db: AsyncSession,
+    project_id: UUID,
+    issue_id: UUID,
+    user: User,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> tuple[list[IssueComment], Optional[str]]:
+    """
+    Keyset pagination on (created_at, id) (index ix_issue_comments_room_created).
+    - no cursor -> the latest `limit` comments
+    - cursor    -> the `limit` comments just OLDER than it ("load older")
+    Returns (rows in chronological order, cursor for the next older page or None).
+    """
+    await ensure_issue_access(db, project_id, issue_id, user)
+
+    stmt = select(IssueComment).where(
+        IssueComment.project_id == project_id,
+        IssueComment.issue_id == issue_id,
+    )
+    if cursor:
+        created_at, comment_id = decode_created_cursor(cursor)
+        stmt = stmt.where(tuple_(IssueComment.created_at, IssueComment.id) < (created_at, comment_id))
+
+    # one extra row tells us whether there is an older page
+    rows = list(
+        (
+            await db.exec(
+                stmt.order_by(IssueComment.created_at.desc(), IssueComment.id.desc()).limit(limit + 1)
+            )
+        ).all()
+    )
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_created_cursor(rows[-1].created_at, rows[-1].id)
+
+    rows.reverse()
+    return rows, next_cursor
+
+
+async def _bump_comments_count(db: AsyncSession, issue_id: UUID, delta: int) -> None:
+    # single UPDATE in the caller's transaction (no read-modify-write race)
+    await db.exec(
+        update(Issue)
+        .where(Issue.id == issue_id)
+        .values(comments_count=Issue.comments_count + delta)
+    )
+
+
 # create a new comment for an issue
-def create_comment(db: Session, project_id: UUID, issue_id: UUID, user: User, body: str) -> IssueComment:
-    _ensure_project_access(db, project_id, user)
-    _ensure_issue_in_project(db, project_id, issue_id)
+async def create_comment(
+    db: AsyncSession, project_id: UUID, issue_id: UUID, user: User, body: str
+) -> IssueComment:
+    await _ensure_project_access(db, project_id, user)
+    issue = await _ensure_issue_in_project(db, project_id, issue_id)
 
     text = (body or "").strip()
     if not text:
         raise ValueError("Comment body cannot be empty")
 
-    now = datetime.now(timezone.utc)
+    now = _utc_now()
 
     c = IssueComment(
         project_id=project_id,
@@ -88,24 +176,37 @@ def create_comment(db: Session, project_id: UUID, issue_id: UUID, user: User, bo
         updated_at=now,
     )
     db.add(c)
-    db.commit()
-    db.refresh(c)
+    await _bump_comments_count(db, issue_id, 1)
+    await record_project_event_async(
+        db,
+        project_id,
+        ActivityType.comment_created,
+        user,
+        issue_id=issue_id,
+        issue_key=issue.key,
+        issue_title=issue.title,
+        comment_id=c.id,
+        body=text,
+    )
+    await db.commit()
+    await bump_project_versions_async(project_id)
+    await db.refresh(c)
     return c
 
 
 # edit comment
-def edit_comment(
-    db: Session,
+async def edit_comment(
+    db: AsyncSession,
     project_id: UUID,
     issue_id: UUID,
     comment_id: UUID,
     user: User,
     body: str,
 ) -> IssueComment:
-    _ensure_project_access(db, project_id, user)
-    _ensure_issue_in_project(db, project_id, issue_id)
+    await _ensure_project_access(db, project_id, user)
+    await _ensure_issue_in_project(db, project_id, issue_id)
 
-    c = _ensure_comment_in_issue(db, project_id, issue_id, comment_id)
+    c = await _ensure_comment_in_issue(db, project_id, issue_id, comment_id)
 
     # author-only edit
     if str(c.author_id) != str(user.id):
@@ -117,30 +218,35 @@ def edit_comment(
 
     c.body = text
     c.edited = True
-    c.updated_at = datetime.now(timezone.utc)
+    c.updated_at = _utc_now()
 
     db.add(c)
-    db.commit()
-    db.refresh(c)
+    await update_comment_events(db, c.id, text)
+    await db.commit()
+    await bump_project_versions_async(project_id)
+    await db.refresh(c)
     return c
 
 
 #  delete comment
-def delete_comment(
-    db: Session,
+async def delete_comment(
+    db: AsyncSession,
     project_id: UUID,
     issue_id: UUID,
     comment_id: UUID,
     user: User,
 ) -> None:
-    _ensure_project_access(db, project_id, user)
-    _ensure_issue_in_project(db, project_id, issue_id)
+    await _ensure_project_access(db, project_id, user)
+    await _ensure_issue_in_project(db, project_id, issue_id)
 
-    c = _ensure_comment_in_issue(db, project_id, issue_id, comment_id)
+    c = await _ensure_comment_in_issue(db, project_id, issue_id, comment_id)
 
     # author-only delete
     if str(c.author_id) != str(user.id):
         raise ValueError("You are not allowed to delete this comment")
 
-    db.delete(c)
-    db.commit()
+    await db.delete(c)
+    await _bump_comments_count(db, issue_id, -1)
+    await delete_comment_events(db, c.id)
+    await db.commit()
+    await bump_project_versions_async(project_id)
@@ -0,0 +1,358 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, Optional
+from uuid import UUID
+
+import numpy as np
+from sqlalchemy import String, cast, delete, func, insert
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import metrics
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.issue import Issue, IssueStatus
+from app.models.daily_stats_change import DailyStatsChange
+from app.models.issue_transition import IssueTransition, TransitionField
+from app.models.project import Project
+from app.models.project_daily_stats import ProjectDailyStats
+from app.models.project_member import ProjectMember
+from app.models.rollup_watermark import RollupWatermark
+from app.models.user import User
+
+# Daily per-project rollup (project_daily_stats) for burndown / CFD charts.
+#
+# A project's rows are recomputed from its first CHANGED day up to today:
+# the job finds projects with issues created / status transitions / change
+# markers (daily_stats_changes, e.g. issue deletes) stamped after its
+# watermark, so untouched projects and days are never re-read.
+#
+# Recompute walks back from the current counts: end of day D = now minus
+# everything that happened after D (creations + status moves, grouped per
+# day in SQL). Only rows from the changed day on depend on that, which is
+# what makes the incremental update exact. A deleted issue disappears from
+# the day of its deletion on (its marker triggers that recompute); older
+# days keep it (history).
+
+logger = logging.getLogger(__name__)
+
+WATERMARK = "project_daily_stats"
+_EPOCH = datetime(1970, 1, 1)
+
+STATUSES = [s.value for s in IssueStatus]  # column order in the arrays below
+_COL = {s: i for i, s in enumerate(STATUSES)}
+
+_task: Optional[asyncio.Task] = None
+
+
+def mark_changed(db: Session, project_id: UUID) -> None:
+    # for changes the job can't see otherwise (no commit here)
+    db.add(DailyStatsChange(project_id=project_id))
+
+
+def _utc_today() -> date:
+    return datetime.utcnow().date()
+
+
+def _as_date(value) -> date:
+    # func.date(): a date on Postgres, 'YYYY-MM-DD' text on SQLite
+    return value if isinstance(value, date) else date.fromisoformat(str(value))
+
+
+async def recompute_project(db: AsyncSession, project_id: UUID, first_day: date, today: Optional[date] = None) -> int:
+    """
+    Rewrite the project's rows for first_day..today (no commit here).
+    Returns how many days were written.
+    """
+    today = today or _utc_today()
+    if first_day > today:
+        return 0
+    n_days = (today - first_day).days + 1
+    start = datetime.combine(first_day, time.min)
+
+    current = np.zeros(len(STATUSES), dtype=np.int64)
+    for status, n in (
+        await db.exec(select(Issue.status, func.count()).where(Issue.project_id == project_id).group_by(Issue.status))
+    ).all():
+        current[_COL[status.value]] = n
+
+    # per day: net change of each status count, created, resolved
+    delta = np.zeros((n_days, len(STATUSES)), dtype=np.int64)
+    created = np.zeros(n_days, dtype=np.int64)
+    resolved = np.zeros(n_days, dtype=np.int64)
+
+    moved_day = func.date(IssueTransition.created_at)
+    moves = (
+        await db.exec(
+            select(moved_day, IssueTransition.from_value, IssueTransition.to_value, func.count())
+            .where(
+                IssueTransition.project_id == project_id,
+                IssueTransition.field == TransitionField.status,
+                IssueTransition.created_at >= start,
+            )
+            .group_by(moved_day, IssueTransition.from_value, IssueTransition.to_value)
+        )
+    ).all()
+    for day, from_value, to_value, n in moves:
+        i = (_as_date(day) - first_day).days
+        if not 0 <= i < n_days or from_value not in _COL or to_value not in _COL:
+            continue
+        delta[i, _COL[from_value]] -= n
+        delta[i, _COL[to_value]] += n
+        if to_value == IssueStatus.done.value:
+            resolved[i] += n
+
+    # an issue is born in the status it had before its first move
+    # (no moves: its current status)
+    first_status = (
+        select(IssueTransition.from_value)
+        .where(IssueTransition.issue_id == Issue.id, IssueTransition.field == TransitionField.status)
+        .order_by(IssueTransition.created_at)
+        .limit(1)
+        .scalar_subquery()
+    )
+    created_day = func.date(Issue.created_at)
+    initial = func.coalesce(first_status, cast(Issue.status, String))
+    births = (
+        await db.exec(
+            select(created_day, initial, func.count())
+            .where(Issue.project_id == project_id, Issue.created_at >= start)
+            .group_by(created_day, initial)
+        )
+    ).all()
+    for day, status, n in births:
+        i = (_as_date(day) - first_day).days
+        if not 0 <= i < n_days:
+            continue
+        created[i] += n
+        if status in _COL:
+            delta[i, _COL[status]] += n
+
+    # end of day i = current - everything after day i
+    after = np.cumsum(delta[::-1], axis=0)[::-1] - delta
+    counts = np.maximum(current - after, 0)  # pre-history issues can make old days inconsistent
+
+    await db.exec(
+        delete(ProjectDailyStats).where(ProjectDailyStats.project_id == project_id, ProjectDailyStats.day >= first_day)
+    )
+    await db.execute(
+        insert(ProjectDailyStats),
+        [
+            {
+                "project_id": project_id,
+                "day": first_day + timedelta(days=i),
+                **{s: int(counts[i, c]) for s, c in _COL.items()},
+                "created": int(created[i]),
+                "resolved": int(resolved[i]),
+            }
+            for i in range(n_days)
+        ],
+    )
+    return n_days
+
+
+async def _changed_projects(db: AsyncSession, since: datetime) -> Dict[UUID, date]:
+    # project -> first day with a change stamped after `since`
+    live = select(Project.id).where(Project.deleted_at.is_(None))
+    queries = [
+        select(Issue.project_id, func.min(Issue.created_at))
+        .where(Issue.created_at > since, Issue.project_id.in_(live))
+        .group_by(Issue.project_id),
+        select(IssueTransition.project_id, func.min(IssueTransition.created_at))
+        .where(
+            IssueTransition.created_at > since,
+            IssueTransition.field == TransitionField.status,
+            IssueTransition.project_id.in_(live),
+        )
+        .group_by(IssueTransition.project_id),
+        select(DailyStatsChange.project_id, func.min(DailyStatsChange.changed_at))
+        .where(DailyStatsChange.changed_at > since, DailyStatsChange.project_id.in_(live))
+        .group_by(DailyStatsChange.project_id),
+    ]
+    changed: Dict[UUID, date] = {}
+    for stmt in queries:
+        for project_id, first in (await db.exec(stmt)).all():
+            day = first.date()
+            changed[project_id] = min(day, changed.get(project_id, day))
+    return changed
+
+
+async def _lock_watermark(db: AsyncSession) -> Optional[RollupWatermark]:
+    """
+    The watermark row, locked until `db` commits: one instance runs the
+    rollup at a time, the others skip the round. Created on first use
+    (at the epoch: the first run covers all history).
+    """
+    stmt = select(RollupWatermark).where(RollupWatermark.name == WATERMARK).with_for_update(skip_locked=True)
+    wm = (await db.exec(stmt)).first()
+    if wm is not None:
+        return wm
+
+    exists = (await db.exec(select(RollupWatermark.name).where(RollupWatermark.name == WATERMARK))).first()
+    if exists:
+        return None  # locked by another instance
+    db.add(RollupWatermark(name=WATERMARK, processed_until=_EPOCH))
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        return None
+    return (await db.exec(stmt)).first()
+
+
+async def advance_watermark(db: AsyncSession, processed_until: datetime) -> None:
+    # never moves back (no commit here)
+    wm = (await db.exec(select(RollupWatermark).where(RollupWatermark.name == WATERMARK))).first()
+    if wm is None:
+        db.add(RollupWatermark(name=WATERMARK, processed_until=processed_until))
+    elif processed_until > wm.processed_until:
+        wm.processed_until = processed_until
+        db.add(wm)
+
+
+async def run_rollup() -> int:
+    """
+    One pass: recompute the projects that changed since the watermark.
+    Returns how many projects were recomputed.
+    """
+    async with AsyncSessionLocal() as lock_db, AsyncSessionLocal() as db:
+        wm = await _lock_watermark(lock_db)
+        if wm is None:
+            return 0
+
+        # rows stamped in the last few seconds may belong to transactions
+        # not committed yet: leave them to the next pass
+        until = datetime.utcnow() - timedelta(seconds=settings.daily_stats_lag_seconds)
+        today = _utc_today()
+
+        changed = await _changed_projects(db, wm.processed_until)
+        for project_id, first_day in changed.items():
+            days = await recompute_project(db, project_id, first_day, today)
+            await db.commit()  # one short transaction per project
+            metrics.incr("daily_stats.days", days)
+
+        if until > wm.processed_until:
+            wm.processed_until = until
+            lock_db.add(wm)
+        # markers at or before the new watermark are never read again
+        await lock_db.exec(delete(DailyStatsChange).where(DailyStatsChange.changed_at <= wm.processed_until))
+        await lock_db.commit()
+        metrics.incr("daily_stats.projects", len(changed))
+        return len(changed)
+
+
+async def _run() -> None:
+    while True:
+        try:
+            await run_rollup()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # watermark not moved: the same changes are retried next pass
+            logger.exception("daily stats rollup failed")
+        await asyncio.sleep(settings.daily_stats_interval_seconds)
+
+
+async def start_daily_stats_job() -> None:
+    global _task
+    if _task is None:
+        _task = asyncio.create_task(_run())
+
+
+async def stop_daily_stats_job() -> None:
+    global _task
+    if _task is None:
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+    _task = None
+
+
+# ---------- reads (charts) ----------
+
+
+async def _ensure_project_access(db: AsyncSession, project_id: UUID, user: User) -> Project:
+    project = (await db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None)))).first()
+    if not project:
+        raise ValueError("Project not found")
+
+    if project.owner_id != user.id:
+        m = (
+            await db.exec(
+                select(ProjectMember).where(
+                    ProjectMember.project_id == project.id,
+                    ProjectMember.user_id == user.id,
+                )
+            )
+        ).first()
+        if not m:
+            raise ValueError("You do not have access to this project")
+    return project
+
+
+async def daily_series(
+    db: AsyncSession,
+    project_id: UUID,
+    user: User,
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+) -> dict:
+    """
+    One point per day in since..until (inclusive; default: the last
+    analytics_default_days days), read from project_daily_stats only.
+    Days without a row repeat the previous day's counts (nothing changed),
+    with created/resolved = 0.
+    """
+    project = await _ensure_project_access(db, project_id, user)
+
+    until = until or _utc_today()
+    since = since or until - timedelta(days=settings.analytics_default_days - 1)
+    if since > until:
+        raise ValueError("since must not be after until")
+    if (until - since).days + 1 > settings.analytics_max_days:
+        raise ValueError(f"Window too large (max {settings.analytics_max_days} days)")
+
+    rows = (
+        await db.exec(
+            select(ProjectDailyStats)
+            .where(
+                ProjectDailyStats.project_id == project.id,
+                ProjectDailyStats.day >= since,
+                ProjectDailyStats.day <= until,
+            )
+            .order_by(ProjectDailyStats.day)
+        )
+    ).all()
+    before = (
+        await db.exec(
+            select(ProjectDailyStats)
+            .where(ProjectDailyStats.project_id == project.id, ProjectDailyStats.day < since)
+            .order_by(ProjectDailyStats.day.desc())
+            .limit(1)
+        )
+    ).first()
+
+    by_day = {r.day: r for r in rows}
+    last = {s: getattr(before, s) if before else 0 for s in STATUSES}
+    points: List[dict] = []
+    for i in range((until - since).days + 1):
+        day = since + timedelta(days=i)
+        r = by_day.get(day)
+        if r is not None:
+            last = {s: getattr(r, s) for s in STATUSES}
+        points.append(
+            {
+                "day": day,
+                **last,
+                "created": r.created if r else 0,
+                "resolved": r.resolved if r else 0,
+            }
+        )
+    return {"project_id": project.id, "since": since, "until": until, "points": points}
@@ -1,148 +1,145 @@
 from __future__ import annotations
 
+import asyncio
 from datetime import date, datetime, timedelta
 from typing import Dict, List, Set, Tuple
 from uuid import UUID
 
-from sqlmodel import Session, select
-from sqlalchemy import func
+from sqlalchemy import func, or_
+from sqlmodel import select
 
+from app.db.session import AsyncSessionLocal
+from app.models.activity import ActivityType
 from app.models.project import Project
 from app.models.project_member import ProjectMember
 from app.models.issue import Issue, IssueStatus, IssuePriority
 from app.models.issue_comment import IssueComment
 from app.models.user import User
+from app.services.activity_service import latest_events_stmt
+from app.services.issue_stats_service import summary_for_projects_async
 
 
-def _accessible_project_ids(db: Session, user: User) -> List[UUID]:
-    owned_ids = db.exec(select(Project.id).where(Project.owner_id == user.id)).all()
-    member_ids = db.exec(select(ProjectMember.project_id).where(ProjectMember.user_id == user.id)).all()
-    # both are lists of UUID
-    ids = set(list(owned_ids) + list(member_ids))
-    return list(ids)
+def _accessible_projects_stmt(user_id: UUID):
+    # one SELECT of ids, embedded as a subquery in every dashboard query
+    member_of = select(ProjectMember.project_id).where(ProjectMember.user_id == user_id)
+    return select(Project.id).where(
+        or_(Project.owner_id == user_id, Project.id.in_(member_of)),
+        Project.deleted_at.is_(None),
+    )
 
 
-def _summary_for_projects(db: Session, project_ids: List[UUID]) -> Tuple[int, Dict, Dict]:
-    if not project_ids:
-        return (0, {}, {})
+async def _all(stmt) -> list:
+    # its own session (= its own connection): the queries run in parallel
+    async with AsyncSessionLocal() as db:
+        return list((await db.exec(stmt)).all())
 
-    total_issues = db.exec(
-        select(func.count(Issue.id)).where(Issue.project_id.in_(project_ids))
-    ).one()
 
-    # by status
-    status_rows = db.exec(
-        select(Issue.status, func.count(Issue.id))
-        .where(Issue.project_id.in_(project_ids))
-        .group_by(Issue.status)
-    ).all()
-    by_status = {status: int(cnt) for (status, cnt) in status_rows}
+async def _summary(project_ids) -> Tuple[int, Dict, Dict]:
+    async with AsyncSessionLocal() as db:
+        return await summary_for_projects_async(db, project_ids)
 
-    # by priority
-    priority_rows = db.exec(
-        select(Issue.priority, func.count(Issue.id))
-        .where(Issue.project_id.in_(project_ids))
-        .group_by(Issue.priority)
-    ).all()
-    by_priority = {prio: int(cnt) for (prio, cnt) in priority_rows}
 
-    return (int(total_issues), by_status, by_priority)
-
-
-def dashboard_home(db: Session, user: User):
-    project_ids = _accessible_project_ids(db, user)
-
-    projects_count = len(project_ids)
-    issues_count, by_status, by_priority = _summary_for_projects(db, project_ids)
-
-    # My assigned issues (limit for dashboard)
-    my_assigned_rows = db.exec(
-        select(Issue)
-        .where(Issue.project_id.in_(project_ids), Issue.assignee_id == user.id)
-        .order_by(Issue.updated_at.desc())
-        .limit(50)
-    ).all()
+async def dashboard_home(user: User):
+    """
+    The home dashboard's queries are independent (each embeds the
+    accessible-projects subquery), so they run concurrently, one pooled
+    connection each: latency ~ the slowest query instead of their sum.
+    """
+    user_id = user.id
+    project_ids = _accessible_projects_stmt(user_id)
 
     today = date.today()
     due_soon_limit = today + timedelta(days=7)
 
-    due_soon_rows = db.exec(
-        select(Issue)
-        .where(
-            Issue.project_id.in_(project_ids),
-            Issue.assignee_id == user.id,
-            Issue.due_date.is_not(None),
-            Issue.due_date >= today,
-            Issue.due_date <= due_soon_limit,
-            Issue.status != IssueStatus.done,
-        )
-        .order_by(Issue.due_date.asc())
-        .limit(20)
-    ).all()
-
-    overdue_rows = db.exec(
-        select(Issue)
-        .where(
-            Issue.project_id.in_(project_ids),
-            Issue.assignee_id == user.id,
-            Issue.due_date.is_not(None),
-            Issue.due_date < today,
-            Issue.status != IssueStatus.done,
-        )
-        .order_by(Issue.due_date.asc())
-        .limit(20)
-    ).all()
-
-    # Recent activity: last comments across accessible projects
-    activity_rows = db.exec(
-        select(IssueComment, Issue)
-        .join(Issue, Issue.id == IssueComment.issue_id)
-        .where(IssueComment.project_id.in_(project_ids))
-        .order_by(IssueComment.created_at.desc())
-        .limit(20)
-    ).all()
+    my_open = (
+        Issue.project_id.in_(project_ids),
+        Issue.assignee_id == user_id,
+        Issue.due_date.is_not(None),
+        Issue.status != IssueStatus.done,
+    )
+
+    (
+        projects_count,
+        (issues_count, by_status, by_priority),
+        my_assigned_rows,
+        due_soon_rows,
+        overdue_rows,
+        activity_rows,
+    ) = await asyncio.gather(
+        _all(select(func.count()).select_from(project_ids.subquery())),
+        _summary(project_ids),
+        # My assigned issues (limit for dashboard)
+        _all(
+            select(Issue)
+            .where(Issue.project_id.in_(project_ids), Issue.assignee_id == user_id)
+            .order_by(Issue.updated_at.desc())
+            .limit(50)
+        ),
+        _all(
+            select(Issue)
+            .where(*my_open, Issue.due_date >= today, Issue.due_date <= due_soon_limit)
+            .order_by(Issue.due_date.asc())
+            .limit(20)
+        ),
+        _all(
+            select(Issue)
+            .where(*my_open, Issue.due_date < today)
+            .order_by(Issue.due_date.asc())
+            .limit(20)
+        ),
+        # Recent activity: last comment events from the user's own feed
+        # (fan-out on write, no join over every accessible project)
+        _all(latest_events_stmt(user_id, [ActivityType.comment_created], 20)),
+    )
 
     return {
-        "projects_count": projects_count,
+        "projects_count": int(projects_count[0]),
         "issues_count": issues_count,
         "by_status": by_status,
         "by_priority": by_priority,
-        "my_assigned": list(my_assigned_rows),
-        "due_soon": list(due_soon_rows),
-        "overdue": list(overdue_rows),
-        "recent_activity": list(activity_rows),
+        "my_assigned": my_assigned_rows,
+        "due_soon": due_soon_rows,
+        "overdue": overdue_rows,
+        "recent_activity": activity_rows,
     }
 
 
-def dashboard_project(db: Session, user: User, project_id: UUID):
-    # ensure access (owner OR member)
-    proj = db.exec(select(Project).where(Project.id == project_id)).first()
-    if not proj:
-        raise ValueError("Project not found")
-
-    if proj.owner_id != user.id:
-        m = db.exec(
-            select(ProjectMember).where(ProjectMember.project_id == proj.id, ProjectMember.user_id == user.id)
-        ).first()
-        if not m:
-            raise ValueError("You do not have access to this project")
-
-    project_ids = [proj.id]
-    issues_count, by_status, by_priority = _summary_for_projects(db, project_ids)
-
-    activity_rows = db.exec(
-        select(IssueComment, Issue)
-        .join(Issue, Issue.id == IssueComment.issue_id)
-        .where(IssueComment.project_id == proj.id)
-        .order_by(IssueComment.created_at.desc())
-        .limit(20)
-    ).all()
+async def accessible_project_ids(user_id: UUID) -> List[UUID]:
+    # for the cache key (version vector of these projects)
+    return await _all(_accessible_projects_stmt(user_id))
+
+
+async def ensure_dashboard_access(user: User, project_id: UUID) -> None:
+    # owner OR member of a live project
+    rows = await _all(_accessible_projects_stmt(user.id).where(Project.id == project_id))
+    if not rows:
+        async with AsyncSessionLocal() as db:
+            exists = (
+                await db.exec(select(Project.id).where(Project.id == project_id, Project.deleted_at.is_(None)))
+            ).first()
+        raise ValueError("You do not have access to this project" if exists else "Project not found")
+
+
+async def dashboard_project(project_id: UUID):
+    """
+    Same for every member (access is checked by the caller, see
+    ensure_dashboard_access), so its cached body is shared.
+    """
+    (issues_count, by_status, by_priority), activity_rows = await asyncio.gather(
+        _summary([project_id]),
+        _all(
+            select(IssueComment, Issue)
+            .join(Issue, Issue.id == IssueComment.issue_id)
+            .where(IssueComment.project_id == project_id)
+            .order_by(IssueComment.created_at.desc())
+            .limit(20)
+        ),
+    )
 
     return {
-        "project_id": proj.id,
+        "project_id": project_id,
         "issues_count": issues_count,
         "by_status": by_status,
         "by_priority": by_priority,
-        "recent_activity": list(activity_rows),  
+        "recent_activity": activity_rows,
     }
-
@@ -8,11 +8,13 @@ from uuid import UUID
 from pydantic import EmailStr
 from sqlmodel import Session, select
 
+from app.models.activity import ActivityType
 from app.models.project import Project
 from app.models.project_invite import ProjectInvite, InviteStatus
 from app.models.project_member import ProjectMember, ProjectRole
 from app.models.project_preference import ProjectPreference
 from app.models.user import User
+from app.services.activity_service import record_user_event
 
 
 def _normalize_emails(emails: List[str | EmailStr]) -> List[str]:
@@ -42,6 +44,20 @@ def _is_member(db: Session, project_id: UUID, user_id: UUID) -> bool:
     return m is not None
 
 
+def _notify_invited(db: Session, project: Project, inviter: User, user: User | None) -> None:
+    # only users who already have an account get a feed item
+    if user is None:
+        return
+    record_user_event(
+        db,
+        user.id,
+        project.id,
+        ActivityType.invited,
+        inviter,
+        data={"project_name": project.name, "project_key": project.key},
+    )
+
+
 def invite_members(
     db: Session,
     project: Project,
@@ -94,6 +110,7 @@ def invite_members(
             existing_inv.invited_by_user_id = inviter.id
 
             db.add(existing_inv)
+            _notify_invited(db, project, inviter, existing_user)
             invited += 1
             continue
 
@@ -106,6 +123,7 @@ def invite_members(
             created_at=datetime.utcnow(),
         )
         db.add(inv)
+        _notify_invited(db, project, inviter, existing_user)
         invited += 1
 
     db.commit()
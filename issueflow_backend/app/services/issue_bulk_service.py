@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import update
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.dashboard_cache import bump_project_versions_async
+from app.models.activity import ActivityType
+from app.models.issue import Issue
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.user import User
+from app.services.activity_service import record_project_event_async
+from app.services.issue_history_service import TRACKED, record_transitions_async, status_stamp_values, transition_rows
+from app.services.issue_service import issue_filter_conditions
+from app.services.issue_stats_service import apply_stats_delta_async, delta_of, merge_deltas
+
+# Fields a bulk update may change (same meaning as PATCH /issues/{id})
+BULK_FIELDS = ("type", "priority", "status", "due_date", "reporter_id", "assignee_id")
+# NOT NULL columns: an explicit null is a 400, not a constraint error
+NON_NULL_FIELDS = ("type", "priority", "status", "reporter_id")
+
+# ids per UPDATE ... WHERE id IN (...): stays under SQLite's bound-parameter limit
+_UPDATE_CHUNK = 1000
+
+
+async def _ensure_project_access(db: AsyncSession, project_id: UUID, user: User) -> Project:
+    project = (await db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None)))).first()
+    if not project:
+        raise ValueError("Project not found")
+
+    if project.owner_id != user.id:
+        await _ensure_member(db, project, user.id, "You do not have access to this project")
+    return project
+
+
+async def _ensure_member(db: AsyncSession, project: Project, user_id: UUID, message: str) -> None:
+    if project.owner_id == user_id:
+        return
+
+    m = (
+        await db.exec(
+            select(ProjectMember).where(
+                ProjectMember.project_id == project.id,
+                ProjectMember.user_id == user_id,
+            )
+        )
+    ).first()
+    if not m:
+        raise ValueError(message)
+
+
+async def _ensure_user_in_project(db: AsyncSession, project: Project, user_id: UUID) -> None:
+    u = (await db.exec(select(User).where(User.id == user_id))).first()
+    if not u:
+        raise ValueError("User not found")
+    await _ensure_member(db, project, user_id, "User is not in this project")
+
+
+def _jsonable(value):
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)  # UUIDs, dates
+
+
+async def bulk_update_issues(
+    db: AsyncSession,
+    project_id: UUID,
+    current_user: User,
+    updates: dict,  # from payload.updates.model_dump(exclude_unset=True)
+    issue_ids: Optional[list[UUID]] = None,
+    filters: Optional[dict] = None,
+) -> list[UUID]:
+    """
+    Apply the same partial update to many issues of ONE project.
+
+    - project access + reporter/assignee membership checked ONCE
+    - one locking SELECT of the targets, then set-based UPDATEs by id
+      (no per-issue load/commit)
+    - project issue stats adjusted in the same transaction
+    Target is either explicit issue_ids or a filter (exactly one of them).
+    Returns the ids actually updated (ids outside this project are ignored).
+    """
+    if (issue_ids is None) == (filters is None):
+        raise ValueError("Give either issue_ids or filter")
+
+    changes = {k: v for k, v in updates.items() if k in BULK_FIELDS}
+    if not changes:
+        raise ValueError("No changes given")
+
+    for field in NON_NULL_FIELDS:
+        if field in changes and changes[field] is None:
+            raise ValueError(f"{field} cannot be null")
+
+    project = await _ensure_project_access(db, project_id, current_user)
+
+    if "reporter_id" in changes:
+        await _ensure_user_in_project(db, project, changes["reporter_id"])
+
+    # assignee_id (null => unassign)
+    if changes.get("assignee_id") is not None:
+        await _ensure_user_in_project(db, project, changes["assignee_id"])
+
+    conditions = [Issue.project_id == project.id]
+    if issue_ids is not None:
+        if not issue_ids:
+            return []
+        if len(issue_ids) > settings.issue_bulk_max_ids:
+            raise ValueError(f"Too many issue_ids (max {settings.issue_bulk_max_ids})")
+        conditions.append(Issue.id.in_(set(issue_ids)))
+    else:
+        filter_conditions = issue_filter_conditions(filters)
+        if not filter_conditions:
+            # never update a whole project by accident
+            raise ValueError("Filter needs at least one condition")
+        conditions.extend(filter_conditions)
+
+    # Lock the target rows and read their old status/priority/assignee first
+    # (stats delta + history), then update exactly those ids in the same
+    # transaction. Two statements instead of UPDATE ... FROM ... RETURNING
+    # the FROM columns, which SQLite doesn't support.
+    rows = (
+        await db.execute(
+            select(Issue.id, Issue.status, Issue.priority, Issue.assignee_id).where(*conditions).with_for_update()
+        )
+    ).all()
+
+    now = datetime.utcnow()
+    stamps = status_stamp_values(changes["status"], now) if "status" in changes else {}
+    ids = [r[0] for r in rows]
+    for i in range(0, len(ids), _UPDATE_CHUNK):
+        await db.execute(
+            update(Issue)
+            .where(Issue.id.in_(ids[i : i + _UPDATE_CHUNK]))
+            .values(**changes, **stamps, updated_at=now)
+            .execution_options(synchronize_session=False)
+        )
+
+    updated = ids
+    if "status" in changes or "priority" in changes:
+        old = [(r[1], r[2]) for r in rows]
+        new = [(changes.get("status", status), changes.get("priority", priority)) for status, priority in old]
+        await apply_stats_delta_async(db, project.id, merge_deltas(delta_of(old, -1), delta_of(new)))
+    tracked = {k: v for k, v in changes.items() if k in TRACKED}
+    if tracked:
+        history = []
+        for issue_id, status, priority, assignee_id in rows:
+            old = {"status": status, "priority": priority, "assignee_id": assignee_id}
+            history += transition_rows(project.id, issue_id, current_user.id, old, tracked, now=now)
+        await record_transitions_async(db, history)
+    if updated:
+        # one feed item for the whole operation, not one per issue
+        await record_project_event_async(
+            db,
+            project.id,
+            ActivityType.issues_bulk_updated,
+            current_user,
+            data={"count": len(updated), "changes": {k: _jsonable(v) for k, v in changes.items()}},
+        )
+    await db.commit()
+    if updated:
+        await bump_project_versions_async(project.id)
+    return updated
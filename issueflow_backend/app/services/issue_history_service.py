@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from datetime import datetime
+from enum import Enum
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from sqlalchemy import case, func, insert
+from sqlmodel import Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.issue import Issue, IssueStatus
+from app.models.issue_transition import IssueTransition, TransitionField
+
+# Issue attribute -> history field
+TRACKED = {
+    "status": TransitionField.status,
+    "priority": TransitionField.priority,
+    "assignee_id": TransitionField.assignee,
+}
+
+
+def _text(value: Any) -> Optional[str]:
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return value.value
+    return str(value)
+
+
+def transition_rows(
+    project_id: UUID,
+    issue_id: UUID,
+    actor_id: Optional[UUID],
+    old: Dict[str, Any],
+    new: Dict[str, Any],
+    now: Optional[datetime] = None,
+) -> List[dict]:
+    """
+    One row per tracked attribute whose value actually changed
+    (old/new: {"status": ..., "priority": ..., "assignee_id": ...}, any subset).
+    """
+    now = now or datetime.utcnow()
+    rows = []
+    for attr, field in TRACKED.items():
+        if attr not in new:
+            continue
+        before, after = _text(old.get(attr)), _text(new[attr])
+        if before == after:
+            continue
+        rows.append(
+            {
+                "id": uuid4(),
+                "project_id": project_id,
+                "issue_id": issue_id,
+                "field": field,
+                "from_value": before,
+                "to_value": after,
+                "actor_id": actor_id,
+                "created_at": now,
+            }
+        )
+    return rows
+
+
+def stamp_status(issue: Issue, old_status: IssueStatus, now: datetime) -> None:
+    # Issue.started_at / completed_at for a status change (see the model)
+    if issue.status == old_status:
+        return
+    if issue.status == IssueStatus.in_progress and issue.started_at is None:
+        issue.started_at = now
+    elif issue.status == IssueStatus.done:
+        issue.completed_at = now
+
+
+def status_stamp_values(status: IssueStatus, now: datetime) -> dict:
+    # the same for UPDATE ... SET (bulk): column expressions on the old row
+    if status == IssueStatus.in_progress:
+        return {"started_at": func.coalesce(Issue.started_at, now)}
+    if status == IssueStatus.done:
+        return {"completed_at": case((Issue.status != IssueStatus.done, now), else_=Issue.completed_at)}
+    return {}
+
+
+# render_nulls: keep from/to = None in the parameters, or rows with and
+# without them split the executemany into one INSERT per run of rows
+_INSERT = insert(IssueTransition).execution_options(render_nulls=True)
+
+
+# Both add to the caller's transaction (no commit here)
+def record_transitions(db: Session, rows: List[dict]) -> None:
+    if rows:
+        db.execute(_INSERT, rows)
+
+
+async def record_transitions_async(db: AsyncSession, rows: List[dict]) -> None:
+    if rows:
+        await db.execute(_INSERT, rows)
@@ -0,0 +1,224 @@
+from __future__ import annotations
+
+import codecs
+import csv
+import json
+from datetime import datetime
+from typing import Any, AsyncIterator, Optional
+from uuid import UUID, uuid4
+
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.core.dashboard_cache import bump_project_versions_async
+from app.models.activity import ActivityType
+from app.models.issue import Issue, IssueStatus
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.user import User
+from app.schemas.issue import IssueCreateRequest
+from app.services.activity_service import record_project_event_async
+from app.services.issue_service import reserve_issue_numbers_async
+from app.services.issue_stats_service import apply_stats_delta_async, delta_of
+
+# One parsed input row: (row number, fields) or (row number, error message)
+ParsedRow = tuple[int, Optional[dict], Optional[str]]
+
+
+async def _lines(chunks: AsyncIterator[bytes]) -> AsyncIterator[str]:
+    # bytes chunks -> text lines (without newline), never holding the whole body
+    decoder = codecs.getincrementaldecoder("utf-8-sig")(errors="replace")
+    buf = ""
+    async for chunk in chunks:
+        buf += decoder.decode(chunk)
+        *complete, buf = buf.split("\n")
+        for line in complete:
+            yield line.rstrip("\r")
+    buf += decoder.decode(b"", final=True)
+    if buf:
+        yield buf.rstrip("\r")
+
+
+async def iter_ndjson_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    row = 0
+    async for line in _lines(chunks):
+        if not line.strip():
+            continue
+        row += 1
+        try:
+            data = json.loads(line)
+        except ValueError:
+            yield row, None, "Invalid JSON"
+            continue
+        if not isinstance(data, dict):
+            yield row, None, "Each line must be a JSON object"
+            continue
+        yield row, data, None
+
+
+async def iter_csv_rows(chunks: AsyncIterator[bytes]) -> AsyncIterator[ParsedRow]:
+    """
+    First record is the header (title, description, type, priority, due_date).
+    Quoted fields may contain newlines: lines are glued back together until
+    the quotes balance, then parsed as one record.
+    """
+    header: Optional[list[str]] = None
+    pending: list[str] = []
+    row = 0
+
+    async for line in _lines(chunks):
+        pending.append(line)
+        text = "\n".join(pending)
+        if text.count('"') % 2:
+            continue  # inside a quoted field
+        pending = []
+
+        if not text.strip():
+            continue
+
+        values = next(csv.reader([text]), [])
+        if header is None:
+            header = [h.strip().lower() for h in values]
+            continue
+
+        row += 1
+        if len(values) > len(header):
+            yield row, None, "Too many columns"
+            continue
+        # empty cells -> field not given (defaults apply)
+        yield row, {k: v for k, v in zip(header, values) if k and v.strip() != ""}, None
+
+    if pending:
+        yield row + 1, None, "Unterminated quoted field"
+
+
+def _row_error(e: ValidationError) -> str:
+    err = e.errors()[0]
+    field = ".".join(str(p) for p in err.get("loc", ())) or "row"
+    return f"{field}: {err.get('msg')}"
+
+
+async def _ensure_project_access(db: AsyncSession, project_id: UUID, user: User) -> Project:
+    project = (await db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None)))).first()
+    if not project:
+        raise ValueError("Project not found")
+
+    if project.owner_id != user.id:
+        m = (
+            await db.exec(
+                select(ProjectMember).where(
+                    ProjectMember.project_id == project.id,
+                    ProjectMember.user_id == user.id,
+                )
+            )
+        ).first()
+        if not m:
+            raise ValueError("You do not have access to this project")
+    return project
+
+
+async def import_issues(
+    db: AsyncSession,
+    project_id: UUID,
+    reporter: User,
+    rows: AsyncIterator[ParsedRow],
+) -> dict:
+    """
+    Bulk import (migration from another tracker).
+
+    - access check ONCE
+    - every row validated with IssueCreateRequest (bad rows are reported, not fatal)
+    - valid rows are inserted in batches of issue_import_batch_size:
+      one sequence bump reserves the keys for the whole batch,
+      one multi-row INSERT + commit per batch
+    """
+    project = await _ensure_project_access(db, project_id, reporter)
+    # plain values: the ORM object expires on every batch commit
+    project_id = project.id
+    reporter_id = reporter.id
+
+    imported = 0
+    failed = 0
+    errors: list[dict] = []
+    batch: list[IssueCreateRequest] = []
+
+    def _fail(row: int, message: str) -> None:
+        nonlocal failed
+        failed += 1
+        if len(errors) < settings.issue_import_max_errors:
+            errors.append({"row": row, "error": message})
+
+    async def _flush() -> None:
+        nonlocal imported
+        if not batch:
+            return
+
+        key, first = await reserve_issue_numbers_async(db, project_id, len(batch))
+        now = datetime.utcnow()
+        values: list[dict[str, Any]] = [
+            {
+                "id": uuid4(),
+                "project_id": project_id,
+                "key": f"{key}-{first + n}",
+                "title": item.title.strip(),
+                "description": item.description,
+                "type": item.type,
+                "priority": item.priority,
+                "status": IssueStatus.todo,
+                "due_date": item.due_date,
+                "reporter_id": reporter_id,
+                "assignee_id": None,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for n, item in enumerate(batch)
+        ]
+        # render_nulls: the ORM leaves None values out of a row's parameters,
+        # and only rows with the same parameter keys share one statement, so
+        # mixed rows (some with a description, some without) would go one
+        # INSERT each
+        await db.execute(insert(Issue).execution_options(render_nulls=True), values)
+        await apply_stats_delta_async(db, project_id, delta_of((v["status"], v["priority"]) for v in values))
+        await db.commit()
+        await bump_project_versions_async(project_id)
+
+        imported += len(batch)
+        batch.clear()
+
+    async for row, data, error in rows:
+        if error is not None:
+            _fail(row, error)
+            continue
+
+        try:
+            item = IssueCreateRequest.model_validate(data)
+        except ValidationError as e:
+            _fail(row, _row_error(e))
+            continue
+
+        if not item.title.strip():
+            _fail(row, "Title cannot be empty")
+            continue
+
+        batch.append(item)
+        if len(batch) >= settings.issue_import_batch_size:
+            await _flush()
+
+    await _flush()
+
+    if imported:
+        # one feed item for the whole import
+        await record_project_event_async(
+            db, project_id, ActivityType.issues_imported, reporter, data={"count": imported}
+        )
+        await db.commit()
+
+    return {
+        "imported": imported,
+        "failed": failed,
+        "errors": errors,
+        "errors_truncated": failed > len(errors),
+    }
@@ -1,21 +1,76 @@
 from __future__ import annotations
 from datetime import date, datetime
 from app.models.issue_comment import IssueComment
+from uuid import UUID
+from sqlalchemy import delete, tuple_, update
 from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
 from app.models.project_member import ProjectMember
 from app.models.issue import Issue, IssuePriority, IssueType
 from app.models.project import Project
 from app.models.user import User
+from app.core.dashboard_cache import bump_project_versions
+from app.core.pagination import decode_cursor, encode_cursor
+from app.models.activity import ActivityEvent, ActivityType
+from app.models.issue_transition import IssueTransition
+from app.services.activity_service import record_project_event
+from app.services.daily_stats_service import mark_changed
+from app.services.issue_history_service import record_transitions, stamp_status, transition_rows
+from app.services.issue_stats_service import apply_stats_delta, delta_of
 
 
-def _next_issue_key(project: Project) -> str:
+def reserve_issue_numbers(db: Session, project_id, count: int = 1) -> tuple[str, int]:
     """
+    Atomically reserve `count` consecutive issue numbers for a project.
+    Returns (project_key, first_number): the block is first..first+count-1.
+
     Example:
-      project.key = "IF"
-      project.issue_seq = 0  -> next = IF-1
-      project.issue_seq = 1  -> next = IF-2
+      project.key = "IF", issue_seq = 4
+      reserve 1  -> ("IF", 5)  => IF-5
+      reserve 10 -> ("IF", 6)  => IF-6 .. IF-15
+
+    One `UPDATE ... SET issue_seq = issue_seq + n RETURNING` in its own short
+    transaction: it COMMITS the session, so call it before adding anything.
+    The database serialises concurrent callers on the row, which stays locked
+    for that one statement, not through the caller's insert / feed fan-out.
+    Same connection as the session (a second pooled connection while the
+    session holds one can deadlock a small pool). Trade-off: if the insert
+    fails afterwards, its number is skipped (gaps in keys are fine).
     """
-    return f"{project.key}-{project.issue_seq + 1}"
+    row = db.connection().execute(_reserve_stmt(project_id, count)).first()
+    db.commit()
+    return _reserved_block(row, count)
+
+
+async def reserve_issue_numbers_async(db: AsyncSession, project_id, count: int = 1) -> tuple[str, int]:
+    """
+    Same as reserve_issue_numbers() for AsyncSession callers (bulk import),
+    also committed right away.
+    """
+    conn = await db.connection()
+    row = (await conn.execute(_reserve_stmt(project_id, count))).first()
+    await db.commit()
+    return _reserved_block(row, count)
+
+
+def _reserve_stmt(project_id, count: int):
+    if count < 1:
+        raise ValueError("count must be >= 1")
+
+    return (
+        update(Project)
+        .where(Project.id == project_id, Project.deleted_at.is_(None))
+        .values(issue_seq=Project.issue_seq + count, updated_at=datetime.utcnow())
+        .returning(Project.issue_seq, Project.key)
+    )
+
+
+def _reserved_block(row, count: int) -> tuple[str, int]:
+    if row is None:
+        raise ValueError("Project not found")
+
+    last, key = row
+    return key, last - count + 1
 
 
 def create_issue(
@@ -32,11 +87,11 @@ def create_issue(
     Create an issue inside a project and generate stable issue key (KEY-1, KEY-2...).
 
     Important part:
-    - We must increment project.issue_seq atomically to avoid duplicates
-      if two issues are created at the same time.
+    - The number comes from reserve_issue_numbers() (atomic in the DB),
+      so two issues created at the same time never get the same key.
     """
     # Load project
-    project = db.exec(select(Project).where(Project.id == project_id)).first()
+    project = db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None))).first()
 
 
     if not project:
@@ -54,50 +109,162 @@ def create_issue(
             raise ValueError("You do not have access to this project")
 
 
-    # Generate issue key
-    issue_key = _next_issue_key(project)
+    # Generate issue key (commits: plain values, the ORM objects expire)
+    project_id = project.id
+    reporter_id = reporter.id
+    key, number = reserve_issue_numbers(db, project_id)
+    issue_key = f"{key}-{number}"
 
     issue = Issue(
-        project_id=project.id,
+        project_id=project_id,
         key=issue_key,
         title=title.strip(),
         description=description,
         type=type_,
         priority=priority,
         due_date=due_date,
-        reporter_id=reporter.id,
+        reporter_id=reporter_id,
         created_at=datetime.utcnow(),
         updated_at=datetime.utcnow(),
     )
 
-    # Increment project seq so next issue becomes KEY-(n+1)
-    project.issue_seq += 1
-    project.updated_at = datetime.utcnow()
-
-    db.add(project)
     db.add(issue)
+    record_project_event(
+        db,
+        project_id,
+        ActivityType.issue_created,
+        reporter,
+        issue_id=issue.id,
+        issue_key=issue.key,
+        issue_title=issue.title,
+    )
+    # Trade-off: the counter row stays locked until commit, so concurrent
+    # writers of the same (project, status, priority) bucket queue on it.
+    # Last statement before the commit: the lock lasts one round trip.
+    apply_stats_delta(db, project_id, {(issue.status, issue.priority): 1})
     db.commit()
+    bump_project_versions(project_id)
     db.refresh(issue)
     return issue
 
 
-def list_issues(db: Session, project_id, current_user: User) -> list[Issue]:
-    project = db.exec(select(Project).where(Project.id == project_id)).first()
+# sort keys for listings ("-" prefix = newest first); ties broken by id
+ISSUE_SORTS = {
+    "created_at": Issue.created_at,
+    "updated_at": Issue.updated_at,
+}
+DEFAULT_ISSUE_SORT = "-updated_at"
+
+
+def issue_filter_conditions(filters: dict) -> list:
+    """
+    WHERE conditions from a filter dict (listing + bulk update).
+    status / priority / type accept one value or a list of values.
+    """
+    conditions = []
+
+    def _match(column, value):
+        if isinstance(value, (list, tuple, set)):
+            return column.in_(list(value))
+        return column == value
+
+    for field, column in (
+        ("status", Issue.status),
+        ("priority", Issue.priority),
+        ("type", Issue.type),
+        ("reporter_id", Issue.reporter_id),
+    ):
+        value = filters.get(field)
+        if value is not None and value != []:
+            conditions.append(_match(column, value))
+
+    if filters.get("unassigned"):
+        conditions.append(Issue.assignee_id.is_(None))
+    elif filters.get("assignee_id") is not None:
+        conditions.append(Issue.assignee_id == filters["assignee_id"])
+
+    if filters.get("due_from") is not None:
+        conditions.append(Issue.due_date >= filters["due_from"])
+    if filters.get("due_to") is not None:
+        conditions.append(Issue.due_date <= filters["due_to"])
+
+    return conditions
+
+
+def _parse_sort(sort: str | None):
+    sort = (sort or DEFAULT_ISSUE_SORT).strip()
+    descending = sort.startswith("-")
+    column = ISSUE_SORTS.get(sort.lstrip("-"))
+    if column is None:
+        raise ValueError(f"Invalid sort. Use one of: {', '.join(ISSUE_SORTS)} (prefix - for descending)")
+    return sort, column, descending
+
+
+def _issues_query(db: Session, project_id, current_user: User, filters: dict | None, sort: str | None):
+    project = db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None))).first()
     if not project:
         raise ValueError("Project not found")
 
-    if project.owner_id != current_user.id:
-        m = db.exec(
-            select(ProjectMember).where(
-                ProjectMember.project_id == project.id,
-                ProjectMember.user_id == current_user.id,
-            )
-        ).first()
-        if not m:
-            raise ValueError("You do not have access to this project")
+    _ensure_project_access(db, project, current_user)
+
+    sort, column, descending = _parse_sort(sort)
+    stmt = select(Issue).where(Issue.project_id == project.id, *issue_filter_conditions(filters or {}))
+    if descending:
+        stmt = stmt.order_by(column.desc(), Issue.id.desc())
+    else:
+        stmt = stmt.order_by(column.asc(), Issue.id.asc())
+    return stmt, sort, column, descending
+
+
+def list_issues(
+    db: Session,
+    project_id,
+    current_user: User,
+    filters: dict | None = None,
+    sort: str | None = None,
+) -> list[Issue]:
+    # every matching issue (no paging) - what the board used to load
+    stmt, _, _, _ = _issues_query(db, project_id, current_user, filters, sort)
+    return list(db.exec(stmt).all())
+
+
+def list_issues_page(
+    db: Session,
+    project_id,
+    current_user: User,
+    limit: int,
+    cursor: str | None = None,
+    filters: dict | None = None,
+    sort: str | None = None,
+) -> tuple[list[Issue], str | None]:
+    """
+    One page of issues, keyset-paginated on (sort column, id):
+    each page is an index range scan (ix_issue_project_*), however deep.
+    Returns (rows, cursor for the next page or None).
+    """
+    stmt, sort, column, descending = _issues_query(db, project_id, current_user, filters, sort)
+
+    if cursor:
+        cursor_sort, value, issue_id = decode_cursor(cursor, 3)
+        if cursor_sort != sort:
+            raise ValueError("Cursor does not match sort")
+        try:
+            key = (datetime.fromisoformat(value), UUID(str(issue_id)))
+        except (TypeError, ValueError):
+            raise ValueError("Invalid cursor")
+        if descending:
+            stmt = stmt.where(tuple_(column, Issue.id) < key)
+        else:
+            stmt = stmt.where(tuple_(column, Issue.id) > key)
 
+    rows = list(db.exec(stmt.limit(limit + 1)).all())
 
-    return list(db.exec(select(Issue).where(Issue.project_id == project_id)).all())
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor(sort, getattr(last, column.key), last.id)
+    return rows, next_cursor
 
 
 
@@ -147,17 +314,22 @@ def update_issue(
     current_user: User,
     updates: dict,  # dict from payload.dict(exclude_unset=True)
 ) -> Issue:
-    project = db.exec(select(Project).where(Project.id == project_id)).first()
+    project = db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None))).first()
     if not project:
         raise ValueError("Project not found")
 
     _ensure_project_access(db, project, current_user)
 
-    issue = db.exec(
-        select(Issue).where(Issue.id == issue_id, Issue.project_id == project.id)
-    ).first()
+    stmt = select(Issue).where(Issue.id == issue_id, Issue.project_id == project.id)
+    if "status" in updates or "priority" in updates:
+        # lock: the stats delta below needs the real old status/priority
+        stmt = stmt.with_for_update()
+    issue = db.exec(stmt).first()
     if not issue:
         raise ValueError("Issue not found")
+    old_bucket = (issue.status, issue.priority)
+    old_assignee_id = issue.assignee_id
+    assignee = None
 
     # title
     if "title" in updates:
@@ -198,13 +370,56 @@ def update_issue(
         if aid is None:
             issue.assignee_id = None  # ✅ unassign
         else:
-            _ensure_user_in_project(db, project, aid)
+            assignee = _ensure_user_in_project(db, project, aid)
             issue.assignee_id = aid
 
     issue.updated_at = datetime.utcnow()
 
+    new_bucket = (issue.status, issue.priority)
+    if new_bucket != old_bucket:
+        apply_stats_delta(db, project.id, {old_bucket: -1, new_bucket: 1})
+
+    # history + started/completed stamps (cycle-time analytics), same transaction
+    stamp_status(issue, old_bucket[0], issue.updated_at)
+    record_transitions(
+        db,
+        transition_rows(
+            project.id,
+            issue.id,
+            current_user.id,
+            {"status": old_bucket[0], "priority": old_bucket[1], "assignee_id": old_assignee_id},
+            {"status": issue.status, "priority": issue.priority, "assignee_id": issue.assignee_id},
+            now=issue.updated_at,
+        ),
+    )
+
+    # feed events (same transaction as the change)
+    event = {"issue_id": issue.id, "issue_key": issue.key, "issue_title": issue.title}
+    if issue.status != old_bucket[0]:
+        record_project_event(
+            db,
+            project.id,
+            ActivityType.status_changed,
+            current_user,
+            data={"from": old_bucket[0].value, "to": issue.status.value},
+            **event,
+        )
+    if issue.assignee_id != old_assignee_id:
+        record_project_event(
+            db,
+            project.id,
+            ActivityType.assigned,
+            current_user,
+            data={
+                "assignee_id": str(issue.assignee_id) if issue.assignee_id else None,
+                "assignee_username": assignee.username if assignee else None,
+            },
+            **event,
+        )
+
     db.add(issue)
     db.commit()
+    bump_project_versions(project.id)
     db.refresh(issue)
     return issue
 
@@ -215,7 +430,7 @@ def delete_issue_service(
     issue_id,
     current_user: User,
 ) -> None:
-    project = db.exec(select(Project).where(Project.id == project_id)).first()
+    project = db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None))).first()
     if not project:
         raise ValueError("Project not found")
 
@@ -227,15 +442,18 @@ def delete_issue_service(
     if not issue:
         raise ValueError("Issue not found")
 
-    # Delete associated comments
-    comments = db.exec(
-        select(IssueComment).where(
+    # set-based: comments + history + feed rows, then the issue, no ORM loads
+    db.exec(
+        delete(IssueComment).where(
             IssueComment.project_id == project.id,
             IssueComment.issue_id == issue.id,
         )
-    ).all()
-    for comment in comments:
-        db.delete(comment)
-
-    db.delete(issue)
-    db.commit()
\ No newline at end of file
+    )
+    db.exec(delete(IssueTransition).where(IssueTransition.issue_id == issue.id))
+    db.exec(delete(ActivityEvent).where(ActivityEvent.issue_id == issue.id))
+    removed = db.exec(delete(Issue).where(Issue.id == issue.id).returning(Issue.status, Issue.priority)).all()
+    apply_stats_delta(db, project.id, delta_of(removed, -1))
+    # leaves no issue/transition behind: tell the daily rollup
+    mark_changed(db, project.id)
+    db.commit()
+    bump_project_versions(project.id)
\ No newline at end of file
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+from uuid import UUID
+
+from sqlalchemy import func
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlmodel import Session, select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.issue import Issue, IssuePriority, IssueStatus
+from app.models.project_issue_stats import ProjectIssueStats
+
+# (status, priority) -> +/- number of issues
+Bucket = Tuple[IssueStatus, IssuePriority]
+StatsDelta = Dict[Bucket, int]
+
+
+def delta_of(buckets: Iterable[Bucket], sign: int = 1) -> StatsDelta:
+    counts = Counter(tuple(b) for b in buckets)
+    return {b: sign * n for b, n in counts.items()}
+
+
+def merge_deltas(*deltas: StatsDelta) -> StatsDelta:
+    out: Counter = Counter()
+    for d in deltas:
+        out.update(d)
+    return {b: n for b, n in out.items() if n}
+
+
+def _upsert_stmt(dialect: str, project_id: UUID, rows: StatsDelta, absolute: bool = False):
+    """
+    INSERT ... ON CONFLICT DO UPDATE: count = count + delta (or = value when absolute).
+    One statement, row-locks only the touched buckets.
+    """
+    insert = postgresql.insert if dialect == "postgresql" else sqlite.insert
+    stmt = insert(ProjectIssueStats).values(
+        [
+            {"project_id": project_id, "status": status, "priority": priority, "count": n}
+            for (status, priority), n in rows.items()
+        ]
+    )
+    new_count = stmt.excluded.count if absolute else ProjectIssueStats.count + stmt.excluded.count
+    return stmt.on_conflict_do_update(
+        index_elements=[ProjectIssueStats.project_id, ProjectIssueStats.status, ProjectIssueStats.priority],
+        set_={"count": new_count},
+    )
+
+
+def apply_stats_delta(db: Session, project_id: UUID, delta: StatsDelta) -> None:
+    """
+    Call BEFORE the caller's commit: the counters change in the same
+    transaction as the issues themselves.
+    """
+    delta = {b: n for b, n in delta.items() if n}
+    if delta:
+        db.exec(_upsert_stmt(db.get_bind().dialect.name, project_id, delta))
+
+
+async def apply_stats_delta_async(db: AsyncSession, project_id: UUID, delta: StatsDelta) -> None:
+    delta = {b: n for b, n in delta.items() if n}
+    if delta:
+        await db.exec(_upsert_stmt(db.bind.dialect.name, project_id, delta))
+
+
+def _summary_stmt(project_ids):
+    # project_ids: a list of ids or a SELECT of ids (subquery)
+    return (
+        select(ProjectIssueStats.status, ProjectIssueStats.priority, func.sum(ProjectIssueStats.count))
+        .where(ProjectIssueStats.project_id.in_(project_ids))
+        .group_by(ProjectIssueStats.status, ProjectIssueStats.priority)
+    )
+
+
+def _summarize(rows) -> Tuple[int, Dict, Dict]:
+    total = 0
+    by_status: Counter = Counter()
+    by_priority: Counter = Counter()
+    for status, priority, n in rows:
+        n = int(n or 0)
+        if not n:
+            continue
+        total += n
+        by_status[status] += n
+        by_priority[priority] += n
+    return (total, dict(by_status), dict(by_priority))
+
+
+def summary_for_projects(db: Session, project_ids: List[UUID]) -> Tuple[int, Dict, Dict]:
+    """
+    (total, by_status, by_priority) from the stats rows: cost depends on
+    the number of projects, not on how many issues they have.
+    """
+    if not project_ids:
+        return (0, {}, {})
+    return _summarize(db.exec(_summary_stmt(project_ids)).all())
+
+
+async def summary_for_projects_async(db: AsyncSession, project_ids) -> Tuple[int, Dict, Dict]:
+    return _summarize((await db.exec(_summary_stmt(project_ids))).all())
+
+
+def rebuild_project_stats(db: Session, project_id: UUID) -> bool:
+    """
+    Verify one project's stats against `issue` and fix them if they drifted.
+    Returns True when something was wrong. Commits.
+
+    The existing stats rows are locked first, so a concurrent write's delta
+    lands either before our count (included in it) or after our fix.
+    """
+    stored_rows = db.exec(
+        select(ProjectIssueStats).where(ProjectIssueStats.project_id == project_id).with_for_update()
+    ).all()
+    stored = {(s.status, s.priority): s.count for s in stored_rows if s.count}
+
+    actual = {
+        (status, priority): int(n)
+        for status, priority, n in db.exec(
+            select(Issue.status, Issue.priority, func.count(Issue.id))
+            .where(Issue.project_id == project_id)
+            .group_by(Issue.status, Issue.priority)
+        ).all()
+    }
+
+    if stored == actual:
+        db.rollback()  # release the locks
+        return False
+
+    fixed = {b: 0 for b in stored}
+    fixed.update(actual)
+    db.exec(_upsert_stmt(db.get_bind().dialect.name, project_id, fixed, absolute=True))
+    db.commit()
+    return True
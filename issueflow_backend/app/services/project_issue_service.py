@@ -1,14 +1,20 @@
 from __future__ import annotations
 
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from datetime import datetime
+from typing import Dict, Iterator, List, Optional, Tuple
+from uuid import UUID
 from sqlmodel import Session, select
 from sqlalchemy.orm import aliased
-from sqlalchemy import func
+from sqlalchemy import or_, tuple_
 
+from app.core.config import settings
+from app.core.pagination import decode_created_cursor, decode_cursor, encode_created_cursor, encode_cursor
+from app.db.session import engine
 from app.models.issue import Issue
+from app.models.project import Project
+from app.models.project_member import ProjectMember
 from app.models.user import User
-from app.models.issue_comment import IssueComment  # ✅ NEW
 from app.services.project_service import list_projects
 
 
@@ -20,8 +26,7 @@ def list_projects_with_issues_and_users(db: Session, user: User) -> List[Tuple]:
         ...
       ]
 
-    Same as before, now also supports comments_count lookup
-    (we'll use it in the router without changing structure).
+    comments_count is read from Issue.comments_count (kept up to date on write).
     """
 
     # 1) Accessible projects (owned + member) using your existing logic
@@ -46,31 +51,207 @@ def list_projects_with_issues_and_users(db: Session, user: User) -> List[Tuple]:
         ).all()
     )
 
-    # ✅ NEW: build comments_count map: issue_id -> count
-    issue_ids = [i.id for (i, _r, _a) in issue_rows]
-    comment_count_map: Dict[str, int] = {}
-
-    if issue_ids:
-        counts = list(
-            db.exec(
-                select(IssueComment.issue_id, func.count(IssueComment.id))
-                .where(IssueComment.issue_id.in_(issue_ids))
-                .group_by(IssueComment.issue_id)
-            ).all()
-        )
-        comment_count_map = {str(issue_id): int(cnt) for (issue_id, cnt) in counts}
-
     # 3) Group issues by project_id (unchanged structure)
     grouped: Dict = defaultdict(list)
     for (issue, reporter, assignee) in issue_rows:
         grouped[issue.project_id].append((issue, reporter, assignee))
 
     # 4) Attach role and grouped issues per project
-    # ✅ return comment_count_map ALSO but without changing outer structure too much:
-    # We'll attach it as the 4th element in tuple => (p, role, issue_rows, comment_count_map)
     out = []
     for (p, _pref) in rows:
         role = "owner" if str(p.owner_id) == str(user.id) else "member"
-        out.append((p, role, grouped.get(p.id, []), comment_count_map))
+        out.append((p, role, grouped.get(p.id, [])))
 
     return out
+
+
+# ----------------------------
+# Streamed variant (GET /projects/with-issues/stream)
+# ----------------------------
+# Issue fields a client may ask for (?fields=key,title,...); id always included
+STREAM_ISSUE_FIELDS = (
+    "key",
+    "title",
+    "description",
+    "type",
+    "priority",
+    "status",
+    "due_date",
+    "created_at",
+    "updated_at",
+    "reporter",
+    "assignee",
+    "comments_count",
+)
+
+# Per-project issue cursors use list_issues_page's format for this sort, so a
+# client can also continue with GET /projects/{id}/issues?sort=-created_at&cursor=
+STREAM_ISSUE_SORT = "-created_at"
+
+
+def _stream_fields(fields: Optional[str]) -> Tuple[str, ...]:
+    if not fields:
+        return STREAM_ISSUE_FIELDS
+    wanted = [f.strip() for f in fields.split(",") if f.strip()]
+    unknown = [f for f in wanted if f not in STREAM_ISSUE_FIELDS and f != "id"]
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(unknown)}. Use: {', '.join(STREAM_ISSUE_FIELDS)}")
+    return tuple(f for f in STREAM_ISSUE_FIELDS if f in wanted)
+
+
+def _decode_issue_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    sort, created_at, issue_id = decode_cursor(cursor, 3)
+    if sort != STREAM_ISSUE_SORT:
+        raise ValueError("Cursor does not match sort")
+    try:
+        return datetime.fromisoformat(created_at), UUID(str(issue_id))
+    except (TypeError, ValueError):
+        raise ValueError("Invalid cursor")
+
+
+def _accessible_projects_stmt(user_id):
+    member_of = select(ProjectMember.project_id).where(ProjectMember.user_id == user_id)
+    return select(
+        Project.id,
+        Project.name,
+        Project.key,
+        Project.description,
+        Project.owner_id,
+        Project.created_at,
+        Project.updated_at,
+    ).where(
+        or_(Project.owner_id == user_id, Project.id.in_(member_of)),
+        Project.deleted_at.is_(None),
+    )
+
+
+def _issue_page_stmt(project_id, fields: Tuple[str, ...], limit: int, after: Optional[Tuple[datetime, UUID]]):
+    # only the columns the client asked for (+ what the cursor needs)
+    columns = [Issue.id, Issue.created_at.label("_created_at")]
+    columns += [getattr(Issue, f) for f in fields if f not in ("reporter", "assignee")]
+    stmt = select(*columns).where(Issue.project_id == project_id)
+
+    if "reporter" in fields:
+        Reporter = aliased(User)
+        stmt = stmt.add_columns(Reporter.id.label("_reporter_id"), Reporter.username.label("_reporter_name"))
+        stmt = stmt.join(Reporter, Reporter.id == Issue.reporter_id)
+    if "assignee" in fields:
+        Assignee = aliased(User)
+        stmt = stmt.add_columns(Assignee.id.label("_assignee_id"), Assignee.username.label("_assignee_name"))
+        stmt = stmt.outerjoin(Assignee, Assignee.id == Issue.assignee_id)
+
+    if after is not None:
+        stmt = stmt.where(tuple_(Issue.created_at, Issue.id) < after)
+    # ix_issue_project_created
+    return stmt.order_by(Issue.created_at.desc(), Issue.id.desc()).limit(limit + 1)
+
+
+def _issue_frame(project_id: str, row, fields: Tuple[str, ...]) -> dict:
+    m = row._mapping
+    issue = {"id": str(m["id"])}
+    for f in fields:
+        if f == "reporter":
+            issue[f] = {"id": str(m["_reporter_id"]), "username": m["_reporter_name"]}
+        elif f == "assignee":
+            issue[f] = (
+                {"id": str(m["_assignee_id"]), "username": m["_assignee_name"]}
+                if m["_assignee_id"] is not None
+                else None
+            )
+        else:
+            issue[f] = m[f]
+    return {"type": "issue", "project_id": project_id, "issue": issue}
+
+
+def _iter_project_issues(db: Session, project_id, fields, limit: int, after) -> Iterator[dict]:
+    pid = str(project_id)
+    if limit == 0:
+        # projects only
+        yield {"type": "project_end", "project_id": pid, "issues_next_cursor": None}
+        return
+
+    rows = list(db.exec(_issue_page_stmt(project_id, fields, limit, after)).all())
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]._mapping
+        next_cursor = encode_cursor(STREAM_ISSUE_SORT, last["_created_at"], last["id"])
+
+    for row in rows:
+        yield _issue_frame(pid, row, fields)
+    yield {"type": "project_end", "project_id": pid, "issues_next_cursor": next_cursor}
+
+
+def stream_projects_with_issues(
+    db: Session,
+    user: User,
+    issues_limit: int,
+    fields: Optional[str] = None,
+    cursor: Optional[str] = None,
+    project_id: Optional[str] = None,
+    issues_cursor: Optional[str] = None,
+) -> Iterator[dict]:
+    """
+    NDJSON-friendly replacement for list_projects_with_issues_and_users.
+
+    Validates everything up front (so errors are still a plain 400), then
+    returns a generator of frames:
+      {"type": "project", "project": {...}}                  per project
+      {"type": "issue", "project_id": ..., "issue": {...}}   newest first, <= issues_limit
+      {"type": "project_end", "project_id", "issues_next_cursor"}
+      {"type": "end", "next_cursor"}                 next page of projects
+    Projects come in pages of projects_stream_page_size ordered by
+    (created_at, id); every query is bounded, so memory does not grow
+    with the workspace.
+
+    ?project_id=&issues_cursor= continues one project's issues.
+    """
+    selected = _stream_fields(fields)
+    after_project = decode_created_cursor(cursor) if cursor else None
+    after_issue = _decode_issue_cursor(issues_cursor) if issues_cursor else None
+    if after_issue is not None and project_id is None:
+        raise ValueError("issues_cursor needs project_id")
+
+    user_id = user.id
+    projects = _accessible_projects_stmt(user_id)
+    if project_id is not None:
+        try:
+            project_uuid = UUID(str(project_id))
+        except ValueError:
+            raise ValueError("Project not found")
+        projects = projects.where(Project.id == project_uuid)
+        if db.exec(projects).first() is None:
+            raise ValueError("Project not found")
+    elif after_project is not None:
+        projects = projects.where(tuple_(Project.created_at, Project.id) > after_project)
+
+    page = settings.projects_stream_page_size
+    projects = projects.order_by(Project.created_at, Project.id).limit(page + 1)
+
+    def _frames() -> Iterator[dict]:
+        # own session: the request's one is closed once the response starts
+        with Session(engine) as s:
+            rows = list(s.exec(projects).all())
+            next_cursor = None
+            if len(rows) > page:
+                rows = rows[:page]
+                next_cursor = encode_created_cursor(rows[-1].created_at, rows[-1].id)
+
+            for p in rows:
+                yield {
+                    "type": "project",
+                    "project": {
+                        "id": str(p.id),
+                        "name": p.name,
+                        "key": p.key,
+                        "description": p.description,
+                        "created_at": p.created_at,
+                        "updated_at": p.updated_at,
+                        "role": "owner" if p.owner_id == user_id else "member",
+                    },
+                }
+                yield from _iter_project_issues(s, p.id, selected, issues_limit, after_issue)
+
+            yield {"type": "end", "next_cursor": next_cursor}
+
+    return _frames()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core import metrics
+from app.core.config import settings
+from app.db.session import AsyncSessionLocal
+from app.models.activity import ActivityEvent
+from app.models.issue import Issue
+from app.models.issue_comment import IssueComment
+from app.models.issue_transition import IssueTransition
+from app.models.project import Project
+from app.models.project_daily_stats import ProjectDailyStats
+from app.models.daily_stats_change import DailyStatsChange
+from app.models.project_issue_stats import ProjectIssueStats
+
+# Background purge of soft-deleted projects (Project.deleted_at set by
+# delete_project for large projects).
+#
+# Rows go in bounded batches, one short transaction each:
+#   comments -> history -> issues -> feed rows -> stats/rollups + the project row
+# so no single statement holds locks on a whole project's data.
+# Anything left over after a restart is picked up on the next pass.
+
+logger = logging.getLogger(__name__)
+
+_task: Optional[asyncio.Task] = None
+_loop: Optional[asyncio.AbstractEventLoop] = None
+# Created in start_project_purger (asyncio primitives belong to the running loop)
+_wake: Optional[asyncio.Event] = None
+
+
+def request_purge() -> None:
+    """
+    Wake the purger now instead of at the next interval.
+    Safe from sync routes (threadpool) and from the event loop.
+    """
+    if _loop is None or _wake is None:
+        return  # not started (scripts): the next startup picks it up
+    try:
+        _loop.call_soon_threadsafe(_wake.set)
+    except RuntimeError:
+        pass  # loop already closed
+
+
+async def _delete_batch(db: AsyncSession, model, project_id: UUID) -> int:
+    ids = select(model.id).where(model.project_id == project_id).limit(settings.project_purge_batch_size)
+    result = await db.exec(delete(model).where(model.id.in_(ids)))
+    await db.commit()
+    return result.rowcount or 0
+
+
+async def purge_project(db: AsyncSession, project_id: UUID) -> None:
+    for model in (IssueComment, IssueTransition, Issue, ActivityEvent):
+        while True:
+            n = await _delete_batch(db, model, project_id)
+            metrics.incr(f"project_purge.{model.__tablename__}", n)
+            if n < settings.project_purge_batch_size:
+                break
+            await asyncio.sleep(0)  # let other requests use the loop between batches
+
+    await db.exec(delete(ProjectIssueStats).where(ProjectIssueStats.project_id == project_id))
+    await db.exec(delete(ProjectDailyStats).where(ProjectDailyStats.project_id == project_id))
+    await db.exec(delete(DailyStatsChange).where(DailyStatsChange.project_id == project_id))
+    await db.exec(delete(Project).where(Project.id == project_id, Project.deleted_at.is_not(None)))
+    await db.commit()
+    metrics.incr("project_purge.projects")
+
+
+async def purge_pending() -> int:
+    """
+    Purge every soft-deleted project, oldest first. Returns how many.
+    """
+    done = 0
+    async with AsyncSessionLocal() as db:
+        while True:
+            project_id = (
+                await db.exec(
+                    select(Project.id)
+                    .where(Project.deleted_at.is_not(None))
+                    .order_by(Project.deleted_at)
+                    .limit(1)
+                )
+            ).first()
+            if project_id is None:
+                return done
+            await purge_project(db, project_id)
+            done += 1
+
+
+async def _run() -> None:
+    while True:
+        _wake.clear()
+        try:
+            await purge_pending()
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # DB hiccup: rows stay marked, retried on the next pass
+            logger.exception("project purge failed")
+
+        try:
+            await asyncio.wait_for(_wake.wait(), timeout=settings.project_purge_interval_seconds)
+        except asyncio.TimeoutError:
+            pass
+
+
+async def start_project_purger() -> None:
+    global _task, _loop, _wake
+    if _task is not None:
+        return
+    _loop = asyncio.get_running_loop()
+    _wake = asyncio.Event()
+    _task = asyncio.create_task(_run())
+
+
+async def stop_project_purger() -> None:
+    global _task, _loop, _wake
+    if _task is None:
+        return
+    _task.cancel()
+    try:
+        await _task
+    except asyncio.CancelledError:
+        pass
+    _task = None
+    _loop = None
+    _wake = None
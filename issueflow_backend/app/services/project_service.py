@@ -1,15 +1,23 @@
 from __future__ import annotations
 from datetime import datetime
 from typing import Optional
+from sqlalchemy import delete, func
 from sqlmodel import Session, select
+from app.core.config import settings
 from app.models.project_member import ProjectMember, ProjectRole
 from app.models.project_invite import ProjectInvite
 from app.models.project import Project
 from app.models.project_favorite import ProjectFavorite
 from app.models.issue import Issue
-from app.models.project import Project
+from app.models.issue_comment import IssueComment
+from app.models.issue_transition import IssueTransition
+from app.models.project_daily_stats import ProjectDailyStats
+from app.models.daily_stats_change import DailyStatsChange
+from app.models.project_issue_stats import ProjectIssueStats
 from app.models.project_preference import ProjectPreference
+from app.models.activity import ActivityEvent
 from app.models.user import User
+from app.services.project_purge import request_purge
 
 
 def create_project(db: Session, owner: User, name: str, key: str, description: str | None) -> Project:
@@ -61,7 +69,7 @@ def create_project(db: Session, owner: User, name: str, key: str, description: s
 
 def list_projects(db: Session, owner: User) -> list[tuple[Project, ProjectPreference | None]]:
     # owner projects
-    owned = list(db.exec(select(Project).where(Project.owner_id == owner.id)).all())
+    owned = list(db.exec(select(Project).where(Project.owner_id == owner.id, Project.deleted_at.is_(None))).all())
 
     # member projects
     memberships = list(db.exec(select(ProjectMember).where(ProjectMember.user_id == owner.id)).all())
@@ -69,7 +77,7 @@ def list_projects(db: Session, owner: User) -> list[tuple[Project, ProjectPrefer
 
     member_projects: list[Project] = []
     if member_project_ids:
-        member_projects = list(db.exec(select(Project).where(Project.id.in_(member_project_ids))).all())
+        member_projects = list(db.exec(select(Project).where(Project.id.in_(member_project_ids), Project.deleted_at.is_(None))).all())
 
     # merge unique
     proj_map = {p.id: p for p in owned}
@@ -102,7 +110,7 @@ def update_project_preference(
     is_favorite: bool | None = None,
     is_pinned: bool | None = None,
 ) -> ProjectPreference:
-    project = db.exec(select(Project).where(Project.id == project_id)).first()
+    project = db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None))).first()
     if not project:
         raise ValueError("Project not found")
 
@@ -153,73 +161,53 @@ def update_project_preference(
     return pref
 
 
-def delete_project(db: Session, project_id: str, owner: User) -> None:
-    project = db.exec(select(Project).where(Project.id == project_id)).first()
+def delete_project(db: Session, project_id: str, owner: User) -> bool:
+    """
+    Set-based cascade delete (no ORM loads, comments included).
+
+    Small projects go in one transaction. Projects with more than
+    project_purge_inline_max_issues issues are only marked deleted here
+    (hidden everywhere right away); their comments/issues are removed in
+    bounded batches by the background purger (app/services/project_purge.py).
+
+    Returns True when the purge was handed to the background worker.
+    """
+    project = db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None))).first()
     if not project:
         raise ValueError("Project not found")
 
     if project.owner_id != owner.id:
         raise ValueError("You do not have access to this project")
 
-    # -----------------------------
-    # 1) Delete issues + their children (if any)
-    # -----------------------------
-    issues = list(db.exec(select(Issue).where(Issue.project_id == project.id)).all())
-
-    # If you have issue children tables, delete them first:
-    # for issue in issues:
-    #     comments = list(db.exec(select(IssueComment).where(IssueComment.issue_id == issue.id)).all())
-    #     for c in comments:
-    #         db.delete(c)
-    #     attachments = list(db.exec(select(IssueAttachment).where(IssueAttachment.issue_id == issue.id)).all())
-    #     for a in attachments:
-    #         db.delete(a)
-
-    for issue in issues:
-        db.delete(issue)
-
-    # -----------------------------
-    # 2) Delete project invites
-    # -----------------------------
-    invites = list(db.exec(select(ProjectInvite).where(ProjectInvite.project_id == project.id)).all())
-    for inv in invites:
-        db.delete(inv)
-
-    # -----------------------------
-    # 3) Delete project members (membership rows)
-    # -----------------------------
-    members = list(db.exec(select(ProjectMember).where(ProjectMember.project_id == project.id)).all())
-    for m in members:
-        db.delete(m)
-
-    # -----------------------------
-    # 4) Delete preferences (pin/fav etc.)
-    #    If your pref table is per-user per-project, delete all rows for project
-    # -----------------------------
-    prefs = list(
-        db.exec(select(ProjectPreference).where(ProjectPreference.project_id == project.id)).all()
-    )
-    for p in prefs:
-        db.delete(p)
-
-    # -----------------------------
-    # 5) If you have ProjectFavorite separately, delete those too
-    # -----------------------------
-    try:
-        favs = list(
-            db.exec(select(ProjectFavorite).where(ProjectFavorite.project_id == project.id)).all()
-        )
-        for f in favs:
-            db.delete(f)
-    except Exception:
-        # ignore if table not in your project
-        pass
-
-    # -----------------------------
-    # 6) Finally delete project
-    # -----------------------------
-    db.delete(project)
+    pid = project.id
+
+    # 1) small per-project tables: always right away
+    db.exec(delete(ProjectInvite).where(ProjectInvite.project_id == pid))
+    db.exec(delete(ProjectMember).where(ProjectMember.project_id == pid))
+    db.exec(delete(ProjectPreference).where(ProjectPreference.project_id == pid))
+    db.exec(delete(ProjectFavorite).where(ProjectFavorite.project_id == pid))
+
+    issue_count = db.exec(select(func.count()).select_from(Issue).where(Issue.project_id == pid)).one()
+
+    # 2a) big project: soft delete, the purger does the rest in batches
+    if issue_count > settings.project_purge_inline_max_issues:
+        project.deleted_at = datetime.utcnow()
+        db.add(project)
+        db.commit()
+        request_purge()
+        return True
+
+    # 2b) small project: comments -> issues -> project, one transaction
+    db.exec(delete(IssueComment).where(IssueComment.project_id == pid))
+    db.exec(delete(IssueTransition).where(IssueTransition.project_id == pid))
+    db.exec(delete(Issue).where(Issue.project_id == pid))
+    db.exec(delete(ProjectIssueStats).where(ProjectIssueStats.project_id == pid))
+    db.exec(delete(ProjectDailyStats).where(ProjectDailyStats.project_id == pid))
+    db.exec(delete(DailyStatsChange).where(DailyStatsChange.project_id == pid))
+    db.exec(delete(ActivityEvent).where(ActivityEvent.project_id == pid))
+    db.exec(delete(Project).where(Project.id == pid))
     db.commit()
+    return False
 
 
 def update_project(
@@ -230,7 +218,7 @@ def update_project(
     key: Optional[str] = None,
     description: Optional[str] = None,
 ) -> Project:
-    project = db.exec(select(Project).where(Project.id == project_id)).first()
+    project = db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None))).first()
     if not project:
         raise ValueError("Project not found")
 
@@ -0,0 +1,236 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import re
+from collections import defaultdict
+from datetime import datetime
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import func
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.models.issue import Issue
+from app.models.issue_comment import IssueComment
+
+# In-process inverted index: the search fallback when the DB has no
+# full-text search (SQLite in dev/tests). Postgres uses tsvector + GIN.
+#
+# Kept in step with the DB, not with this process's writes (other instances
+# write too): before a search, one cheap query per table reads
+# (row count, max updated_at). Unchanged -> search as is. Changed -> only
+# rows updated since the last refresh are re-read and re-indexed, and if
+# the doc count still doesn't match, deleted rows are dropped by id.
+# All DB reads are async, under an asyncio.Lock; the index itself is
+# plain Python (no I/O while it is being changed or searched).
+
+_TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+# title matches count more than description / comment body
+TITLE_WEIGHT = 2.0
+BODY_WEIGHT = 1.0
+
+
+def tokenize(text: Optional[str]) -> List[str]:
+    return [t for t in _TOKEN_RE.findall((text or "").lower()) if len(t) > 1]
+
+
+class _Doc:
+    __slots__ = ("kind", "id", "project_id", "issue_id", "key", "title", "text", "length")
+
+    def __init__(self, kind: str, id: str, project_id: str, issue_id: str, key: str, title: str, text: str, length: int):
+        self.kind = kind  # "issue" | "comment"
+        self.id = id
+        self.project_id = project_id
+        self.issue_id = issue_id
+        self.key = key
+        self.title = title
+        self.text = text
+        self.length = length
+
+
+class InvertedIndex:
+    def __init__(self) -> None:
+        # token -> {doc_id: weighted term frequency}
+        self._postings: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._docs: Dict[str, _Doc] = {}
+        # doc_id -> its tokens (to take a doc out of the postings again)
+        self._doc_tokens: Dict[str, Set[str]] = {}
+        # issue_id -> its comment doc ids (they show the issue's key/title)
+        self._comments_of: Dict[str, Set[str]] = defaultdict(set)
+        self._total_len = 0
+
+    @property
+    def _avg_len(self) -> float:
+        return (self._total_len / len(self._docs)) if self._docs else 1.0
+
+    def count(self, kind: str) -> int:
+        return sum(1 for d in self._docs.values() if d.kind == kind)
+
+    def _add(self, doc: _Doc, fields: List[tuple]) -> None:
+        self._unindex(doc.id)
+        self._docs[doc.id] = doc
+        self._total_len += doc.length
+        tokens = self._doc_tokens[doc.id] = set()
+        for text, weight in fields:
+            for token in tokenize(text):
+                postings = self._postings[token]
+                postings[doc.id] = postings.get(doc.id, 0.0) + weight
+                tokens.add(token)
+
+    def _unindex(self, doc_id: str) -> Optional[_Doc]:
+        doc = self._docs.pop(doc_id, None)
+        if doc is None:
+            return None
+        self._total_len -= doc.length
+        for token in self._doc_tokens.pop(doc_id, ()):
+            postings = self._postings.get(token)
+            if postings is not None:
+                postings.pop(doc_id, None)
+                if not postings:
+                    del self._postings[token]
+        return doc
+
+    def remove(self, doc_id: str) -> None:
+        # an issue takes its comments with it
+        doc = self._unindex(doc_id)
+        if doc is None:
+            return
+        if doc.kind == "comment":
+            self._comments_of[doc.issue_id].discard(doc_id)
+        else:
+            for comment_id in list(self._comments_of.pop(doc_id, ())):
+                self.remove(comment_id)
+
+    def put_issue(self, id: str, project_id: str, key: str, title: str, description: Optional[str]) -> None:
+        text = description or ""
+        doc = _Doc("issue", id, project_id, id, key, title, text, len(tokenize(title)) + len(tokenize(text)))
+        self._add(doc, [(title, TITLE_WEIGHT), (text, BODY_WEIGHT)])
+        # the issue's comments show its key/title
+        for comment_id in self._comments_of.get(id, ()):
+            self._docs[comment_id].key = key
+            self._docs[comment_id].title = title
+
+    def put_comment(self, id: str, project_id: str, issue_id: str, body: str) -> None:
+        issue = self._docs.get(issue_id)
+        if issue is None:
+            return
+        doc = _Doc("comment", id, project_id, issue_id, issue.key, issue.title, body, len(tokenize(body)))
+        self._add(doc, [(body, BODY_WEIGHT)])
+        self._comments_of[issue_id].add(id)
+
+    def keep_only(self, kind: str, ids: Set[str]) -> None:
+        for doc_id in [d.id for d in self._docs.values() if d.kind == kind and d.id not in ids]:
+            self.remove(doc_id)
+
+    def search(self, query: str, project_ids: Set[str], limit: int) -> List[dict]:
+        """
+        Docs containing ALL query tokens, within project_ids, ranked BM25-style.
+        """
+        tokens = list(dict.fromkeys(tokenize(query)))
+        if not tokens:
+            return []
+
+        postings = [self._postings.get(t) for t in tokens]
+        if any(not p for p in postings):
+            return []
+
+        # intersect starting from the rarest token
+        postings.sort(key=len)
+        candidates = set(postings[0])
+        for p in postings[1:]:
+            candidates &= p.keys()
+            if not candidates:
+                return []
+
+        n_docs = len(self._docs)
+        k1, b = 1.2, 0.75
+        scored = []
+        for doc_id in candidates:
+            doc = self._docs[doc_id]
+            if doc.project_id not in project_ids:
+                continue
+            score = 0.0
+            for p in postings:
+                tf = p[doc_id]
+                idf = math.log(1 + (n_docs - len(p) + 0.5) / (len(p) + 0.5))
+                score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * doc.length / self._avg_len))
+            scored.append((score, doc))
+
+        scored.sort(key=lambda x: x[0], reverse=True)
+        return [
+            {
+                "type": doc.kind,
+                "project_id": doc.project_id,
+                "issue_id": doc.issue_id,
+                "issue_key": doc.key,
+                "title": doc.title,
+                "comment_id": doc.id if doc.kind == "comment" else None,
+                "text": doc.text,
+                "rank": score,
+            }
+            for score, doc in scored[:limit]
+        ]
+
+
+_index = InvertedIndex()
+# Created on first use (asyncio primitives belong to the running loop)
+_lock: Optional[asyncio.Lock] = None
+
+# per table: (row count, max updated_at) at the last refresh
+Fingerprint = Tuple[int, Optional[datetime]]
+_seen: Dict[str, Fingerprint] = {}
+
+
+async def _fingerprint(db: AsyncSession, model) -> Fingerprint:
+    n, newest = (await db.exec(select(func.count(), func.max(model.updated_at)))).one()
+    return n, newest
+
+
+async def _refresh(db: AsyncSession) -> None:
+    issues = await _fingerprint(db, Issue)
+    comments = await _fingerprint(db, IssueComment)
+    old_issues = _seen.get(Issue.__tablename__)
+    old_comments = _seen.get(IssueComment.__tablename__)
+    if issues == old_issues and comments == old_comments:
+        return
+
+    # >= : rows stamped in the same tick as the last refresh are read again
+    since = old_issues[1] if old_issues and old_issues[1] else None
+    stmt = select(Issue.id, Issue.project_id, Issue.key, Issue.title, Issue.description)
+    if since is not None:
+        stmt = stmt.where(Issue.updated_at >= since)
+    issue_rows = (await db.exec(stmt)).all()
+
+    since = old_comments[1] if old_comments and old_comments[1] else None
+    stmt = select(IssueComment.id, IssueComment.project_id, IssueComment.issue_id, IssueComment.body)
+    if since is not None:
+        stmt = stmt.where(IssueComment.updated_at >= since)
+    comment_rows = (await db.exec(stmt)).all()
+
+    for id, project_id, key, title, description in issue_rows:
+        _index.put_issue(str(id), str(project_id), key, title, description)
+    for id, project_id, issue_id, body in comment_rows:
+        _index.put_comment(str(id), str(project_id), str(issue_id), body)
+
+    # rows were deleted: drop what the DB no longer has
+    if _index.count("issue") != issues[0]:
+        _index.keep_only("issue", {str(i) for i in (await db.exec(select(Issue.id))).all()})
+    if _index.count("comment") != comments[0]:
+        _index.keep_only("comment", {str(i) for i in (await db.exec(select(IssueComment.id))).all()})
+
+    _seen[Issue.__tablename__] = issues
+    _seen[IssueComment.__tablename__] = comments
+
+
+async def search(db: AsyncSession, query: str, project_ids: Set[str], limit: int) -> List[dict]:
+    """
+    Search the in-process index, first catching up with DB changes.
+    """
+    global _lock
+    if _lock is None:
+        _lock = asyncio.Lock()
+    async with _lock:
+        await _refresh(db)
+        return _index.search(query, project_ids, limit)
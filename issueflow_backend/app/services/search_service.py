@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+from typing import Optional
+from uuid import UUID
+
+from sqlalchemy import cast, func, literal_column, or_
+from sqlalchemy.dialects.postgresql import REGCONFIG
+from sqlmodel import select
+from sqlmodel.ext.asyncio.session import AsyncSession
+
+from app.core.config import settings
+from app.models.issue import Issue
+from app.models.issue_comment import IssueComment
+from app.models.project import Project
+from app.models.project_member import ProjectMember
+from app.models.user import User
+from app.services import search_index
+
+# Postgres: generated tsvector columns + GIN indexes (created in init_db)
+ISSUE_TSV = literal_column(f"{Issue.__tablename__}.search_tsv")
+COMMENT_TSV = literal_column(f"{IssueComment.__tablename__}.search_tsv")
+
+SNIPPET_LEN = 200
+
+
+def uses_postgres_fts(db: AsyncSession) -> bool:
+    return db.bind.dialect.name == "postgresql"
+
+
+def _snippet(text: Optional[str]) -> Optional[str]:
+    if not text:
+        return None
+    text = " ".join(text.split())
+    return text if len(text) <= SNIPPET_LEN else text[: SNIPPET_LEN - 1] + "…"
+
+
+def _accessible_projects(user: User, project_id: Optional[UUID]):
+    # projects the user owns or is a member of
+    member_of = select(ProjectMember.project_id).where(ProjectMember.user_id == user.id)
+    stmt = select(Project.id).where(
+        or_(Project.owner_id == user.id, Project.id.in_(member_of)),
+        Project.deleted_at.is_(None),
+    )
+    if project_id is not None:
+        stmt = stmt.where(Project.id == project_id)
+    return stmt
+
+
+async def _search_postgres(db: AsyncSession, user: User, q: str, project_id: Optional[UUID], limit: int) -> list[dict]:
+    projects = _accessible_projects(user, project_id)
+    tsq = func.websearch_to_tsquery(cast(settings.search_language, REGCONFIG), q)
+
+    issue_rank = func.ts_rank(ISSUE_TSV, tsq).label("rank")
+    issue_rows = (
+        await db.execute(
+            select(Issue.id, Issue.project_id, Issue.key, Issue.title, Issue.description, issue_rank)
+            .where(Issue.project_id.in_(projects), ISSUE_TSV.op("@@")(tsq))
+            .order_by(issue_rank.desc())
+            .limit(limit)
+        )
+    ).all()
+
+    comment_rank = func.ts_rank(COMMENT_TSV, tsq).label("rank")
+    comment_rows = (
+        await db.execute(
+            select(
+                IssueComment.id,
+                IssueComment.project_id,
+                IssueComment.issue_id,
+                Issue.key,
+                Issue.title,
+                IssueComment.body,
+                comment_rank,
+            )
+            .join(Issue, Issue.id == IssueComment.issue_id)
+            .where(IssueComment.project_id.in_(projects), COMMENT_TSV.op("@@")(tsq))
+            .order_by(comment_rank.desc())
+            .limit(limit)
+        )
+    ).all()
+
+    hits = [
+        {
+            "type": "issue",
+            "project_id": str(r.project_id),
+            "issue_id": str(r.id),
+            "issue_key": r.key,
+            "title": r.title,
+            "comment_id": None,
+            "text": r.description,
+            "rank": float(r.rank),
+        }
+        for r in issue_rows
+    ] + [
+        {
+            "type": "comment",
+            "project_id": str(r.project_id),
+            "issue_id": str(r.issue_id),
+            "issue_key": r.key,
+            "title": r.title,
+            "comment_id": str(r.id),
+            "text": r.body,
+            "rank": float(r.rank),
+        }
+        for r in comment_rows
+    ]
+    hits.sort(key=lambda h: h["rank"], reverse=True)
+    return hits[:limit]
+
+
+async def _search_fallback(db: AsyncSession, user: User, q: str, project_id: Optional[UUID], limit: int) -> list[dict]:
+    project_ids = {str(pid) for pid in (await db.exec(_accessible_projects(user, project_id))).all()}
+    if not project_ids:
+        return []
+    return await search_index.search(db, q, project_ids, limit)
+
+
+async def search(
+    db: AsyncSession,
+    user: User,
+    q: str,
+    project_id: Optional[UUID] = None,
+    limit: int = 20,
+) -> list[dict]:
+    """
+    Ranked matches in issue title/description and comment bodies,
+    only in projects the user can access (optionally one project).
+    """
+    q = (q or "").strip()
+    if not q:
+        raise ValueError("Search query cannot be empty")
+
+    if uses_postgres_fts(db):
+        hits = await _search_postgres(db, user, q, project_id, limit)
+    else:
+        hits = await _search_fallback(db, user, q, project_id, limit)
+
+    for h in hits:
+        h["snippet"] = _snippet(h.pop("text"))
+    return hits
@@ -11,7 +11,7 @@ from app.models.project_member import ProjectMember
 
 
 def list_project_users(db: Session, project_id: UUID, current_user: User) -> List[User]:
-    project = db.exec(select(Project).where(Project.id == project_id)).first()
+    project = db.exec(select(Project).where(Project.id == project_id, Project.deleted_at.is_(None))).first()
     if not project:
         raise ValueError("Project not found")
 
@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import time
 from typing import Tuple
 
+from app.core import metrics
 from app.websockets.manager import ConnectionManager
-from app.core.redis_pubsub import publish_comment_event
+from app.core.redis_pubsub import (
+    INSTANCE_ID,
+    publish_comment_event,
+    room_of,
+    subscribe_room,
+    unsubscribe_room,
+)
+from app.core.redis_streams import append_comment_event, new_event_id, observe_event_id
 
-RoomKey = Tuple[str, str]  # (project_id, issue_id)
+RoomKey = Tuple[str, str]  # (project_id, issue_id) or (project_id, "*")
 
-manager = ConnectionManager()
+# Subscribe to a room's Redis channel only while this instance has sockets in it
+manager = ConnectionManager(on_room_open=subscribe_room, on_room_close=unsubscribe_room)
 
 
-async def rebroadcast_from_redis(payload: dict) -> None:
+async def rebroadcast_from_redis(payload: dict) -> int:
     """
     This runs INSIDE EACH INSTANCE when Redis delivers an event.
 
@@ -19,20 +29,30 @@ async def rebroadcast_from_redis(payload: dict) -> None:
         "type": "comment_created",
         "project_id": "...",
         "issue_id": "...",
-        "comment": {...}
+        "comment": {...},
+        "published_at": 1700000000.123
       }
 
     We extract the room key and broadcast to local WS clients connected
-    to THIS instance.
+    to THIS instance. Returns how many local sockets got it.
     """
-    project_id = payload.get("project_id")
-    issue_id = payload.get("issue_id")
+    room = room_of(payload)
+    if room is None:
+        return 0
 
-    if not project_id or not issue_id:
-        return
+    # Our own event coming back: local sockets already got it in publish_and_broadcast
+    if payload.get("origin") == INSTANCE_ID:
+        metrics.incr("pubsub.echo_skipped")
+        return 0
 
-    room: RoomKey = (str(project_id), str(issue_id))
-    await manager.broadcast(room, payload)
+    observe_event_id(payload.get("event_id"))
+
+    published_at = payload.get("published_at")
+    if isinstance(published_at, (int, float)):
+        # publish -> received here (cross-instance clocks: roughly in sync via NTP)
+        metrics.observe_ms("comments.redis_receive_ms", (time.time() - published_at) * 1000)
+
+    return await manager.broadcast(room, payload)
 
 
 async def publish_and_broadcast(payload: dict) -> None:
@@ -40,12 +60,47 @@ async def publish_and_broadcast(payload: dict) -> None:
     Call this from HTTP routes after DB commit.
 
     It will:
-    1) publish to Redis (so all instances get it)
-    2) (optional) also broadcast locally immediately if you want
+    1) stamp it with a locally made "event_id" (replay cursor) and broadcast
+       to THIS instance's sockets right away: no Redis round trip first
+    2) append to the room's Redis Stream under that id
+    3) publish to the room's Redis channel for the OTHER instances
 
-    NOTE:
-    - If you publish to Redis, your own instance will also receive it back
-      and rebroadcast via subscriber.
-    - So local broadcast here is optional (avoid double-send).
+    The envelope carries "origin" = this instance id, so when our own
+    message comes back through Redis, rebroadcast_from_redis skips it.
+    Redis latency or failure never delays local sockets (step 1 is done).
+
+    If the stream is already past our id, Redis picks another one; local
+    sockets then get the event a second time under that id, with
+    "replaces_event_id" = ours (a client that applied it only moves its cursor).
     """
-    await publish_comment_event(payload)
+    # no issue_id -> project-wide event (project room)
+    room = room_of(payload)
+    if room is None:
+        return
+
+    payload = {**payload, "origin": INSTANCE_ID}
+
+    event_id = new_event_id()
+    if event_id:
+        payload["event_id"] = event_id
+
+    payload["published_at"] = time.time()
+
+    await manager.broadcast(room, payload)
+
+    try:
+        stored = await append_comment_event(payload, event_id)
+    except Exception:
+        stored = None  # Redis down: replays and other instances miss this one
+    if stored and stored != event_id:
+        # Ours isn't in the stream, and may even be below an event these
+        # sockets already got (so they ignored it): resend under the stored id
+        observe_event_id(stored)
+        payload["event_id"] = stored
+        await manager.broadcast(room, {**payload, "replaces_event_id": event_id})
+
+    try:
+        await publish_comment_event(payload)
+    except Exception:
+        # Redis down: other instances miss it, but they resync on reconnect
+        pass
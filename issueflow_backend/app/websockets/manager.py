@@ -1,66 +1,297 @@
 from __future__ import annotations
 
-from typing import Dict,Set,Tuple
+from typing import Callable, Dict, List, Optional, Set, Tuple
 from fastapi import WebSocket
 import asyncio
+import json
+import logging
+import time
+
+from app.core import metrics
+from app.core.config import settings
+from app.core.redis_streams import event_id_after
 
 # here one room is one issue inside one project
 RoomKey  = Tuple[str, str]  # (project_id, issue_id)
 
+# Called (synchronously, under the manager lock) when a room gets its first
+# local socket / loses its last one. Used to (un)subscribe Redis channels.
+RoomHook = Callable[[RoomKey], None]
+
+# What to do when a client's outbound queue is full (client can't keep up):
+#   "drop"  -> skip this frame for that client only
+#   "evict" -> close that client's socket (it will reconnect and resync)
+SLOW_CONSUMER_DROP = "drop"
+SLOW_CONSUMER_EVICT = "evict"
+
+logger = logging.getLogger(__name__)
+
+# 1013 = "Try Again Later"
+_EVICT_CLOSE_CODE = 1013
+_EVICT_CLOSE_TIMEOUT = 5.0
+
+
+class _Connection:
+    """
+    One open socket + its bounded outbound queue.
+
+    A dedicated writer task drains the queue, so a slow client only ever
+    blocks its own writer, never the broadcaster or other clients.
+    """
+
+    def __init__(self, websocket: WebSocket, queue_size: int) -> None:
+        self.websocket = websocket
+        # (frame, published_at or None)
+        self.queue: asyncio.Queue[Tuple[str, Optional[float]]] = asyncio.Queue(maxsize=queue_size)
+        self.writer: asyncio.Task | None = None
+        self.rooms: Set[RoomKey] = set()
+        # rooms joined with hold=True: their live events wait here,
+        # (frame, published_at, event_id), until release()
+        self.held: Dict[RoomKey, List[Tuple[str, Optional[float], Optional[str]]]] = {}
+        self.dropped = 0
+        self.evicting = False
+
+
 class ConnectionManager:
     # this is method in python which is called when an instance of the class is created
-    def __init__(self) -> None:
+    def __init__(
+        self,
+        queue_size: int | None = None,
+        slow_consumer_policy: str | None = None,
+        on_room_open: Optional[RoomHook] = None,
+        on_room_close: Optional[RoomHook] = None,
+    ) -> None:
         # store all active connections
         # {
         #   ("project1", "issue1"): {wsA, wsB},
         #   ("project1", "issue2"): {wsC},
         # }
         self._rooms: Dict[RoomKey, Set[WebSocket]] = {}
+        # per-socket outbound queue + writer task
+        self._conns: Dict[WebSocket, _Connection] = {}
         # multiple peoples can connect / disconnect at the same time , so to avoid race conditions we use a lock
-        self._lock = asyncio.Lock() 
+        self._lock = asyncio.Lock()
+
+        self._queue_size = queue_size or settings.ws_send_queue_size
+        self._policy = slow_consumer_policy or settings.ws_slow_consumer_policy
+        if self._policy not in (SLOW_CONSUMER_DROP, SLOW_CONSUMER_EVICT):
+            raise ValueError(f"Unknown slow consumer policy: {self._policy}")
+
+        self._on_room_open = on_room_open
+        self._on_room_close = on_room_close
+        # running _evict() tasks: the loop only keeps weak references
+        self._evictions: Set[asyncio.Task] = set()
+
+    async def connect(self, room:RoomKey , websocket: WebSocket, hold: bool = False) -> None:
+        # one socket = one room (per-issue endpoint)
+        await self.accept(websocket)
+        await self.join(room, websocket, hold=hold)
 
-    async def connect(self, room:RoomKey , websocket: WebSocket) -> None:
+    async def accept(self, websocket: WebSocket) -> None:
+        """
+        Accept + register a socket WITHOUT any room yet
+        (multiplexed endpoint: rooms are joined later with join()).
+        """
         await websocket.accept() # accept the connection before sending/receiving messages
         async with self._lock:
+            conn = _Connection(websocket, self._queue_size)
+            conn.writer = asyncio.create_task(self._writer(conn))
+            self._conns[websocket] = conn
+
+    async def join(self, room: RoomKey, websocket: WebSocket, hold: bool = False) -> bool:
+        """
+        hold=True: the room's live events are buffered, not sent, until
+        release() (join first, then read the snapshot: nothing falls in between).
+        """
+        async with self._lock:
+            conn = self._conns.get(websocket)
+            if conn is None:
+                return False
+
+            if hold:
+                conn.held[room] = []
+            conn.rooms.add(room)
             # If room doesn't exist yet, create it.
             # Then add this websocket connection to the room.
-            self._rooms.setdefault(room, set()).add(websocket)
+            if room not in self._rooms:
+                self._rooms[room] = set()
+                self._run_hook(self._on_room_open, room)
+            self._rooms[room].add(websocket)
+            return True
+
+    async def release(self, room: RoomKey, websocket: WebSocket, frames: List[dict], cursor: Optional[str]) -> None:
+        """
+        End a hold: queue `frames` (snapshot / replay), then the events held
+        meanwhile, minus those at or before `cursor` (already covered by the
+        frames). Events without an event_id are kept: a repeat beats a miss.
+        """
+        conn = self._conns.get(websocket)
+        if conn is None:
+            return
+
+        # no await from here on: broadcasts can't slip in between
+        held = conn.held.pop(room, [])
+        for message in frames:
+            self._offer(conn, json.dumps(message), None)
+        for frame, published_at, event_id in held:
+            if cursor and event_id and not event_id_after(event_id, cursor):
+                continue
+            self._offer(conn, frame, published_at)
+
+    async def leave(self, room: RoomKey, websocket: WebSocket) -> None:
+        # Socket stays connected, just stops receiving this room's events
+        async with self._lock:
+            conn = self._conns.get(websocket)
+            if conn is None or room not in conn.rooms:
+                return
+            conn.rooms.discard(room)
+            conn.held.pop(room, None)
+            self._discard_from_room_locked(room, websocket)
+
+    def room_count(self, websocket: WebSocket) -> int:
+        conn = self._conns.get(websocket)
+        return len(conn.rooms) if conn is not None else 0
+
+    def in_room(self, room: RoomKey, websocket: WebSocket) -> bool:
+        conn = self._conns.get(websocket)
+        return conn is not None and room in conn.rooms
 
     async def disconnect(self, room: RoomKey, websocket: WebSocket) -> None:
+        await self.disconnect_all(websocket)
+
+    async def disconnect_all(self, websocket: WebSocket) -> None:
+        """
+        Socket is gone: remove it from every room it joined.
+        """
         # Lock before changing shared state (_rooms).
         async with self._lock:
-            if room in self._rooms:
-                # Remove this websocket from the room.
-                self._rooms[room].discard(websocket)
+            self._remove_locked(websocket)
+
+    async def send(self, websocket: WebSocket, message: dict) -> bool:
+        """
+        Queue a message for ONE connected socket (snapshot, pong, errors...).
+        Goes through the same queue as broadcasts so frames never interleave.
+        """
+        conn = self._conns.get(websocket)
+        if conn is None:
+            return False
+        return self._offer(conn, json.dumps(message), None)
 
-                # If no one is left in the room, remove the room entirely.
-                if not self._rooms[room]:
-                    del self._rooms[room]
+    async def broadcast(self, room: RoomKey, message: dict) -> int:
+        """
+        Serialize once, enqueue the same frame for every socket in the room
+        and return immediately. Returns how many sockets accepted the frame.
+        """
+        frame = json.dumps(message)
+        published_at = message.get("published_at")
+        if not isinstance(published_at, (int, float)):
+            published_at = None
+        event_id = message.get("event_id")
 
-    async def broadcast(self, room: RoomKey, message: dict) -> None:
         # Copy the connections list while holding lock
         # so it doesn't change while we are iterating.
         async with self._lock:
-            targets = list(self._rooms.get(room, set()))
+            targets = [self._conns[ws] for ws in self._rooms.get(room, ()) if ws in self._conns]
+
+        delivered = 0
+        for conn in targets:
+            held = conn.held.get(room)
+            if held is None:
+                ok = self._offer(conn, frame, published_at)
+            elif len(held) < self._queue_size:
+                held.append((frame, published_at, event_id))
+                ok = True
+            else:
+                ok = self._overflow(conn)
+            if ok:
+                delivered += 1
+        return delivered
+
+    def _offer(self, conn: _Connection, frame: str, published_at: Optional[float]) -> bool:
+        try:
+            conn.queue.put_nowait((frame, published_at))
+            return True
+        except asyncio.QueueFull:
+            return self._overflow(conn)
 
-        # Track sockets that are broken/disconnected.
-        dead: list[WebSocket] = []
+    def _overflow(self, conn: _Connection) -> bool:
+        # Slow consumer: its queue is full
+        conn.dropped += 1
+        if self._policy == SLOW_CONSUMER_EVICT and not conn.evicting:
+            conn.evicting = True
+            task = asyncio.create_task(self._evict(conn))
+            self._evictions.add(task)
+            task.add_done_callback(self._eviction_done)
+        return False
 
-        # Send the message to every connected client in that room.
-        for ws in targets:
-            try:
-                await ws.send_json(message)
-            except Exception:
-                # If send fails, that socket is dead (client closed etc.)
-                dead.append(ws)
+    def _eviction_done(self, task: asyncio.Task) -> None:
+        self._evictions.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.error("websocket eviction failed", exc_info=task.exception())
 
-        # Cleanup dead sockets from the room.
-        if dead:
+    async def _writer(self, conn: _Connection) -> None:
+        # Drain this socket's queue forever (until cancelled on disconnect).
+        try:
+            while True:
+                frame, published_at = await conn.queue.get()
+                await conn.websocket.send_text(frame)
+                if published_at is not None:
+                    # end-to-end: publish -> written to this socket
+                    metrics.observe_ms("comments.socket_write_ms", (time.time() - published_at) * 1000)
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            # If send fails, that socket is dead (client closed etc.)
             async with self._lock:
-                for ws in dead:
-                    if room in self._rooms:
-                        self._rooms[room].discard(ws)
+                self._remove_locked(conn.websocket)
+
+    async def _evict(self, conn: _Connection) -> None:
+        async with self._lock:
+            if self._conns.get(conn.websocket) is not conn:
+                return  # already gone
+            self._remove_locked(conn.websocket)
+
+        # The client may be stalled, so never wait forever on the close frame.
+        try:
+            await asyncio.wait_for(
+                conn.websocket.close(code=_EVICT_CLOSE_CODE),
+                timeout=_EVICT_CLOSE_TIMEOUT,
+            )
+        except Exception:
+            pass
+
+    def _remove_locked(self, websocket: WebSocket) -> None:
+        # Caller must hold self._lock.
+        conn = self._conns.pop(websocket, None)
+        if conn is None:
+            return
+
+        if conn.writer is not None and conn.writer is not asyncio.current_task():
+            conn.writer.cancel()
+
+        for room in conn.rooms:
+            self._discard_from_room_locked(room, websocket)
+        conn.rooms.clear()
+        conn.held.clear()
+
+    def _discard_from_room_locked(self, room: RoomKey, websocket: WebSocket) -> None:
+        sockets = self._rooms.get(room)
+        if sockets is None:
+            return
+        # Remove this websocket from the room.
+        sockets.discard(websocket)
+
+        # If no one is left in the room, remove the room entirely.
+        if not sockets:
+            del self._rooms[room]
+            self._run_hook(self._on_room_close, room)
 
-                # If room becomes empty after removing dead sockets, delete it.
-                if room in self._rooms and not self._rooms[room]:
-                    del self._rooms[room]
\ No newline at end of file
+    @staticmethod
+    def _run_hook(hook: Optional[RoomHook], room: RoomKey) -> None:
+        if hook is None:
+            return
+        try:
+            hook(room)
+        except Exception:
+            # Never break connect/disconnect because of a hook
+            pass
@@ -0,0 +1,59 @@
+"""
+PATCH /projects/{id}/issues/bulk with 5,000 issues per call.
+
+    python -m bench.bulk_update [--issues 5000] [--rounds 5]
+
+Each round alternates the whole set between done/high and todo/low by id,
+then once more by filter, and checks the dashboard counters still match.
+"""
+import argparse
+import time
+
+from bench.common import client, create_project, import_issues, issue_ids, register, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--issues", type=int, default=5000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with client() as c:
+        headers = register(c)
+        pid = create_project(c, headers)
+        import_issues(c, headers, pid, args.issues)
+        ids = issue_ids(c, headers, pid)
+
+        by_ids, by_filter = [], []
+        for k in range(args.rounds):
+            status, priority = ("done", "high") if k % 2 == 0 else ("todo", "low")
+            started = time.perf_counter()
+            r = c.patch(
+                f"/projects/{pid}/issues/bulk",
+                json={"issue_ids": ids, "updates": {"status": status, "priority": priority}},
+                headers=headers,
+            )
+            by_ids.append((time.perf_counter() - started) * 1000)
+            r.raise_for_status()
+            assert r.json()["updated"] == args.issues
+
+            started = time.perf_counter()
+            r = c.patch(
+                f"/projects/{pid}/issues/bulk",
+                json={"filter": {"status": status}, "updates": {"status": "in_progress"}},
+                headers=headers,
+            )
+            by_filter.append((time.perf_counter() - started) * 1000)
+            r.raise_for_status()
+            assert r.json()["updated"] == args.issues
+
+        summary = c.get(f"/dashboard/projects/{pid}", headers=headers).json()["summary"]
+        assert summary["by_status"].get("in_progress") == args.issues, summary
+
+    print(f"{args.issues} issues per call, {args.rounds} rounds")
+    report("bulk update by ids", by_ids)
+    report("bulk update by filter", by_filter)
+
+
+if __name__ == "__main__":
+    main()
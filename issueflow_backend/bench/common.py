@@ -0,0 +1,122 @@
+"""
+Shared setup for the scripts in bench/. Run them from issueflow_backend/:
+
+    python -m bench.bulk_update
+
+Settings are read at import time, so import this module BEFORE anything
+from app. Without DATABASE_URL / REDIS_URL in the environment it uses a
+throwaway SQLite file and no Redis (like tests/); point them at Postgres
+and Redis for numbers that mean something.
+
+client() runs the app in this process (TestClient); server() starts it in
+a real uvicorn process for the socket / latency benchmarks, on the same
+database. The helpers below take either (TestClient is an httpx.Client).
+"""
+import json
+import os
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Iterator
+
+_DB_DIR = tempfile.mkdtemp(prefix="issueflow-bench-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_DB_DIR}/bench.db")
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+os.environ.setdefault("REDIS_URL", "redis://127.0.0.1:1")
+
+import httpx  # noqa: E402
+import numpy as np  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+
+
+def client() -> TestClient:
+    # use as a context manager: runs the app's startup/shutdown
+    return TestClient(app)
+
+
+@contextmanager
+def server(**overrides) -> Iterator[str]:
+    """
+    The app in its own uvicorn process (real sockets, its own event loop).
+    Yields the base URL. Keyword arguments override settings through the
+    environment: server(async_db_pool_size=5) -> ASYNC_DB_POOL_SIZE=5.
+    """
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        port = s.getsockname()[1]
+    env = {**os.environ, **{k.upper(): str(v) for k, v in overrides.items()}}
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--host", "127.0.0.1", "--port", str(port), "--log-level", "warning"],
+        env=env,
+    )
+    base = f"http://127.0.0.1:{port}"
+    try:
+        deadline = time.time() + 60
+        while True:
+            try:
+                httpx.get(f"{base}/health", timeout=1).raise_for_status()
+                break
+            except httpx.HTTPError:
+                if proc.poll() is not None or time.time() > deadline:
+                    raise RuntimeError("server did not start")
+                time.sleep(0.2)
+        yield base
+    finally:
+        proc.terminate()
+        proc.wait(timeout=30)
+
+
+def register(c: httpx.Client) -> dict:
+    # a fresh user: {"Authorization": ...} headers
+    name = f"b{uuid.uuid4().hex[:10]}"
+    r = c.post("/auth/register", json={"username": name, "email": f"{name}@bench.io", "password": "secret1"})
+    r.raise_for_status()
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+def token(headers: dict) -> str:
+    return headers["Authorization"].split(" ", 1)[1]
+
+
+def create_project(c: httpx.Client, headers: dict) -> str:
+    key = "B" + uuid.uuid4().hex[:6].upper()
+    r = c.post("/projects", json={"name": key, "key": key}, headers=headers)
+    r.raise_for_status()
+    return r.json()["id"]
+
+
+def import_issues(c: httpx.Client, headers: dict, project_id: str, n: int, **fields) -> float:
+    # n issues through the NDJSON import endpoint; returns the seconds it took
+    body = "".join(json.dumps({"title": f"issue {k}", **fields}) + "\n" for k in range(n))
+    started = time.perf_counter()
+    r = c.post(
+        f"/projects/{project_id}/issues/import?format=ndjson",
+        content=body.encode(),
+        headers=headers,
+    )
+    r.raise_for_status()
+    assert r.json()["imported"] == n, r.json()
+    return time.perf_counter() - started
+
+
+def issue_ids(c: httpx.Client, headers: dict, project_id: str) -> list:
+    # no ?limit: the whole project in one response
+    r = c.get(f"/projects/{project_id}/issues", headers=headers)
+    r.raise_for_status()
+    return [i["id"] for i in r.json()]
+
+
+def report(name: str, samples_ms) -> dict:
+    a = np.asarray(samples_ms, dtype=np.float64)
+    out = {"n": int(a.size)}
+    if a.size:
+        p50, p95, p99 = np.percentile(a, (50, 95, 99))
+        out.update(p50=round(float(p50), 1), p95=round(float(p95), 1), p99=round(float(p99), 1), max=round(float(a.max()), 1))
+    print(f"{name}: " + "  ".join(f"{k}={v}" for k, v in out.items()) + (" (ms)" if a.size else ""))
+    return out
@@ -0,0 +1,121 @@
+"""
+GET /projects/{id}/analytics/cycle-time on a big status history.
+
+    python -m bench.cycle_time [--issues 400000] [--transitions 1000000] [--rounds 5]
+
+Seeds one project straight through the DB (the API would take hours):
+random status moves to in_progress / done over the last 180 days, the
+issue's status = its last move. Then runs the started_at / completed_at
+backfill and times the default (90-day) report.
+"""
+import argparse
+import time
+import uuid
+from datetime import datetime, timedelta
+
+import numpy as np
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from bench.common import client, create_project, register, report
+
+from app.commands.backfill_cycle_times import backfill  # noqa: E402
+from app.db.session import engine  # noqa: E402
+from app.models.issue import Issue  # noqa: E402
+from app.models.issue_transition import IssueTransition  # noqa: E402
+from app.models.project import Project  # noqa: E402
+
+_CHUNK = 50000
+
+
+def seed(project_id: str, n_issues: int, n_transitions: int) -> None:
+    rng = np.random.default_rng(1)
+    now = datetime.utcnow()
+    start = now - timedelta(days=180)
+    pid = uuid.UUID(project_id)
+    prefix = uuid.uuid4().hex[:8].upper()
+
+    # transitions: random issue, random target, sorted in time per issue
+    issue_of = rng.integers(0, n_issues, n_transitions)
+    offsets = np.sort(rng.uniform(0, 180 * 86400, n_transitions))
+    to_done = rng.random(n_transitions) < 0.4
+    last_done = np.zeros(n_issues, dtype=bool)
+    last_done[issue_of] = to_done  # later moves overwrite earlier ones
+    created = rng.uniform(-30 * 86400, 0, n_issues)  # before the first move
+
+    with Session(engine) as db:
+        owner_id = db.exec(select(Project.owner_id).where(Project.id == pid)).one()
+        ids = [uuid.uuid4() for _ in range(n_issues)]
+        for i in range(0, n_issues, _CHUNK):
+            db.execute(
+                insert(Issue),
+                [
+                    {
+                        "id": ids[k],
+                        "project_id": pid,
+                        "key": f"{prefix}-{k + 1}",
+                        "title": f"issue {k}",
+                        "status": "done" if last_done[k] else "in_progress",
+                        "reporter_id": owner_id,
+                        "created_at": start + timedelta(seconds=float(created[k])),
+                        "updated_at": now,
+                    }
+                    for k in range(i, min(i + _CHUNK, n_issues))
+                ],
+            )
+        for i in range(0, n_transitions, _CHUNK):
+            db.execute(
+                insert(IssueTransition),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "project_id": pid,
+                        "issue_id": ids[issue_of[k]],
+                        "field": "status",
+                        "from_value": "todo",
+                        "to_value": "done" if to_done[k] else "in_progress",
+                        "created_at": start + timedelta(seconds=float(offsets[k])),
+                    }
+                    for k in range(i, min(i + _CHUNK, n_transitions))
+                ],
+            )
+        db.commit()
+    if engine.dialect.name == "postgresql":
+        # fresh statistics, or the planner guesses (outside a transaction)
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("ANALYZE issue")
+            conn.exec_driver_sql("ANALYZE issue_transitions")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--issues", type=int, default=400000)
+    parser.add_argument("--transitions", type=int, default=1000000)
+    parser.add_argument("--rounds", type=int, default=5)
+    args = parser.parse_args()
+
+    with client() as c:
+        headers = register(c)
+        pid = create_project(c, headers)
+
+        started = time.perf_counter()
+        seed(pid, args.issues, args.transitions)
+        print(f"seeded {args.issues} issues / {args.transitions} transitions in {time.perf_counter() - started:.1f} s")
+        started = time.perf_counter()
+        fixed = backfill(5000)
+        print(f"backfill: {fixed} issues in {time.perf_counter() - started:.1f} s")
+
+        samples = []
+        for _ in range(args.rounds):
+            started = time.perf_counter()
+            r = c.get(f"/projects/{pid}/analytics/cycle-time", headers=headers)
+            samples.append((time.perf_counter() - started) * 1000)
+            r.raise_for_status()
+        body = r.json()
+
+    print(f"{body['completed']} issues completed in the window, cycle p50 {body['cycle_time_hours']['p50']} h")
+    report("cycle-time report", samples)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+dashboard_home for a user with 200 projects: its queries one after the
+other (as before) vs concurrently (as now).
+
+    python -m bench.dashboard [--projects 200] [--issues 100] [--rounds 50]
+
+The projects are created through the API (in a uvicorn process), their
+issues straight through the DB: half assigned to the user, due dates
+spread over -14..+14 days, then the stats rows are rebuilt. The service is
+timed in this process, not over HTTP: the route caches its body. "before"
+awaits the same queries in order instead of gathering them.
+
+PG 16 on a unix socket, 1 CPU, 200 projects x 100 issues (10k assigned
+to the user, ~145k issues in the table):
+
+    before: p50=10.5  p95=13.0  p99=13.6 (ms)
+    after:  p50=9.7   p95=17.1  p99=56.3 (ms)
+
+A wash here: with the (assignee_id, ...) indexes every query is ~0.1 ms
+inside Postgres, and the rest (checkout + pre-ping, BEGIN, asyncpg, ORM
+rows) is Python work that one core can't overlap. The gather pays off
+when each round trip is real network time. The indexes are what moved
+the biggest queries: "my assigned" 6.5 -> 0.1 ms, "overdue" 1.0 -> 0.06 ms
+(EXPLAIN ANALYZE, same data).
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from unittest import mock
+
+import httpx
+import numpy as np
+from sqlalchemy import insert
+from sqlmodel import Session, select
+
+from bench.common import create_project, register, report, server, token
+
+from app.core.security import decode_token  # noqa: E402
+from app.db.session import async_engine, engine  # noqa: E402
+from app.models.issue import Issue, IssuePriority, IssueStatus  # noqa: E402
+from app.models.user import User  # noqa: E402
+from app.services import dashboard_service  # noqa: E402
+from app.services.issue_stats_service import rebuild_project_stats  # noqa: E402
+
+
+def seed(user_id: uuid.UUID, project_ids: list, per_project: int) -> None:
+    rng = np.random.default_rng(1)
+    now = datetime.utcnow()
+    today = date.today()
+    statuses = list(IssueStatus)
+    priorities = list(IssuePriority)
+    prefix = uuid.uuid4().hex[:6].upper()
+    with Session(engine) as db:
+        for p, project_id in enumerate(project_ids):
+            pid = uuid.UUID(project_id)
+            db.execute(
+                insert(Issue),
+                [
+                    {
+                        "id": uuid.uuid4(),
+                        "project_id": pid,
+                        "key": f"{prefix}{p}-{k + 1}",
+                        "title": f"issue {k}",
+                        "status": statuses[rng.integers(len(statuses))],
+                        "priority": priorities[rng.integers(len(priorities))],
+                        "reporter_id": user_id,
+                        "assignee_id": user_id if k % 2 else None,
+                        "due_date": today + timedelta(days=int(rng.integers(-14, 15))),
+                        "created_at": now,
+                        "updated_at": now - timedelta(minutes=int(rng.integers(0, 10000))),
+                    }
+                    for k in range(per_project)
+                ],
+            )
+        db.commit()
+        for project_id in project_ids:
+            rebuild_project_stats(db, uuid.UUID(project_id))
+    if engine.dialect.name == "postgresql":
+        with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            conn.exec_driver_sql("VACUUM ANALYZE issue")  # or autovacuum lands mid-run
+
+
+async def _sequential(*aws):
+    return [await a for a in aws]
+
+
+async def measure(user: User, rounds: int) -> dict:
+    out = {}
+    for name, gather in (("before", _sequential), ("after", asyncio.gather)):
+        with mock.patch.object(dashboard_service.asyncio, "gather", gather):
+            await dashboard_service.dashboard_home(user)  # warm the pool
+            samples = []
+            for _ in range(rounds):
+                started = time.perf_counter()
+                body = await dashboard_service.dashboard_home(user)
+                samples.append((time.perf_counter() - started) * 1000)
+        out[name] = report(name, samples)
+    print(f"{body['projects_count']} projects, {body['issues_count']} issues, {len(body['due_soon'])} due soon")
+    await async_engine.dispose()
+    return out
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--projects", type=int, default=200)
+    parser.add_argument("--issues", type=int, default=100)
+    parser.add_argument("--rounds", type=int, default=50)
+    args = parser.parse_args()
+
+    with server() as base, httpx.Client(base_url=base, timeout=30) as c:
+        headers = register(c)
+        project_ids = [create_project(c, headers) for _ in range(args.projects)]
+    user_id = uuid.UUID(decode_token(token(headers))["sub"])
+
+    started = time.perf_counter()
+    seed(user_id, project_ids, args.issues)
+    print(f"seeded {args.projects} projects x {args.issues} issues in {time.perf_counter() - started:.1f} s")
+
+    with Session(engine) as db:
+        user = db.exec(select(User).where(User.id == user_id)).one()
+    asyncio.run(measure(user, args.rounds))
+
+
+if __name__ == "__main__":
+    main()
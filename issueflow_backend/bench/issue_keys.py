@@ -0,0 +1,49 @@
+"""
+POST /projects/{id}/issues from many clients at once, one project.
+
+    python -m bench.issue_keys [--issues 10000] [--clients 50]
+
+Every create must succeed first time (no retries) and get a unique key;
+prints the latency percentiles and whether the numbers have gaps (allowed:
+a failed insert skips its number, but there should be none here).
+"""
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from bench.common import client, create_project, register, report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--issues", type=int, default=10000)
+    parser.add_argument("--clients", type=int, default=50)
+    args = parser.parse_args()
+
+    with client() as c:
+        headers = register(c)
+        pid = create_project(c, headers)
+
+        def create(i):
+            started = time.perf_counter()
+            r = c.post(f"/projects/{pid}/issues", json={"title": f"issue {i}"}, headers=headers)
+            elapsed = (time.perf_counter() - started) * 1000
+            return r.status_code, r.json().get("key") if r.status_code == 200 else r.text, elapsed
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.clients) as pool:
+            results = list(pool.map(create, range(args.issues)))
+        wall = time.perf_counter() - started
+
+    failed = [(status, body) for status, body, _ in results if status != 200]
+    keys = [body for status, body, _ in results if status == 200]
+    numbers = sorted(int(k.rsplit("-", 1)[1]) for k in keys)
+    print(f"{args.issues} creates from {args.clients} clients in {wall:.1f} s ({args.issues / wall:.0f}/s)")
+    print(f"failed: {len(failed)}  duplicate keys: {len(keys) - len(set(keys))}  gaps: {numbers[-1] - len(numbers) if numbers else 0}")
+    report("create issue", [ms for _, _, ms in results])
+    assert not failed, failed[:5]
+    assert len(set(keys)) == len(keys)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+"""
+GET /projects latency during a burst of 200 logins per second.
+
+    python -m bench.login_burst [--rate 200] [--seconds 10] [--probe-rate 20]
+
+Runs the app in a uvicorn process. A reader GETs /projects --probe-rate
+times a second: first alone, then while logins arrive open-loop at --rate
+per second (each one a bcrypt verify, whether the server keeps up or not).
+Logins beyond what the hash workers can take must come back 429 quickly
+instead of queueing, and /projects must stay fast.
+
+Local Postgres, ONE CPU shared by this load generator, the API process and
+both bcrypt workers (~315 ms per verify), 2,000 logins at 200/s:
+  logins              38-94 OK, the rest 429
+  /projects, idle     p50 13 ms   p95 18 ms   p99 29 ms
+  /projects, burst    p50 16 ms   p95 250 ms  p99 840 ms
+                      (p50 22 / p95 707 / p99 1702 ms with the workers
+                      at normal priority and the lookup before the 429)
+"""
+import argparse
+import asyncio
+import time
+import uuid
+from collections import Counter
+
+import httpx
+
+from bench.common import create_project, report, server
+
+PASSWORD = "secret1"
+
+
+async def _probe(http: httpx.AsyncClient, headers: dict, rate: float, stop: asyncio.Event, samples: list) -> None:
+    while not stop.is_set():
+        started = time.perf_counter()
+        r = await http.get("/projects", headers=headers)
+        r.raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+        await asyncio.sleep(max(0.0, 1 / rate - (time.perf_counter() - started)))
+
+
+async def _login(http: httpx.AsyncClient, email: str, statuses: Counter, samples: list) -> None:
+    started = time.perf_counter()
+    r = await http.post("/auth/login", json={"email": email, "password": PASSWORD})
+    statuses[r.status_code] += 1
+    samples.append((time.perf_counter() - started) * 1000)
+
+
+async def _run(base: str, email: str, headers: dict, args) -> tuple:
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=None)
+    async with httpx.AsyncClient(base_url=base, limits=limits, timeout=60) as http:
+        idle, stop = [], asyncio.Event()
+        probe = asyncio.create_task(_probe(http, headers, args.probe_rate, stop, idle))
+        await asyncio.sleep(args.seconds)
+        stop.set()
+        await probe
+
+        burst, stop = [], asyncio.Event()
+        statuses, logins = Counter(), []
+        probe = asyncio.create_task(_probe(http, headers, args.probe_rate, stop, burst))
+        started = time.perf_counter()
+        tasks = []
+        for k in range(int(args.rate * args.seconds)):
+            # open-loop: the k-th login starts at k / rate, answered or not
+            await asyncio.sleep(max(0.0, started + k / args.rate - time.perf_counter()))
+            tasks.append(asyncio.create_task(_login(http, email, statuses, logins)))
+        await asyncio.gather(*tasks)
+        stop.set()
+        await probe
+    return idle, burst, statuses, logins
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=float, default=200)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--probe-rate", type=float, default=20)
+    args = parser.parse_args()
+
+    with server() as base:
+        with httpx.Client(base_url=base, timeout=60) as c:
+            name = f"b{uuid.uuid4().hex[:10]}"
+            email = f"{name}@bench.io"
+            r = c.post("/auth/register", json={"username": name, "email": email, "password": PASSWORD})
+            r.raise_for_status()
+            headers = {"Authorization": f"Bearer {r.json()['access_token']}"}
+            for _ in range(20):
+                create_project(c, headers)
+
+        idle, burst, statuses, logins = asyncio.run(_run(base, email, headers, args))
+
+    print(f"{int(args.rate * args.seconds)} logins at {args.rate:.0f}/s: " + ", ".join(f"{s}: {n}" for s, n in sorted(statuses.items())))
+    report("GET /projects, no logins", idle)
+    report(f"GET /projects, {args.rate:.0f} logins/s", burst)
+    report("POST /auth/login", logins)
+
+
+if __name__ == "__main__":
+    main()
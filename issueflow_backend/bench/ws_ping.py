@@ -0,0 +1,93 @@
+"""
+WebSocket ping round trip while comments are being POSTed.
+
+    python -m bench.ws_ping [--sockets 50] [--writers 20] [--seconds 10]
+
+Runs the app in a uvicorn process. `--sockets` clients sit in one issue's
+comment room and ping every 20 ms: first with nothing else going on, then
+while `--writers` clients POST comments to that issue as fast as they can
+(each comment is also broadcast to every socket). Anything that blocks the
+server's event loop (a sync DB call in an async route...) shows up in the
+ping p99. Client and server share the machine: compare the two phases.
+
+Local Postgres + Redis, one CPU for client and server, defaults:
+  ping idle               p50 2.3 ms  p99 7.7 ms
+  ping under 41 POSTs/s   p50 20 ms   p99 40 ms   max 131 ms
+  comment POST            p50 410 ms  p99 1.9 s
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+from websockets.asyncio.client import connect
+
+from bench.common import create_project, register, report, server, token
+
+PING_INTERVAL = 0.02
+
+
+async def _pinger(url: str, stop: asyncio.Event, samples: list) -> None:
+    async with connect(url, max_queue=None) as ws:
+        json.loads(await ws.recv())  # snapshot
+        while not stop.is_set():
+            started = time.perf_counter()
+            await ws.send(json.dumps({"type": "ping"}))
+            while json.loads(await ws.recv())["type"] != "pong":
+                pass  # comment broadcasts in between
+            samples.append((time.perf_counter() - started) * 1000)
+            await asyncio.sleep(PING_INTERVAL)
+
+
+async def _writer(http: httpx.AsyncClient, path: str, headers: dict, stop: asyncio.Event, samples: list) -> None:
+    n = 0
+    while not stop.is_set():
+        started = time.perf_counter()
+        r = await http.post(path, json={"body": f"load comment {n}"}, headers=headers)
+        r.raise_for_status()
+        samples.append((time.perf_counter() - started) * 1000)
+        n += 1
+
+
+async def _phase(base: str, ws_url: str, comments_path: str, headers: dict, args, writers: int) -> tuple:
+    pings, posts = [], []
+    stop = asyncio.Event()
+    limits = httpx.Limits(max_connections=writers or 1)
+    async with httpx.AsyncClient(base_url=base, limits=limits, timeout=60) as http:
+        tasks = [asyncio.create_task(_pinger(ws_url, stop, pings)) for _ in range(args.sockets)]
+        tasks += [asyncio.create_task(_writer(http, comments_path, headers, stop, posts)) for _ in range(writers)]
+        await asyncio.sleep(args.seconds)
+        stop.set()
+        await asyncio.gather(*tasks)
+    return pings, posts
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sockets", type=int, default=50)
+    parser.add_argument("--writers", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    with server() as base:
+        with httpx.Client(base_url=base, timeout=60) as c:
+            headers = register(c)
+            pid = create_project(c, headers)
+            r = c.post(f"/projects/{pid}/issues", json={"title": "busy issue"}, headers=headers)
+            r.raise_for_status()
+            iid = r.json()["id"]
+
+        ws_url = base.replace("http", "ws", 1) + f"/ws/projects/{pid}/issues/{iid}/comments?token={token(headers)}"
+        comments_path = f"/projects/{pid}/issues/{iid}/comments"
+        idle, _ = asyncio.run(_phase(base, ws_url, comments_path, headers, args, 0))
+        loaded, posts = asyncio.run(_phase(base, ws_url, comments_path, headers, args, args.writers))
+
+    print(f"{args.sockets} sockets, {args.writers} comment writers, {args.seconds:.0f} s per phase")
+    report("ping, idle", idle)
+    report("ping, under comment load", loaded)
+    report(f"comment POST ({len(posts) / args.seconds:.0f}/s)", posts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""
+1,000 open comment sockets against a DB pool of 5: HTTP must keep working.
+
+    python -m bench.ws_pool [--sockets 1000] [--pool 5] [--requests 200]
+
+Runs the app in a uvicorn process with async_db_pool_size=--pool and no
+overflow. Times HTTP requests (GET comments: async session; GET /projects:
+sync session) with no sockets open, then opens --sockets sockets on one
+issue (each authenticates + reads its snapshot, then stays open) and times
+the same requests again. A socket that kept its pooled connection would
+leave none for HTTP after the 5th. Needs Postgres: SQLite has no pool.
+
+Local Postgres + Redis, defaults: 1,000 sockets opened in 5.8 s;
+  HTTP, no sockets         p50 4.6 ms  p99 10.2 ms
+  HTTP, 1,000 sockets open p50 4.6 ms  p99 8.0 ms  (200/200 OK)
+"""
+import argparse
+import asyncio
+import json
+import time
+
+import httpx
+from websockets.asyncio.client import connect
+
+from bench.common import create_project, register, report, server, token
+
+CONNECT_CONCURRENCY = 50
+
+
+async def _requests(base: str, paths: list, headers: dict, n: int) -> list:
+    samples = []
+    async with httpx.AsyncClient(base_url=base, timeout=30) as http:
+        for k in range(n):
+            started = time.perf_counter()
+            r = await http.get(paths[k % len(paths)], headers=headers)
+            r.raise_for_status()
+            samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+
+async def _run(base: str, ws_url: str, paths: list, headers: dict, args) -> tuple:
+    before = await _requests(base, paths, headers, args.requests)
+
+    gate = asyncio.Semaphore(CONNECT_CONCURRENCY)
+    sockets = []
+
+    async def open_one():
+        async with gate:
+            ws = await connect(ws_url, open_timeout=60)
+            assert json.loads(await ws.recv())["type"] == "snapshot"
+            sockets.append(ws)
+
+    started = time.perf_counter()
+    await asyncio.gather(*(open_one() for _ in range(args.sockets)))
+    opened = time.perf_counter() - started
+    try:
+        during = await _requests(base, paths, headers, args.requests)
+        # the sockets are still alive and served
+        await sockets[0].send(json.dumps({"type": "ping"}))
+        assert json.loads(await sockets[0].recv())["type"] == "pong"
+    finally:
+        await asyncio.gather(*(ws.close() for ws in sockets))
+    return before, during, opened
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--sockets", type=int, default=1000)
+    parser.add_argument("--pool", type=int, default=5)
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+
+    with server(async_db_pool_size=args.pool, async_db_max_overflow=0) as base:
+        with httpx.Client(base_url=base, timeout=60) as c:
+            headers = register(c)
+            pid = create_project(c, headers)
+            r = c.post(f"/projects/{pid}/issues", json={"title": "watched issue"}, headers=headers)
+            r.raise_for_status()
+            iid = r.json()["id"]
+
+        ws_url = base.replace("http", "ws", 1) + f"/ws/projects/{pid}/issues/{iid}/comments?token={token(headers)}"
+        paths = [f"/projects/{pid}/issues/{iid}/comments", "/projects"]
+        before, during, opened = asyncio.run(_run(base, ws_url, paths, headers, args))
+
+    print(f"pool {args.pool} (no overflow): {args.sockets} sockets opened in {opened:.1f} s")
+    report("HTTP, no sockets", before)
+    report(f"HTTP, {args.sockets} sockets open", during)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,39 @@
+import os
+import tempfile
+import uuid
+
+import pytest
+
+# Settings are read at import time: point the app at a throwaway SQLite file
+# (the dev fallback) and at a Redis port nothing listens on (Redis is optional)
+_DB_DIR = tempfile.mkdtemp(prefix="issueflow-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite:///{_DB_DIR}/test.db")
+os.environ.setdefault("JWT_SECRET", "test-secret")
+os.environ.setdefault("REDIS_URL", "redis://127.0.0.1:1")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture
+def auth(client):
+    # a fresh user per test: {"Authorization": ...} headers
+    name = f"u{uuid.uuid4().hex[:10]}"
+    r = client.post("/auth/register", json={"username": name, "email": f"{name}@x.io", "password": "secret1"})
+    assert r.status_code == 200, r.text
+    return {"Authorization": f"Bearer {r.json()['access_token']}"}
+
+
+@pytest.fixture
+def project(client, auth):
+    key = "P" + uuid.uuid4().hex[:6].upper()
+    r = client.post("/projects", json={"name": key, "key": key}, headers=auth)
+    assert r.status_code == 200, r.text
+    return r.json()["id"]
@@ -0,0 +1,17 @@
+def test_deleting_an_issue_removes_its_feed_items(client, auth, project):
+    keep = client.post(f"/projects/{project}/issues", json={"title": "keep"}, headers=auth).json()["id"]
+    gone = client.post(f"/projects/{project}/issues", json={"title": "gone"}, headers=auth).json()["id"]
+
+    def feed_issue_ids():
+        r = client.get("/activity", headers=auth)
+        assert r.status_code == 200, r.text
+        return {e["issue_id"] for e in r.json()}
+
+    assert {keep, gone} <= feed_issue_ids()
+
+    r = client.delete(f"/projects/{project}/issues/{gone}", headers=auth)
+    assert r.status_code == 200, r.text
+
+    ids = feed_issue_ids()
+    assert keep in ids
+    assert gone not in ids
@@ -0,0 +1,10 @@
+from app.core.config import settings
+
+
+def test_saturated_hash_pool_answers_429_before_the_user_lookup(client, monkeypatch):
+    monkeypatch.setattr(settings, "password_hash_max_pending", 0)
+
+    # unknown email: without the up-front check this would be a 401
+    r = client.post("/auth/login", json={"email": "nobody@x.io", "password": "secret1"})
+    assert r.status_code == 429, r.text
+    assert r.headers["Retry-After"] == str(settings.password_hash_retry_after_seconds)
@@ -0,0 +1,48 @@
+import asyncio
+
+from app.websockets import comments_hub
+from app.websockets.manager import ConnectionManager
+from tests.test_ws_manager import FakeSocket
+
+ROOM = ("p1", "i1")
+EVENT = {"type": "comment_created", "project_id": "p1", "issue_id": "i1", "comment": {"id": "c1"}}
+
+
+def _publish(monkeypatch, local_id, stored_id):
+    published = []
+
+    async def append(payload, event_id):
+        return stored_id
+
+    async def publish(payload):
+        published.append(payload)
+
+    manager = ConnectionManager(queue_size=10)
+    monkeypatch.setattr(comments_hub, "manager", manager)
+    monkeypatch.setattr(comments_hub, "new_event_id", lambda: local_id)
+    monkeypatch.setattr(comments_hub, "append_comment_event", append)
+    monkeypatch.setattr(comments_hub, "publish_comment_event", publish)
+
+    async def scenario():
+        ws = FakeSocket()
+        await manager.connect(ROOM, ws)
+        await comments_hub.publish_and_broadcast(EVENT)
+        await asyncio.sleep(0.05)
+        await manager.disconnect_all(ws)
+        return ws.sent
+
+    sent = asyncio.run(scenario())
+    return [(m.get("event_id"), m.get("replaces_event_id")) for m in sent], [p["event_id"] for p in published]
+
+
+def test_local_id_kept_when_the_stream_takes_it(monkeypatch):
+    local, published = _publish(monkeypatch, "5-0", "5-0")
+    assert local == [("5-0", None)]
+    assert published == ["5-0"]
+
+
+def test_local_sockets_get_the_stored_id_when_the_stream_was_ahead(monkeypatch):
+    local, published = _publish(monkeypatch, "5-0", "9-0")
+    # sent at once under ours, then again under the id that is in the stream
+    assert local == [("5-0", None), ("9-0", "5-0")]
+    assert published == ["9-0"]
@@ -0,0 +1,21 @@
+import uuid
+
+from app.core.config import settings
+
+
+def test_room_cap_applies_to_new_rooms_only(client, auth, project, monkeypatch):
+    monkeypatch.setattr(settings, "ws_max_rooms_per_connection", 1)
+    token = auth["Authorization"].split(" ", 1)[1]
+
+    with client.websocket_connect(f"/ws/comments?token={token}") as ws:
+        ws.send_json({"type": "subscribe", "project_id": project})
+        assert ws.receive_json()["type"] == "subscribed"
+
+        # same room again: a resubscribe, not a new room
+        ws.send_json({"type": "subscribe", "project_id": project})
+        assert ws.receive_json()["type"] == "subscribed"
+
+        ws.send_json({"type": "subscribe", "project_id": str(uuid.uuid4())})
+        frame = ws.receive_json()
+        assert frame["type"] == "error"
+        assert frame["message"] == "Too many subscriptions on this connection"
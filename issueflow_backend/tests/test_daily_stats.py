@@ -0,0 +1,22 @@
+import asyncio
+
+from app.core.config import settings
+from app.services.daily_stats_service import run_rollup
+
+
+def test_deleting_an_issue_updates_the_rollup(client, auth, project, monkeypatch):
+    monkeypatch.setattr(settings, "daily_stats_lag_seconds", 0)
+    ids = [client.post(f"/projects/{project}/issues", json={"title": f"i{k}"}, headers=auth).json()["id"] for k in range(3)]
+
+    def today_todo():
+        r = client.get(f"/projects/{project}/analytics/cumulative-flow", headers=auth)
+        assert r.status_code == 200, r.text
+        return r.json()["series"][-1]["todo"]
+
+    asyncio.run(run_rollup())
+    assert today_todo() == 3
+
+    r = client.delete(f"/projects/{project}/issues/{ids[0]}", headers=auth)
+    assert r.status_code == 200, r.text
+    asyncio.run(run_rollup())
+    assert today_todo() == 2
@@ -0,0 +1,87 @@
+from datetime import datetime, timedelta
+
+import numpy as np
+
+from app.services.issue_analytics_service import summarize
+
+SINCE = datetime(2026, 1, 1)
+UNTIL = datetime(2026, 1, 15)  # exclusive: two full weeks
+
+
+def _at(days, hours=0):
+    return (SINCE + timedelta(days=days, hours=hours) - datetime(1970, 1, 1)).total_seconds()
+
+
+def _columns(issues):
+    # (created, started or None, done) -> the float64 columns summarize() takes
+    created, started, done = zip(*issues)
+    return (
+        np.array(created, dtype=np.float64),
+        np.array([np.nan if s is None else s for s in started], dtype=np.float64),
+        np.array(done, dtype=np.float64),
+    )
+
+
+ISSUES = [
+    (_at(0), _at(0, 2), _at(0, 10)),  # lead 10h, cycle 8h, week 0
+    (_at(1), None, _at(1, 20)),  # lead 20h, never in progress, week 0
+    (_at(2), _at(3), _at(2, 6)),  # lead 6h, started after done: no cycle, week 0
+    (_at(7), _at(8), _at(8, 4)),  # lead 28h, cycle 4h, week 1
+    (_at(9), _at(9, 1), _at(9, 41)),  # lead 41h, cycle 40h, week 1
+    (_at(10), _at(11), _at(14, 24)),  # done exactly at `until`: outside the window
+    (_at(-5), _at(-4), _at(-1)),  # done before the window
+]
+
+
+def test_percentiles_and_weekly_throughput():
+    r = summarize(*_columns(ISSUES), SINCE, UNTIL, "week")
+
+    assert r["completed"] == 5
+    # lead hours 6, 10, 20, 28, 41 (linear interpolation between ranks)
+    assert r["lead_time_hours"] == {"p50": 20.0, "p75": 28.0, "p85": 33.2, "p95": 38.4, "mean": 21.0, "count": 5}
+    # cycle hours 4, 8, 40
+    assert r["cycle_time_hours"] == {"p50": 8.0, "p75": 24.0, "p85": 30.4, "p95": 36.8, "mean": 17.33, "count": 3}
+    assert r["throughput"] == [
+        {"start": SINCE.date(), "count": 3},
+        {"start": (SINCE + timedelta(days=7)).date(), "count": 2},
+    ]
+
+
+def test_daily_buckets_cover_the_whole_window():
+    r = summarize(*_columns(ISSUES), SINCE, UNTIL, "day")
+
+    counts = [b["count"] for b in r["throughput"]]
+    assert len(counts) == 14
+    assert counts[0] == 1 and counts[1] == 1 and counts[2] == 1 and counts[8] == 1 and counts[10] == 1
+    assert sum(counts) == 5
+
+
+def test_empty_window():
+    empty = np.empty(0, dtype=np.float64)
+    r = summarize(empty, empty, empty, SINCE, SINCE + timedelta(days=10), "week")
+
+    assert r["completed"] == 0
+    assert r["lead_time_hours"] is None and r["cycle_time_hours"] is None
+    # a partial last week still gets its bucket
+    assert [b["count"] for b in r["throughput"]] == [0, 0]
+
+
+def test_report_reads_the_stamps_written_by_patch_and_bulk(client, auth, project):
+    ids = [client.post(f"/projects/{project}/issues", json={"title": f"i{k}"}, headers=auth).json()["id"] for k in range(3)]
+
+    def patch(issue_id, status):
+        r = client.patch(f"/projects/{project}/issues/{issue_id}", json={"status": status}, headers=auth)
+        assert r.status_code == 200, r.text
+
+    patch(ids[0], "in_progress")
+    patch(ids[0], "done")
+    r = client.patch(f"/projects/{project}/issues/bulk", json={"issue_ids": ids[1:], "updates": {"status": "done"}}, headers=auth)
+    assert r.status_code == 200, r.text
+    patch(ids[2], "todo")  # reopened: not completed any more
+
+    r = client.get(f"/projects/{project}/analytics/cycle-time", headers=auth)
+    assert r.status_code == 200, r.text
+    body = r.json()
+    assert body["completed"] == 2
+    assert body["lead_time_hours"]["count"] == 2
+    assert body["cycle_time_hours"]["count"] == 1  # only ids[0] went through in_progress
@@ -0,0 +1,86 @@
+from sqlalchemy import event
+
+from app.db.session import async_engine
+
+
+def test_bulk_update_returns_updated_ids_and_keeps_stats(client, auth, project):
+    ids = [
+        client.post(f"/projects/{project}/issues", json={"title": f"b{k}"}, headers=auth).json()["id"]
+        for k in range(3)
+    ]
+
+    r = client.patch(
+        f"/projects/{project}/issues/bulk",
+        json={"issue_ids": ids[:2], "updates": {"status": "done", "priority": "high"}},
+        headers=auth,
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["updated"] == 2
+
+    issues = {i["id"]: i for i in client.get(f"/projects/{project}/issues", headers=auth).json()}
+    assert [issues[i]["status"] for i in ids] == ["done", "done", "todo"]
+
+    summary = client.get(f"/dashboard/projects/{project}", headers=auth).json()["summary"]
+    assert summary["by_status"]["done"] == 2
+    assert summary["by_priority"]["high"] == 2
+
+
+def test_bulk_update_by_filter(client, auth, project):
+    for k in range(2):
+        client.post(f"/projects/{project}/issues", json={"title": f"f{k}", "priority": "low"}, headers=auth)
+
+    r = client.patch(
+        f"/projects/{project}/issues/bulk",
+        json={"filter": {"priority": "low"}, "updates": {"status": "in_progress"}},
+        headers=auth,
+    )
+    assert r.status_code == 200, r.text
+    assert r.json()["updated"] == 2
+
+
+def test_bulk_update_rejects_null_for_required_fields(client, auth, project):
+    iid = client.post(f"/projects/{project}/issues", json={"title": "n"}, headers=auth).json()["id"]
+
+    for field in ("status", "priority", "type", "reporter_id"):
+        r = client.patch(
+            f"/projects/{project}/issues/bulk",
+            json={"issue_ids": [iid], "updates": {field: None}},
+            headers=auth,
+        )
+        assert r.status_code == 400, (field, r.text)
+        assert r.json()["detail"] == f"{field} cannot be null"
+
+    # nullable ones still clear
+    r = client.patch(
+        f"/projects/{project}/issues/bulk",
+        json={"issue_ids": [iid], "updates": {"assignee_id": None, "due_date": None}},
+        headers=auth,
+    )
+    assert r.status_code == 200, r.text
+
+
+def test_bulk_history_rows_go_in_one_statement(client, auth, project):
+    me = client.get("/auth/me", headers=auth).json()["id"]
+    ids = [client.post(f"/projects/{project}/issues", json={"title": f"h{k}"}, headers=auth).json()["id"] for k in range(6)]
+    for issue_id in ids[::2]:
+        client.patch(f"/projects/{project}/issues/{issue_id}", json={"assignee_id": me}, headers=auth)
+
+    inserts = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT INTO ISSUE_TRANSITIONS"):
+            inserts.append(statement)
+
+    # priority rows (from "medium") interleaved with assignee rows (from None)
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count)
+    try:
+        r = client.patch(
+            f"/projects/{project}/issues/bulk",
+            json={"issue_ids": ids, "updates": {"priority": "high", "assignee_id": me}},
+            headers=auth,
+        )
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count)
+
+    assert r.status_code == 200, r.text
+    assert len(inserts) == 1
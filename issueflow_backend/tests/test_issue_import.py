@@ -0,0 +1,32 @@
+import json
+
+from sqlalchemy import event
+
+from app.db.session import async_engine
+
+
+def test_mixed_rows_are_inserted_in_one_statement_per_batch(client, auth, project):
+    # some rows with a description / due date, some without
+    rows = [
+        {"title": f"i{k}", **({"description": "d"} if k % 2 else {}), **({"due_date": "2030-01-01"} if k % 3 else {})}
+        for k in range(60)
+    ]
+    inserts = []
+
+    def count(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT INTO ISSUE "):
+            inserts.append(statement)
+
+    event.listen(async_engine.sync_engine, "before_cursor_execute", count)
+    try:
+        r = client.post(
+            f"/projects/{project}/issues/import?format=ndjson",
+            content="".join(json.dumps(row) + "\n" for row in rows).encode(),
+            headers=auth,
+        )
+    finally:
+        event.remove(async_engine.sync_engine, "before_cursor_execute", count)
+
+    assert r.status_code == 200, r.text
+    assert r.json()["imported"] == 60
+    assert len(inserts) == 1
@@ -0,0 +1,20 @@
+from concurrent.futures import ThreadPoolExecutor
+
+CLIENTS = 50
+# 10,000 takes ~2 minutes on SQLite: that size runs as `python -m bench.issue_keys`
+ISSUES = 2_000
+
+
+def test_concurrent_creates_get_unique_consecutive_keys(client, auth, project):
+    # every create succeeds first time (no client retries) and, with no
+    # failed inserts, the numbers have no gaps either
+    def create(i):
+        r = client.post(f"/projects/{project}/issues", json={"title": f"issue {i}"}, headers=auth)
+        assert r.status_code == 200, r.text
+        return r.json()["key"]
+
+    with ThreadPoolExecutor(max_workers=CLIENTS) as pool:
+        keys = list(pool.map(create, range(ISSUES)))
+
+    numbers = sorted(int(k.rsplit("-", 1)[1]) for k in keys)
+    assert numbers == list(range(1, ISSUES + 1))
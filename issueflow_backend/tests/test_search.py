@@ -0,0 +1,36 @@
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _hits(client, auth, q):
+    r = client.get("/search", params={"q": q}, headers=auth)
+    assert r.status_code == 200, r.text
+    return r.json()["results"]
+
+
+def test_index_follows_creates_edits_and_deletes(client, auth, project):
+    word = f"zq{uuid.uuid4().hex[:8]}"
+    issue = client.post(f"/projects/{project}/issues", json={"title": f"{word} login"}, headers=auth).json()
+    r = client.post(f"/projects/{project}/issues/{issue['id']}/comments", json={"body": f"seen {word} too"}, headers=auth)
+    assert r.status_code == 200, r.text
+
+    assert sorted(h["type"] for h in _hits(client, auth, word)) == ["comment", "issue"]
+
+    r = client.patch(f"/projects/{project}/issues/{issue['id']}", json={"title": "renamed"}, headers=auth)
+    assert r.status_code == 200, r.text
+    hits = _hits(client, auth, word)
+    assert [h["type"] for h in hits] == ["comment"]
+    assert hits[0]["title"] == "renamed"  # comment hits show the issue's current title
+
+    client.delete(f"/projects/{project}/issues/{issue['id']}", headers=auth)
+    assert _hits(client, auth, word) == []
+
+
+def test_concurrent_searches_while_the_index_catches_up(client, auth, project):
+    word = f"zq{uuid.uuid4().hex[:8]}"
+    for k in range(20):
+        client.post(f"/projects/{project}/issues", json={"title": f"{word} {k}"}, headers=auth)
+
+    with ThreadPoolExecutor(max_workers=10) as pool:
+        counts = list(pool.map(lambda _: len(_hits(client, auth, word)), range(30)))
+    assert counts == [20] * 30
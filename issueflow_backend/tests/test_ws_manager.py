@@ -0,0 +1,78 @@
+import asyncio
+import json
+
+from app.websockets.manager import ConnectionManager
+
+ROOM = ("p1", "i1")
+
+
+class FakeSocket:
+    def __init__(self):
+        self.sent = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, frame):
+        self.sent.append(json.loads(frame))
+
+    async def close(self, code=1000):
+        pass
+
+
+def test_events_during_snapshot_are_held_then_deduped_by_cursor():
+    async def scenario():
+        manager = ConnectionManager(queue_size=10)
+        ws = FakeSocket()
+        await manager.connect(ROOM, ws, hold=True)
+
+        # published while the snapshot is being read
+        for event_id in ("5-0", "10-0", "10-1"):
+            await manager.broadcast(ROOM, {"type": "comment_created", "event_id": event_id})
+        await manager.broadcast(ROOM, {"type": "comment_created"})  # Redis down: no id
+
+        await manager.release(ROOM, ws, [{"type": "snapshot", "last_event_id": "10-0"}], "10-0")
+        await manager.broadcast(ROOM, {"type": "comment_deleted", "event_id": "11-0"})
+
+        await asyncio.sleep(0.05)  # let the writer drain the queue
+        await manager.disconnect_all(ws)
+        return ws.sent
+
+    sent = asyncio.run(scenario())
+    assert [(m["type"], m.get("event_id")) for m in sent] == [
+        ("snapshot", None),
+        ("comment_created", "10-1"),
+        ("comment_created", None),
+        ("comment_deleted", "11-0"),
+    ]
+
+
+class StalledSocket(FakeSocket):
+    def __init__(self):
+        super().__init__()
+        self.closed_with = None
+
+    async def send_text(self, frame):
+        await asyncio.Event().wait()  # never drains
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+def test_stalled_socket_is_evicted_once_and_the_task_is_tracked():
+    async def scenario():
+        manager = ConnectionManager(queue_size=1, slow_consumer_policy="evict")
+        stalled = StalledSocket()
+        await manager.connect(ROOM, stalled)
+
+        # no await in between: frame 0 fills the queue, 1..3 overflow
+        delivered = [await manager.broadcast(ROOM, {"type": "comment_created", "n": n}) for n in range(4)]
+        tracked = len(manager._evictions)  # one eviction however many overflows
+
+        await asyncio.sleep(0.05)
+        return delivered, tracked, len(manager._evictions), stalled.closed_with
+
+    delivered, tracked, left, closed_with = asyncio.run(scenario())
+    assert delivered == [1, 0, 0, 0]
+    assert tracked == 1 and left == 0
+    assert closed_with == 1013